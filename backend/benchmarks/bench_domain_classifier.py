@@ -0,0 +1,104 @@
+"""
+Benchmark domain classification: the per-keyword str.count loop (run over
+the whole text rather than its first 1000 characters) vs the single-pass
+DomainMatcher, on documents of increasing size. Also times scoring every
+sentence of a document as a span in one call vs classifying sentences one
+by one, and reports how often the two approaches pick the same domain
+(they differ where a keyword only occurs inside a longer word, e.g. "ai" in
+"Paris", which the matcher no longer counts). Fails if scoring spans in one
+call disagrees with classifying each span separately.
+
+Run from the backend directory:
+    python -m benchmarks.bench_domain_classifier
+"""
+import random
+import sys
+import time
+
+from services.core.claims.domain_classifier import DOMAIN_KEYWORDS, get_domain_matcher, ml_detect_domain
+from services.core.claims.sentence_segmenter import iter_sentences
+
+SIZES_KB = [10, 100, 1000, 5000]
+
+FILLER = [
+    "The report was published in {year} after a long review.",
+    "Officials said the results would be discussed at the next meeting.",
+    "Several groups raised questions about the methodology used.",
+    "The figures were revised twice before the final release.",
+]
+
+
+def make_document(kilobytes: int, rng: random.Random) -> str:
+    """Sections on a random domain each: topical sentences mixed with filler."""
+    target = kilobytes * 1024
+    parts, size = [], 0
+    while size < target:
+        domain = rng.choice(list(DOMAIN_KEYWORDS))
+        keywords = DOMAIN_KEYWORDS[domain]["keywords"]
+        for _ in range(rng.randint(5, 20)):
+            if rng.random() < 0.5:
+                sentence = f"The {rng.choice(keywords)} and the {rng.choice(keywords)} were examined in {rng.randint(1950, 2024)}."
+            else:
+                sentence = rng.choice(FILLER).format(year=rng.randint(1950, 2024))
+            parts.append(sentence)
+            size += len(sentence) + 1
+    return " ".join(parts)
+
+
+def detect_domain_per_keyword(text: str) -> tuple[str, float]:
+    """Reference implementation: one substring count per keyword, over the whole text."""
+    lowered = text.lower()
+    domain_scores = {}
+    for domain, config in DOMAIN_KEYWORDS.items():
+        score = 0.0
+        for keyword in config["keywords"]:
+            count = lowered.count(keyword.lower())
+            if count > 0:
+                score += config["weight"] * (1 + 0.5 * min(count, 3))
+        domain_scores[domain] = score
+
+    if max(domain_scores.values()) == 0:
+        return "general", 0.3
+    best_domain = max(domain_scores, key=domain_scores.get)
+    confidence = min(domain_scores[best_domain] / (len(DOMAIN_KEYWORDS[best_domain]["keywords"]) * 1.5), 1.0)
+    return best_domain, round(max(0.4, confidence), 2)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(7)
+    matcher = get_domain_matcher()
+    ml_detect_domain("warm up the compiled pattern")
+
+    print("Whole document")
+    print(f"{'size':>8} {'per-keyword loop':>18} {'single pass':>14} {'speedup':>9}")
+    for kilobytes in SIZES_KB:
+        text = make_document(kilobytes, rng)
+        _, loop_time = timed(detect_domain_per_keyword, text)
+        _, pass_time = timed(ml_detect_domain, text)
+        print(f"{kilobytes:>6}KB {loop_time * 1000:>16.1f}ms {pass_time * 1000:>12.1f}ms {loop_time / pass_time:>8.1f}x")
+
+    print("\nPer-sentence spans")
+    print(f"{'size':>8} {'sentences':>10} {'one by one':>12} {'one call':>10} {'speedup':>9} {'agreement':>10}")
+    for kilobytes in SIZES_KB[:3]:
+        text = make_document(kilobytes, rng)
+        sentences = list(iter_sentences(text))
+        spans = [(sentence.start, sentence.end) for sentence in sentences]
+
+        reference, loop_time = timed(lambda: [detect_domain_per_keyword(s.text) for s in sentences])
+        spanned, span_time = timed(matcher.classify_spans, text, spans)
+        agreement = sum(a[0] == b[0] for a, b in zip(reference, spanned)) / len(spans)
+        if spanned != [ml_detect_domain(text[start:end]) for start, end in spans]:
+            print(f"FAIL: span scoring differs from per-span classification at {kilobytes}KB")
+            sys.exit(1)
+        print(f"{kilobytes:>6}KB {len(spans):>10} {loop_time * 1000:>10.1f}ms {span_time * 1000:>8.1f}ms "
+              f"{loop_time / span_time:>8.1f}x {agreement:>9.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Encode latency, resident memory and accuracy of the embedding backends
+(fp32 torch, int8 dynamic-quantized torch, ONNX Runtime) for one domain's model.
+
+Each backend runs in a fresh process so its memory is measured in isolation.
+Accuracy is checked against fp32 on a fixed claim set: claim/snippet cosine
+scores and the final verdicts (same scoring code as verification) must match.
+Exits non-zero if any verdict flips or a cosine score drifts past the tolerance.
+
+Run from the backend directory (needs the embedding model; onnx needs optimum[onnxruntime]):
+    python -m benchmarks.bench_embedding_backends [domain] [backend ...]
+"""
+import multiprocessing
+import resource
+import sys
+import time
+
+import numpy as np
+
+from services.config.domain_loader import load_domain_config
+from services.core.verification.model_registry import (
+    EMBEDDING_BACKENDS,
+    load_embedding_model,
+    resolve_embedding_backend,
+    resolve_model_name,
+)
+
+REPEATS = 5
+
+# Largest acceptable |cosine(backend) - cosine(fp32)| for any claim/snippet pair
+COSINE_TOLERANCE = 0.02
+
+# Credibility used for every case, so verdicts depend on the embeddings only
+CREDIBILITY = 0.8
+
+# (claim, search snippets)
+CASES = [
+    ("The Eiffel Tower is located in Paris.", [
+        "The Eiffel Tower is a wrought-iron lattice tower on the Champ de Mars in Paris, France.",
+        "Constructed from 1887 to 1889, the tower was the entrance arch to the 1889 World's Fair.",
+        "Paris is home to many landmarks, including the Eiffel Tower and the Louvre.",
+    ]),
+    ("Water boils at 100 degrees Celsius at sea level.", [
+        "At standard atmospheric pressure, pure water boils at 100 °C (212 °F).",
+        "The boiling point of water decreases as altitude increases.",
+    ]),
+    ("The Great Wall of China is visible from the Moon with the naked eye.", [
+        "Astronauts have confirmed the Great Wall is not visible to the naked eye from the Moon.",
+        "The myth that the wall can be seen from space has been widely debunked.",
+        "The Great Wall stretches thousands of kilometres across northern China.",
+    ]),
+    ("Albert Einstein won the Nobel Prize in Physics in 1921.", [
+        "Einstein received the 1921 Nobel Prize in Physics for his explanation of the photoelectric effect.",
+        "The prize was announced in 1922 because the committee deferred the 1921 award.",
+    ]),
+    ("The Amazon River flows into the Pacific Ocean.", [
+        "The Amazon River discharges into the Atlantic Ocean on the northeastern coast of Brazil.",
+        "It is the largest river in the world by discharge volume.",
+        "Its basin covers much of South America.",
+    ]),
+    ("Python was first released in 1991.", [
+        "Guido van Rossum released the first version of Python, 0.9.0, in February 1991.",
+        "Python 2.0 was released in 2000 and Python 3.0 in 2008.",
+    ]),
+    ("Bananas are a good source of potassium.", [
+        "A medium banana contains about 420 mg of potassium.",
+        "Potassium helps regulate fluid balance and nerve signals.",
+    ]),
+    ("The stock market closed at an all-time high every day last year.", [
+        "Major indices reached several record closes during the year but also saw declines.",
+        "Market volatility increased in the second half of the year.",
+    ]),
+    ("Aspirin reduces the risk of heart attack in some high-risk patients.", [
+        "Low-dose aspirin is recommended for secondary prevention of myocardial infarction.",
+        "Guidelines advise against routine aspirin use for primary prevention in older adults.",
+        "Aspirin inhibits platelet aggregation by blocking cyclooxygenase.",
+    ]),
+    ("Metformin is a first-line medication for type 2 diabetes.", [
+        "Metformin is recommended as the initial pharmacologic treatment for type 2 diabetes.",
+        "It lowers hepatic glucose production and improves insulin sensitivity.",
+    ]),
+    ("Antibiotics are effective against viral infections such as influenza.", [
+        "Antibiotics do not work against viruses, including those that cause the flu.",
+        "Antiviral drugs such as oseltamivir can treat influenza.",
+        "Overuse of antibiotics contributes to antimicrobial resistance.",
+    ]),
+    ("The human heart has four chambers.", [
+        "The heart has two atria and two ventricles.",
+        "Blood flows from the right ventricle to the lungs through the pulmonary artery.",
+    ]),
+]
+
+
+def _rss_mb() -> float:
+    """Current resident set size, falling back to the peak where /proc is unavailable."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _measure(model_name: str, backend: str, onnx_file_name: str | None, texts: list[str]) -> dict:
+    """Load one backend and encode texts; runs in a child process."""
+    baseline_rss = _rss_mb()
+    model = load_embedding_model(model_name, backend, onnx_file_name)
+    encode_kwargs = {"convert_to_numpy": True, "normalize_embeddings": True, "show_progress_bar": False, "batch_size": 32}
+    model.encode(texts[:4], **encode_kwargs)  # warm up
+
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        embeddings = model.encode(texts, **encode_kwargs)
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "embeddings": np.asarray(embeddings, dtype=np.float32),
+        "latency_ms": sorted(timings)[len(timings) // 2] * 1000,
+        "rss_mb": _rss_mb() - baseline_rss,
+    }
+
+
+def _verdicts(embeddings: np.ndarray, domain: str, domain_cfg: dict) -> tuple[list[np.ndarray], list[tuple[float, str]]]:
+    """Per-case claim/snippet cosine scores and (final_score, status), as verification computes them."""
+    from services.core.verification.evidence import ClaimEvidence
+    from services.core.verification.contradiction import detect_contradiction
+    from services.core.scoring.verdict import compute_verdict
+
+    cosines, verdicts = [], []
+    offset = 0
+    for claim, snippets in CASES:
+        count = 1 + len(snippets)
+        evidence = ClaimEvidence(claim, snippets, embeddings[offset:offset + count])
+        offset += count
+
+        contradicted = detect_contradiction(
+            snippets, domain, domain_cfg.get("contradiction_threshold", 0.35), evidence=evidence
+        )
+        cosines.append(evidence.snippet_embeddings @ evidence.claim_embedding)
+        verdicts.append(compute_verdict(evidence.similarity(), CREDIBILITY, len(snippets), contradicted, domain_cfg))
+    return cosines, verdicts
+
+
+def main():
+    domain = sys.argv[1] if len(sys.argv) > 1 else "general"
+    backends = sys.argv[2:] or list(EMBEDDING_BACKENDS)
+    model_name = resolve_model_name(domain)
+    configured_backend, onnx_file_name = resolve_embedding_backend(domain)
+    domain_cfg = load_domain_config(domain)
+    texts = [text for claim, snippets in CASES for text in [claim] + snippets]
+
+    print(f"domain={domain} model={model_name} configured_backend={configured_backend} texts={len(texts)}")
+    context = multiprocessing.get_context("spawn")
+    measurements = {}
+    for backend in ["torch"] + [b for b in backends if b != "torch"]:
+        with context.Pool(1) as pool:
+            try:
+                measurements[backend] = pool.apply(_measure, (model_name, backend, onnx_file_name, texts))
+            except Exception as e:
+                print(f"{backend:>6}: failed to load ({e})")
+
+    if "torch" not in measurements:
+        sys.exit(1)
+
+    reference_cosines, reference_verdicts = _verdicts(measurements["torch"]["embeddings"], domain, domain_cfg)
+    reference = measurements["torch"]
+    failed = False
+
+    print(f"{'backend':>8} {'encode ms':>10} {'speedup':>8} {'rss MB':>8} {'max dcos':>9} {'mean dcos':>10} {'verdicts':>9}")
+    for backend, measured in measurements.items():
+        cosines, verdicts = _verdicts(measured["embeddings"], domain, domain_cfg)
+        deltas = np.concatenate([np.abs(a - b) for a, b in zip(cosines, reference_cosines)])
+        matching = sum(
+            status == reference_status
+            for (_, status), (_, reference_status) in zip(verdicts, reference_verdicts)
+        )
+        failed |= matching < len(CASES) or deltas.max() > COSINE_TOLERANCE
+        print(
+            f"{backend:>8} {measured['latency_ms']:>10.1f} "
+            f"{reference['latency_ms'] / measured['latency_ms']:>7.2f}x {measured['rss_mb']:>8.0f} "
+            f"{deltas.max():>9.4f} {deltas.mean():>10.4f} {matching:>4}/{len(CASES):<4}"
+        )
+
+    if failed:
+        print(f"FAIL: a verdict changed or a cosine score moved by more than {COSINE_TOLERANCE}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark claim extraction: per-sentence sentiment filtering vs the
+batched path used by extract_claims. Also checks both produce the same claims.
+
+Run from the backend directory (downloads the sentiment model on first run):
+    python -m benchmarks.bench_extraction
+"""
+import random
+import time
+
+from services.core.claims.extractor import extract_claims, _passes_lexical_rules, NON_FACTUAL_REASONS
+from services.core.claims.sentence_segmenter import smart_sentence_segment
+from services.core.claims.sentiment_analyzer import is_factual_claim
+
+SIZES = [50, 300, 1000]
+
+TEMPLATES = [
+    "The {noun} was first described by researchers in {year} according to published records.",
+    "Global {noun} production increased by {pct} percent between {year} and {year2}.",
+    "I think the {noun} is probably overrated by most people.",
+    "What does the {noun} actually do in practice?",
+    "The central bank reported that {noun} reserves decreased in {year}.",
+    "We absolutely love the new {noun} and we are so excited about it!",
+    "Studies indicate that {noun} exposure affects roughly {pct} percent of adults.",
+]
+NOUNS = ["vaccine", "semiconductor", "bond market", "statute", "protein", "reactor", "algorithm"]
+
+
+def make_document(sentences: int, rng: random.Random) -> str:
+    parts = []
+    for _ in range(sentences):
+        year = rng.randint(1950, 2020)
+        parts.append(rng.choice(TEMPLATES).format(
+            noun=rng.choice(NOUNS),
+            year=year,
+            year2=year + rng.randint(1, 5),
+            pct=rng.randint(2, 90),
+        ))
+    return " ".join(parts)
+
+
+def extract_claims_per_sentence(text: str) -> list[str]:
+    """Reference implementation: one sentiment forward pass per sentence."""
+    claims = []
+    for sentence in smart_sentence_segment(text):
+        cleaned = sentence.strip()
+        if not _passes_lexical_rules(cleaned):
+            continue
+        is_factual, reason = is_factual_claim(cleaned)
+        if not is_factual and reason in NON_FACTUAL_REASONS:
+            continue
+        claims.append(cleaned)
+    return claims
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(0)
+    # Warm up model loading so it isn't counted
+    extract_claims(make_document(5, rng))
+
+    print(f"{'sentences':>10} {'per-sentence (s)':>17} {'batched (s)':>12} {'speedup':>8} {'identical':>10}")
+    for size in SIZES:
+        text = make_document(size, rng)
+        reference, reference_time = timed(extract_claims_per_sentence, text)
+        batched, batched_time = timed(extract_claims, text)
+        print(
+            f"{size:>10} {reference_time:>17.2f} {batched_time:>12.2f} "
+            f"{reference_time / max(batched_time, 1e-9):>7.1f}x {str(reference == batched):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
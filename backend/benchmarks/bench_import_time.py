@@ -0,0 +1,75 @@
+"""
+Cold import time of the API app, from `python -X importtime`.
+Imports the module in a fresh interpreter, then reports the wall time, the
+total import time and the slowest top-level packages (cumulative, inclusive
+of everything they import). Fails if a heavy ML or client package is
+imported at startup.
+
+Run from the backend directory; compare against another revision by
+running it there too (e.g. in a `git worktree`):
+    python -m benchmarks.bench_import_time [module] [runs]
+"""
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+# Imported lazily, on first use or during warmup, never by the app module itself
+HEAVY_PACKAGES = ("torch", "transformers", "sentence_transformers", "tavily", "pdfplumber", "docx", "bs4")
+
+TOP = 15
+
+
+def import_once(module: str) -> tuple[float, list[tuple[int, int, str]]]:
+    """Return (wall seconds, [(self_us, cumulative_us, name)]) for one cold import."""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    wall = time.perf_counter() - start
+    if completed.returncode != 0:
+        sys.stderr.write(completed.stderr[-2000:])
+        raise SystemExit(f"import {module} failed")
+
+    entries = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        entries.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return wall, entries
+
+
+def main():
+    module = sys.argv[1] if len(sys.argv) > 1 else "services.api.main"
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    results = [import_once(module) for _ in range(runs)]
+    wall, entries = min(results, key=lambda result: result[0])
+
+    by_package = defaultdict(int)
+    for _, cumulative_us, name in entries:
+        # Top-level entries only (no indentation): cumulative time per root package
+        if not name.startswith(" "):
+            by_package[name.split(".")[0].strip()] += cumulative_us
+    total_us = sum(by_package.values())
+
+    print(f"import {module}: wall {wall * 1000:.0f} ms (best of {runs}), import time {total_us / 1000:.0f} ms, {len(entries)} modules")
+    print(f"{'package':<28} {'cumulative ms':>14}")
+    for package, cumulative_us in sorted(by_package.items(), key=lambda item: -item[1])[:TOP]:
+        print(f"{package:<28} {cumulative_us / 1000:>14.1f}")
+
+    imported = {name.strip().split(".")[0] for _, _, name in entries}
+    heavy = [package for package in HEAVY_PACKAGES if package in imported]
+    if heavy:
+        print(f"FAIL: heavy packages imported at startup: {', '.join(heavy)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Throughput of the forked inference worker pool as workers scale from 1 to N.
+Sends batched encode calls from concurrent threads and reports texts/second.
+
+Run from the backend directory (needs the embedding model):
+    python -m benchmarks.bench_inference_pool [max_workers]
+"""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from services.core.inference.worker_pool import InferenceWorkerPool
+
+BATCH_SIZE = 32
+BATCHES = 64
+DOMAIN = "general"
+
+SENTENCE = "The committee published its annual report on regional water quality in {}."
+
+
+def run(workers: int) -> float:
+    pool = InferenceWorkerPool(workers, torch_threads=max(1, (os.cpu_count() or 1) // workers))
+    pool.start(preload_domains=[DOMAIN])
+    try:
+        batches = [[SENTENCE.format(1900 + b * BATCH_SIZE + i) for i in range(BATCH_SIZE)] for b in range(BATCHES)]
+        pool.encode(DOMAIN, batches[0])  # warm up every code path once
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers * 2) as executor:
+            list(executor.map(lambda texts: pool.encode(DOMAIN, texts, show_progress_bar=False), batches))
+        elapsed = time.perf_counter() - start
+    finally:
+        pool.stop()
+    return BATCHES * BATCH_SIZE / elapsed
+
+
+def main():
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    counts = sorted({1, 2, 4, 8, 16, 32, max_workers})
+    counts = [count for count in counts if count <= max_workers]
+
+    baseline = None
+    print(f"{'workers':>8} {'texts/s':>10} {'scaling':>8}")
+    for workers in counts:
+        throughput = run(workers)
+        baseline = baseline or throughput
+        print(f"{workers:>8} {throughput:>10.1f} {throughput / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Microbenchmark for the semantic search-cache embedding index.
+Measures lookup cost as the number of cached claims grows.
+
+Run from the backend directory:
+    python -m benchmarks.bench_search_cache
+"""
+import time
+
+import numpy as np
+
+from services.core.verification.embedding_index import EmbeddingIndex
+
+SIZES = [10, 100, 1_000, 10_000, 50_000]
+DIM = 384  # all-MiniLM-L6-v2 embedding size
+LOOKUPS = 200
+
+
+def bench_lookup(size: int, rng: np.random.Generator) -> float:
+    """Return mean lookup time in microseconds for an index of the given size."""
+    index = EmbeddingIndex()
+    index.add_many(list(range(size)), rng.standard_normal((size, DIM)).astype(np.float32))
+
+    # Churn some entries so lookups also exercise freed slots
+    for key in range(0, size, 10):
+        index.remove(key)
+        index.add(key, rng.standard_normal(DIM).astype(np.float32))
+
+    queries = rng.standard_normal((LOOKUPS, DIM)).astype(np.float32)
+    start = time.perf_counter()
+    for query in queries:
+        index.search(query)
+    elapsed = time.perf_counter() - start
+    return elapsed / LOOKUPS * 1e6
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'entries':>10} {'lookup (us)':>12}")
+    for size in SIZES:
+        print(f"{size:>10} {bench_lookup(size, rng):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
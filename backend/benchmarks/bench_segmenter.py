@@ -0,0 +1,130 @@
+"""
+Sentence segmentation throughput on ~1 MB documents, plus a golden-set
+check of the segmentation rules (exits non-zero on any mismatch).
+
+Reports total time, MB/s, sentence count and time to the first sentence
+(iter_sentences is lazy) for plain prose and for URL/email-heavy text.
+
+Run from the backend directory:
+    python -m benchmarks.bench_segmenter [megabytes]
+"""
+import random
+import sys
+import time
+
+from services.core.claims.sentence_segmenter import iter_sentences, smart_sentence_segment
+
+# (text, expected sentences) under the segmentation rules
+GOLDEN = [
+    ("The Earth orbits the Sun. It takes about 365 days to complete one orbit.",
+     ["The Earth orbits the Sun.", "It takes about 365 days to complete one orbit."]),
+    ("Dr. Smith works at the hospital. She treats many patients every day.",
+     ["Dr. Smith works at the hospital.", "She treats many patients every day."]),
+    ("The value of pi is approximately 3.14 and it is irrational. Mathematicians have studied it for centuries.",
+     ["The value of pi is approximately 3.14 and it is irrational.", "Mathematicians have studied it for centuries."]),
+    ("NASA launched the mission in 1969. The crew landed on the Moon.",
+     ["NASA launched the mission in 1969.", "The crew landed on the Moon."]),
+    ("The company grew quickly. 2020 was its best year on record.",
+     ["The company grew quickly.", "2020 was its best year on record."]),
+    ("Is this true? Nobody really knows the answer to that question! Scientists keep studying it.",
+     ["Is this true?", "Nobody really knows the answer to that question!", "Scientists keep studying it."]),
+    ("Prices rose by 4.5% last year. Analysts expected a smaller increase overall.",
+     ["Prices rose by 4.5% last year.", "Analysts expected a smaller increase overall."]),
+    ("He met Mr. Jones at the station. They talked about the weather for an hour.",
+     ["He met Mr. Jones at the station.", "They talked about the weather for an hour."]),
+    # All-caps next word (acronym) does not start a new sentence
+    ("The U.S. economy expanded. GDP grew faster than expected in the third quarter.",
+     ["The U.S. economy expanded. GDP grew faster than expected in the third quarter."]),
+    # Short fragments merge into the previous sentence; short leading ones are dropped
+    ("Hi. Yo. This sentence is long enough to be kept.",
+     ["This sentence is long enough to be kept."]),
+    ("The meeting ended early. Ok. Everyone went home after the announcement.",
+     ["The meeting ended early. Ok.", "Everyone went home after the announcement."]),
+    ("Multiple   spaces\tand\nnewlines are    collapsed. The second sentence follows here.",
+     ["Multiple spaces and newlines are collapsed.", "The second sentence follows here."]),
+    ("The study was published in the 21st. century journal. Researchers cited it widely.",
+     ["The study was published in the 21st. century journal.", "Researchers cited it widely."]),
+    # URLs and emails (including a trailing dot) never end a sentence
+    ("Visit https://example.com/page. The site is great for everyone.",
+     ["Visit https://example.com/page. The site is great for everyone."]),
+    ("Contact me at john.doe@example.com. Then we talk about everything.",
+     ["Contact me at john.doe@example.com. Then we talk about everything."]),
+    # Every URL is kept intact, in any sentence
+    ("First sentence here. See https://a.com/x and https://b.org/y. Another sentence here.",
+     ["First sentence here.", "See https://a.com/x and https://b.org/y. Another sentence here."]),
+    ("Version 2.0. Was released in March with many new features.",
+     ["Version 2.0. Was released in March with many new features."]),
+    ("The reactor produced power for 40 years. it was decommissioned in 2010. The site is now a museum.",
+     ["The reactor produced power for 40 years. it was decommissioned in 2010.", "The site is now a museum."]),
+    ("short.", []),
+    ("", []),
+]
+
+PROSE = [
+    "The committee published its annual report on regional water quality in {year}.",
+    "Dr. Alvarez noted that nitrate levels rose by {pct}.{digit} percent over the period.",
+    "Is the trend likely to continue?",
+    "NASA and the U.S. Geological Survey shared satellite data with the team.",
+    "{year} was the wettest year since records began!",
+    "Samples were collected at {pct} sites, e.g. rivers, lakes and wells.",
+]
+LINKS = [
+    "The dataset is available at https://data.example.org/water/{year}/report.csv.",
+    "Questions can be sent to water-team{pct}@example.org.",
+    "See also https://example.com/a?id={pct}&year={year}. It lists every site.",
+]
+
+
+def make_document(megabytes: float, templates: list[str], rng: random.Random) -> str:
+    target = int(megabytes * 1024 * 1024)
+    parts, size = [], 0
+    while size < target:
+        sentence = rng.choice(templates).format(year=rng.randint(1950, 2024), pct=rng.randint(2, 99), digit=rng.randint(0, 9))
+        # Mix in paragraph breaks and irregular spacing like extracted PDF text
+        separator = rng.choice([" ", " ", " ", "\n", "  ", "\n\n"])
+        parts.append(sentence + separator)
+        size += len(sentence) + len(separator)
+    return "".join(parts)
+
+
+def check_golden() -> bool:
+    ok = True
+    for text, expected in GOLDEN:
+        actual = smart_sentence_segment(text)
+        if actual != expected:
+            ok = False
+            print(f"MISMATCH {text!r}\n  expected {expected}\n  actual   {actual}")
+        for sentence in iter_sentences(text):
+            # Offsets point at the sentence in the source (modulo collapsed whitespace)
+            if " ".join(text[sentence.start:sentence.end].split()) != sentence.text:
+                ok = False
+                print(f"BAD OFFSETS {sentence} in {text!r}")
+    print(f"golden set: {len(GOLDEN)} cases, {'ok' if ok else 'FAILED'}")
+    return ok
+
+
+def bench(name: str, text: str):
+    start = time.perf_counter()
+    sentences = iter_sentences(text)
+    next(sentences)
+    first = time.perf_counter() - start
+    count = 1 + sum(1 for _ in sentences)
+    elapsed = time.perf_counter() - start
+
+    megabytes = len(text) / 1024 / 1024
+    print(f"{name:<8} {megabytes:>6.2f} MB {count:>8} sentences {elapsed * 1000:>9.1f} ms "
+          f"{megabytes / elapsed:>7.2f} MB/s  first sentence after {first * 1e6:.0f} us")
+
+
+def main():
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    if not check_golden():
+        sys.exit(1)
+
+    rng = random.Random(42)
+    bench("prose", make_document(megabytes, PROSE, rng))
+    bench("links", make_document(megabytes, PROSE + LINKS * 2, rng))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Time-to-first-verdict for the streaming endpoint vs the buffered pipeline.
+Needs TAVILY_API_KEY and the models; uses fresh claims so caches don't hide latency.
+
+Run from the backend directory:
+    python -m benchmarks.bench_streaming [path/to/document.txt]
+"""
+import asyncio
+import sys
+import time
+import uuid
+
+from services.api.routers.verify import run_verification_async, verification_event_stream
+from services.storage.cache import clear_cache
+from services.core.verification.search_cache import clear_search_cache
+
+SAMPLE_TEXT = (
+    "The Eiffel Tower was completed in 1889 for the World's Fair in Paris. "
+    "Water boils at 100 degrees Celsius at sea level under standard pressure. "
+    "The human genome contains approximately three billion base pairs of DNA. "
+    "Mount Everest is the highest mountain above sea level on Earth. "
+    "The Federal Reserve raised interest rates several times during 2022 to fight inflation. "
+    "Penicillin was discovered by Alexander Fleming in 1928 at St Mary's Hospital. "
+    "The Great Wall of China is visible from the Moon with the naked eye. "
+    "Python was first released by Guido van Rossum in 1991 as a general-purpose language. "
+)
+
+
+async def bench_stream(text: str) -> tuple[float | None, float]:
+    start = time.perf_counter()
+    first_verdict = None
+    async for event in verification_event_stream(text, str(uuid.uuid4())):
+        if event["event"] == "claim" and first_verdict is None:
+            first_verdict = time.perf_counter() - start
+    return first_verdict, time.perf_counter() - start
+
+
+async def bench_buffered(text: str) -> float:
+    start = time.perf_counter()
+    await run_verification_async(text, str(uuid.uuid4()), "general")
+    return time.perf_counter() - start
+
+
+def reset_caches():
+    clear_cache()
+    clear_search_cache()
+
+
+async def main():
+    text = open(sys.argv[1], encoding="utf-8").read() if len(sys.argv) > 1 else SAMPLE_TEXT
+
+    reset_caches()
+    buffered_total = await bench_buffered(text)
+    reset_caches()
+    first_verdict, stream_total = await bench_stream(text)
+
+    print(f"buffered: first verdict after {buffered_total:.2f}s (returned with the full response)")
+    if first_verdict is None:
+        print(f"stream:   no claims found, finished in {stream_total:.2f}s")
+    else:
+        print(f"stream:   first verdict after {first_verdict:.2f}s, all events after {stream_total:.2f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
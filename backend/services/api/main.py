@@ -5,12 +5,39 @@ from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from services.api.routers.verify import router as verify_router
 from services.api.routers.progress import router as progress_router
+from services.core.verification.embedding_service import get_embedding_metrics
+from services.core.verification.tavily_async import close_async_tavily_client
+from services.core.verification.single_flight import get_verification_flights
+from services.core.verification.scheduler import get_scheduler_metrics
+from services.core.utils.executors import get_executor_metrics, shutdown_executors
+from services.core.inference.worker_pool import start_inference_pool, stop_inference_pool, get_inference_metrics
+from services.core.inference.model_manager import get_model_metrics
+from services.core.utils.warmup import start_warmup, get_readiness
+from contextlib import asynccontextmanager
 import os
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks."""
+    # Fork inference workers (if enabled) before any other threads start
+    start_inference_pool()
+    # Load domain configs and models in the background; /ready reports progress
+    warmup_task = start_warmup()
+    yield
+    if warmup_task is not None:
+        warmup_task.cancel()
+    stop_inference_pool()
+    # Close pooled connections and stage executors
+    await close_async_tavily_client()
+    shutdown_executors()
+
+
 app = FastAPI(
     title="AI Verification Service",
     description="Universal AI Hallucination & Citation Verification System",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS Configuration - MUST be configured before adding routers
@@ -60,10 +87,14 @@ def root():
             "docs": "/docs",
             "redoc": "/redoc",
             "health": "/health",
+            "ready": "/ready",
+            "metrics": "/metrics",
             "verify_text": "/verify/text",
+            "verify_text_stream": "/verify/text/stream",
             "verify_url": "/verify/url",
             "verify_file": "/verify/file",
             "verify_batch": "/verify/batch",
+            "claim_explanation": "/verify/explanations/{task_id}/{claim_index}",
             "progress": "/progress/{task_id}",
             "progress_stream": "/progress/stream/{task_id}"
         }
@@ -76,6 +107,35 @@ def health():
     return {"status": "ok", "service": "AI Verification Service"}
 
 
+@app.get("/ready")
+def ready():
+    """
+    Readiness check with per-component load state.
+    503 until warmup finishes and required configuration is present.
+    """
+    is_ready, report = get_readiness().report()
+    if not is_ready:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=report)
+    return report
+
+
+@app.get("/metrics")
+def metrics():
+    """Runtime metrics for the inference pipeline."""
+    flights = get_verification_flights()
+    return {
+        "embedding": get_embedding_metrics(),
+        "verification": {
+            "in_flight": flights.in_flight(),
+            "coalesced": flights.coalesced
+        },
+        "scheduler": get_scheduler_metrics(),
+        "executors": get_executor_metrics(),
+        "inference": get_inference_metrics(),
+        "models": get_model_metrics()
+    }
+
+
 @app.get("/cors-test")
 def cors_test():
     """Test endpoint to verify CORS is working."""
@@ -100,10 +160,14 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
                     "docs": "/docs",
                     "redoc": "/redoc",
                     "health": "/health",
+                    "ready": "/ready",
+                    "metrics": "/metrics",
                     "verify_text": "POST /verify/text",
+                    "verify_text_stream": "POST /verify/text/stream",
                     "verify_url": "POST /verify/url",
                     "verify_file": "POST /verify/file",
                     "verify_batch": "POST /verify/batch",
+                    "claim_explanation": "GET /verify/explanations/{task_id}/{claim_index}",
                     "progress": "GET /progress/{task_id}",
                     "progress_stream": "GET /progress/stream/{task_id}"
                 }
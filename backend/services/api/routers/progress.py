@@ -3,9 +3,10 @@ Progress tracking endpoint using Server-Sent Events (SSE).
 """
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
-import asyncio
 import json
 import logging
+from services.config.settings import PROGRESS_HEARTBEAT_SECONDS
+from services.storage.progress_store import get_progress_store
 
 logger = logging.getLogger(__name__)
 
@@ -17,50 +18,47 @@ except ImportError:
     logger.warning("sse-starlette not available, using fallback")
 router = APIRouter(prefix="/progress", tags=["Progress"])
 
-# In-memory progress store (in production, use Redis or similar)
-_progress_store = {}
-
 def update_progress(task_id: str, completed: int, total: int, current: str, status: str = "processing"):
     """Update progress for a task."""
-    _progress_store[task_id] = {
+    get_progress_store().update(task_id, {
         "completed": completed,
         "total": total,
         "current": current,
         "status": status,
         "percentage": (completed / total * 100) if total > 0 else 0
-    }
+    })
 
 def get_progress(task_id: str):
     """Get current progress for a task."""
-    return _progress_store.get(task_id, {
-        "completed": 0,
-        "total": 0,
-        "current": "",
-        "status": "pending",
-        "percentage": 0
-    })
+    return get_progress_store().get(task_id)
+
+async def progress_events(task_id: str):
+    """
+    Yield (event, progress) pairs: "progress" on each real change,
+    "heartbeat" while idle, and "done" once the task finishes.
+    """
+    last_sent = None
+    async for progress in get_progress_store().subscribe(task_id, PROGRESS_HEARTBEAT_SECONDS):
+        if progress is None:
+            yield "heartbeat", last_sent
+            continue
+        if progress == last_sent:
+            continue
+        last_sent = progress
+        yield "progress", progress
+        
+        # If completed, send final event and stop
+        if progress["status"] in ["completed", "error"]:
+            yield "done", progress
+            break
 
 async def progress_stream(task_id: str):
     """Stream progress updates via SSE."""
-    while True:
-        progress = get_progress(task_id)
-        
-        # Send progress update
-        data = json.dumps(progress)
+    async for event, progress in progress_events(task_id):
         yield {
-            "event": "progress",
-            "data": data
+            "event": event,
+            "data": json.dumps(progress if event != "heartbeat" else {})
         }
-        
-        # If completed, send final event and break
-        if progress["status"] in ["completed", "error"]:
-            yield {
-                "event": "done",
-                "data": data
-            }
-            break
-        
-        await asyncio.sleep(0.5)  # Update every 500ms
 
 @router.get("/stream/{task_id}")
 async def stream_progress(task_id: str):
@@ -68,14 +66,13 @@ async def stream_progress(task_id: str):
     if SSE_AVAILABLE:
         return EventSourceResponse(progress_stream(task_id))
     else:
-        # Fallback: return JSON polling endpoint
+        # Fallback: plain text/event-stream
         async def generate():
-            while True:
-                progress = get_progress(task_id)
-                yield f"data: {json.dumps(progress)}\n\n"
-                if progress["status"] in ["completed", "error"]:
-                    break
-                await asyncio.sleep(0.5)
+            async for event, progress in progress_events(task_id):
+                if event == "heartbeat":
+                    yield ": heartbeat\n\n"
+                elif event == "progress":
+                    yield f"data: {json.dumps(progress)}\n\n"
         
         return StreamingResponse(
             generate(),
@@ -1,36 +1,67 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, HttpUrl
 import tempfile
 import shutil
 import os
+import json
 import logging
+import time
 import uuid
 import asyncio
 
 from services.core.claims.domain_detector import detect_domain
-from services.core.claims.extractor import extract_claims
-from services.core.verification.verify_async import verify_claims_batch, verify_claim_async
+from services.core.claims.extractor import stream_claim_batches
+from services.core.verification.verify_async import ClaimFeed, verify_claims_batch, verify_claims_stream
+from services.core.verification.claim_clusters import clustering_summary
+from services.core.verification.verify import ExplanationMode, add_deterministic_explanations, explain_deferred
+from services.core.verification.single_flight import SingleFlight
+from services.core.llm.reasoner import EXPLANATION_BATCH_SIZE
+from services.core.utils.executors import run_in_stage, IO_STAGE, CPU_STAGE
 from services.core.verification.citation_verifier import verify_citations_async
 from services.core.scoring.aggregation import calculate_overall_score
 from services.core.explainability.traces import extract_citations
 from services.core.input.normalize import normalize_input
-from services.api.routers.progress import update_progress
+from services.api.routers.progress import update_progress, SSE_AVAILABLE
+from services.storage.task_results import get_task_result_store
+from services.config.settings import DEFAULT_EXPLANATION_MODE, missing_required_settings
+
+if SSE_AVAILABLE:
+    from sse_starlette.sse import EventSourceResponse
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/verify", tags=["Verification"])
+
+
+def require_settings():
+    """
+    Refuse verification while required settings are missing: without web
+    search every claim would look unsupported, and those verdicts would be cached.
+    """
+    missing = missing_required_settings()
+    if missing:
+        raise HTTPException(status_code=503, detail=f"Verification unavailable, missing settings: {', '.join(missing)}")
+
+
+router = APIRouter(prefix="/verify", tags=["Verification"], dependencies=[Depends(require_settings)])
+
+# Concurrent requests for the same deferred explanation share one generation
+_EXPLANATION_FLIGHTS = SingleFlight()
 
 
 class TextInput(BaseModel):
     text: str
+    explanations: ExplanationMode = DEFAULT_EXPLANATION_MODE
 
 
 class UrlInput(BaseModel):
     url: HttpUrl | str
+    explanations: ExplanationMode = DEFAULT_EXPLANATION_MODE
 
 
 class BatchInput(BaseModel):
     text: str | None = None
     urls: list[HttpUrl | str] | None = None
+    explanations: ExplanationMode = DEFAULT_EXPLANATION_MODE
 
 
 @router.post("/text/async")
@@ -41,7 +72,7 @@ async def verify_text_async(data: TextInput):
         normalized_text = data.text
         
         # Start verification in background
-        asyncio.create_task(run_verification_async(normalized_text, task_id, "text"))
+        asyncio.create_task(run_verification_async(normalized_text, task_id, "text", data.explanations))
         
         return {"task_id": task_id, "status": "started"}
     except Exception as e:
@@ -49,7 +80,12 @@ async def verify_text_async(data: TextInput):
         raise HTTPException(status_code=400, detail=f"Invalid text input: {str(e)}")
 
 
-async def run_verification_async(normalized_text: str, task_id: str = None, input_type: str = "general"):
+async def run_verification_async(
+    normalized_text: str,
+    task_id: str = None,
+    input_type: str = "general",
+    explanations: ExplanationMode = DEFAULT_EXPLANATION_MODE
+):
     """
     Run the complete verification pipeline asynchronously with REAL progress tracking.
     
@@ -57,6 +93,7 @@ async def run_verification_async(normalized_text: str, task_id: str = None, inpu
         normalized_text: The text to verify
         task_id: Task ID for progress tracking
         input_type: Type of input ("text", "url", "file", "general")
+        explanations: "llm", "deterministic" or "deferred" (see ExplanationMode)
     """
     if not normalized_text or not normalized_text.strip():
         raise HTTPException(status_code=400, detail="No text content provided")
@@ -64,23 +101,45 @@ async def run_verification_async(normalized_text: str, task_id: str = None, inpu
     try:
         is_text_input = input_type == "text"
         
-        # Step 1: Extract claims with granular progress for text inputs
+        # Step 1: Detect domain (one keyword pass over the whole text, off the event loop)
         if task_id:
             if is_text_input:
                 update_progress(task_id, 2, 100, "Analyzing text structure...", "processing")
-                await asyncio.sleep(0.1)  # Small delay to show progress
-                update_progress(task_id, 4, 100, "Segmenting sentences...", "processing")
-                await asyncio.sleep(0.1)
-            update_progress(task_id, 5, 100, "Extracting claims from text...", "processing")
+            update_progress(task_id, 5, 100, "Detecting domain...", "processing")
+        
+        domain = await run_in_stage(CPU_STAGE, detect_domain, normalized_text)
         
-        claims = extract_claims(normalized_text)
+        # Step 2: Extract and verify claims (10-85% of progress). Extraction runs
+        # off the event loop and feeds claims to verification as they are found,
+        # so the first searches overlap extracting the rest of the document
+        if task_id:
+            update_progress(task_id, 10, 100, "Extracting and verifying claims...", "processing")
         
-        # Additional progress for text inputs after extraction
-        if is_text_input and task_id and claims:
-            await asyncio.sleep(0.1)
-            update_progress(task_id, 7, 100, f"Found {len(claims)} claim(s) to verify...", "processing")
+        claims = ClaimFeed(stream_claim_batches(normalized_text))
+        reported_percentage = 10
         
-        if not claims:
+        # Progress is tracked by claim completion
+        def progress_callback(completed: int, total: int, current: str):
+            nonlocal reported_percentage
+            if task_id:
+                # Real progress: 10% to 85% based on claim completion; the total
+                # grows while extraction runs, so never report going backwards
+                base_percentage = 10
+                progress_range = 75  # 85 - 10
+                percentage = base_percentage + int((completed / total) * progress_range)
+                reported_percentage = max(reported_percentage, percentage)
+                if not claims.exhausted:
+                    current = f"{current} (still extracting claims)"
+                update_progress(task_id, reported_percentage, 100, current, "processing")
+        
+        results = await verify_claims_batch(
+            claims,
+            domain,
+            progress_callback=progress_callback,
+            explain=explanations == "llm"
+        )
+
+        if not results:
             extracted_citations = extract_citations(normalized_text)
             if task_id:
                 update_progress(task_id, 100, 100, "No claims found", "completed")
@@ -89,68 +148,31 @@ async def run_verification_async(normalized_text: str, task_id: str = None, inpu
                 "total_claims": 0,
                 "overall_reliability": 0.0,
                 "claims": [],
+                "clustering": clustering_summary([]),
                 "extracted_citations": extracted_citations,
                 "citation_verification": {"verified": [], "invalid": [], "total": 0}
             }
 
-        # Step 2: Detect domain (7-10% for text, 5-10% for others)
-        if task_id:
-            if is_text_input:
-                await asyncio.sleep(0.1)
-            update_progress(task_id, 10, 100, "Detecting domain...", "processing")
-        
-        domain = detect_domain(normalized_text)
-        
-        # Step 3: Verify claims in parallel batches (10-85% of progress)
-        # Progress is tracked by batch completion
-        # For text inputs with few claims, use claim-level progress instead
-        if is_text_input and len(claims) <= 3:
-            # For very short text inputs, track individual claim progress
-            def progress_callback_text(completed: int, total: int, current: str):
-                if task_id:
-                    # Real progress: 10% to 85% based on claim completion
-                    base_percentage = 10
-                    progress_range = 75  # 85 - 10
-                    percentage = base_percentage + int((completed / total) * progress_range)
-                    update_progress(task_id, percentage, 100, current, "processing")
-            
-            # Process claims individually for better progress visibility
-            results = []
-            for idx, claim in enumerate(claims):
-                if task_id:
-                    progress_callback_text(idx, len(claims), f"Verifying claim {idx + 1}/{len(claims)}...")
-                result = await verify_claim_async(claim, domain)
-                results.append(result)
-                if task_id:
-                    progress_callback_text(idx + 1, len(claims), f"Completed claim {idx + 1}/{len(claims)}")
-        else:
-            # Batch processing for longer inputs
-            def progress_callback(completed_batches: int, total_batches: int, current: str):
-                if task_id:
-                    # Real progress: 10% to 85% based on batch completion
-                    base_percentage = 10
-                    progress_range = 75  # 85 - 10
-                    percentage = base_percentage + int((completed_batches / total_batches) * progress_range)
-                    update_progress(task_id, percentage, 100, current, "processing")
-            
-            results = await verify_claims_batch(
-                claims,
-                domain,
-                batch_size=5,
-                progress_callback=progress_callback
-            )
+        # Template explanations now; deferred tasks keep their results so the
+        # LLM explanation can be requested per claim later
+        if explanations != "llm":
+            await run_in_stage(IO_STAGE, add_deterministic_explanations, results, explanations == "deferred")
+            if explanations == "deferred" and task_id:
+                get_task_result_store().put(task_id, results)
 
-        # Step 4: Verify citations (85-95% of progress)
+        # Step 3: Verify citations (85-95% of progress)
         if task_id:
             update_progress(task_id, 85, 100, "Verifying citations...", "processing")
         
         all_citations = []
         for result in results:
-            all_citations.extend(result.get("citations", []))
+            # Near-duplicates carry their representative's citations; check those once
+            if result.get("duplicate_of") is None:
+                all_citations.extend(result.get("citations", []))
         
         citation_verification = await verify_citations_async(all_citations) if all_citations else {"verified": [], "invalid": [], "total": 0}
         
-        # Step 5: Calculate overall score and finalize (95-100% of progress)
+        # Step 4: Calculate overall score and finalize (95-100% of progress)
         if task_id:
             update_progress(task_id, 95, 100, "Calculating final scores...", "processing")
         
@@ -165,6 +187,7 @@ async def run_verification_async(normalized_text: str, task_id: str = None, inpu
             "total_claims": len(results),
             "overall_reliability": overall_score,
             "claims": results,
+            "clustering": clustering_summary(results),
             "extracted_citations": extracted_citations,
             "citation_verification": citation_verification
         }
@@ -182,6 +205,135 @@ def run_verification(normalized_text: str):
     return asyncio.run(run_verification_async(normalized_text))
 
 
+async def verification_event_stream(normalized_text: str, task_id: str, explanations: ExplanationMode = DEFAULT_EXPLANATION_MODE):
+    """
+    Run the verification pipeline, yielding SSE events as results become ready:
+    "started" (domain), one "claim" per verdict in completion order,
+    "extracted" (total claim count) as soon as extraction finishes,
+    "citation_verification", then "overall" with the final score and the
+    near-duplicate clustering summary.
+    Claims are verified while extraction is still running, so "claim" events
+    can precede "extracted".
+    With deferred explanations, one "explanation" event per claim follows "overall".
+    """
+    started_at = time.perf_counter()
+    finished = False
+    try:
+        update_progress(task_id, 5, 100, "Extracting claims from text...", "processing")
+        domain = await run_in_stage(CPU_STAGE, detect_domain, normalized_text)
+
+        yield {"event": "started", "data": json.dumps({
+            "task_id": task_id,
+            "domain": domain
+        })}
+
+        claims = ClaimFeed(stream_claim_batches(normalized_text))
+        results = []
+        if explanations == "deferred":
+            get_task_result_store().put(task_id, results)
+
+        def extracted_event():
+            return {"event": "extracted", "data": json.dumps({
+                "total_claims": claims.count,
+                "elapsed_ms": round((time.perf_counter() - started_at) * 1000)
+            })}
+
+        announced = False
+        completed = 0
+        reported_percentage = 10
+        async for index, result in verify_claims_stream(claims, domain, explain=explanations == "llm"):
+            if explanations != "llm":
+                await run_in_stage(IO_STAGE, add_deterministic_explanations, [result], explanations == "deferred")
+            # Slots for claims that are still in flight (the stored list is shared)
+            results.extend([None] * (claims.count - len(results)))
+            results[index] = result
+            completed += 1
+            # The total grows while extraction runs, so never report going backwards
+            reported_percentage = max(reported_percentage, 10 + int(completed / claims.count * 75))
+            update_progress(
+                task_id, reported_percentage, 100,
+                f"Verified claim {completed}/{claims.count}", "processing"
+            )
+            yield {"event": "claim", "data": json.dumps({
+                "index": index,
+                "elapsed_ms": round((time.perf_counter() - started_at) * 1000),
+                "result": result
+            })}
+            if claims.exhausted and not announced:
+                announced = True
+                yield extracted_event()
+
+        if not announced:
+            yield extracted_event()
+
+        update_progress(task_id, 85, 100, "Verifying citations...", "processing")
+        all_citations = []
+        for result in results:
+            # Near-duplicates carry their representative's citations; check those once
+            if result.get("duplicate_of") is None:
+                all_citations.extend(result.get("citations", []))
+        citation_verification = await verify_citations_async(all_citations) if all_citations else {"verified": [], "invalid": [], "total": 0}
+        yield {"event": "citation_verification", "data": json.dumps(citation_verification)}
+
+        update_progress(task_id, 100, 100, "Verification complete", "completed")
+        finished = True
+        yield {"event": "overall", "data": json.dumps({
+            "domain": domain,
+            "total_claims": len(results),
+            "overall_reliability": calculate_overall_score(results),
+            "clustering": clustering_summary(results),
+            "extracted_citations": extract_citations(normalized_text),
+            "elapsed_ms": round((time.perf_counter() - started_at) * 1000)
+        })}
+
+        # Push the generated explanations in batches, in claim order
+        pending = [index for index, result in enumerate(results) if result.get("explanation_pending")]
+        for start in range(0, len(pending), EXPLANATION_BATCH_SIZE):
+            indexes = pending[start:start + EXPLANATION_BATCH_SIZE]
+            await run_in_stage(CPU_STAGE, explain_deferred, [results[index] for index in indexes])
+            for index in indexes:
+                yield {"event": "explanation", "data": json.dumps({
+                    "index": index,
+                    "explanation": results[index]["explanation"]
+                })}
+    except Exception as e:
+        logger.error(f"Streaming verification failed: {e}", exc_info=True)
+        update_progress(task_id, 0, 100, f"Error: {str(e)}", "error")
+        finished = True
+        yield {"event": "error", "data": json.dumps({"detail": f"Verification failed: {str(e)}"})}
+    finally:
+        # The client disconnected (or the stream was closed) before the end
+        if not finished:
+            update_progress(task_id, 0, 100, "Cancelled: client disconnected", "error")
+
+
+@router.post("/text/stream")
+async def verify_text_stream(data: TextInput):
+    """Verify text input, streaming each claim's verdict over SSE as soon as it is ready."""
+    if not data.text or not data.text.strip():
+        raise HTTPException(status_code=400, detail="Text input cannot be empty")
+
+    task_id = str(uuid.uuid4())
+    events = verification_event_stream(data.text.strip(), task_id, data.explanations)
+
+    if SSE_AVAILABLE:
+        return EventSourceResponse(events, headers={"X-Task-Id": task_id})
+
+    async def generate():
+        async for event in events:
+            yield f"event: {event['event']}\ndata: {event['data']}\n\n"
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Task-Id": task_id,
+        }
+    )
+
+
 @router.post("/text")
 async def verify_text(data: TextInput):
     """Verify text input with progress tracking."""
@@ -196,7 +348,7 @@ async def verify_text(data: TextInput):
         logger.info(f"Starting text verification for {len(normalized_text)} characters, task_id: {task_id}")
         
         # Run verification with progress tracking
-        result = await run_verification_async(normalized_text, task_id, "text")
+        result = await run_verification_async(normalized_text, task_id, "text", data.explanations)
         
         logger.info(f"Text verification completed: {result.get('total_claims', 0)} claims found")
         
@@ -217,7 +369,7 @@ async def verify_url(data: UrlInput):
         task_id = str(uuid.uuid4())
         url = str(data.url)
         normalized_text = normalize_input(urls=[url])
-        result = await run_verification_async(normalized_text, task_id, "url")
+        result = await run_verification_async(normalized_text, task_id, "url", data.explanations)
         result["task_id"] = task_id
         return result
     except HTTPException:
@@ -228,7 +380,7 @@ async def verify_url(data: UrlInput):
 
 
 @router.post("/file")
-async def verify_file(file: UploadFile = File(...)):
+async def verify_file(file: UploadFile = File(...), explanations: ExplanationMode = Form(DEFAULT_EXPLANATION_MODE)):
     """Verify content from uploaded file (PDF or DOCX)."""
     tmp_path = None
     try:
@@ -249,7 +401,7 @@ async def verify_file(file: UploadFile = File(...)):
 
         update_progress(task_id, 5, 100, "Extracting text from file...", "processing")
         normalized_text = normalize_input(files=[tmp_path])
-        result = await run_verification_async(normalized_text, task_id, "file")
+        result = await run_verification_async(normalized_text, task_id, "file", explanations)
         result["task_id"] = task_id
         return result
     except HTTPException:
@@ -277,9 +429,41 @@ async def verify_batch(data: BatchInput):
         urls = [str(url) for url in data.urls] if data.urls else None
         normalized_text = normalize_input(text=data.text, urls=urls)
         input_type = "text" if data.text and not urls else "general"
-        return await run_verification_async(normalized_text, task_id, input_type)
+        result = await run_verification_async(normalized_text, task_id, input_type, data.explanations)
+        result["task_id"] = task_id
+        return result
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Batch verification failed: {e}")
-        raise HTTPException(status_code=400, detail=f"Failed to process batch input: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=400, detail=f"Failed to process batch input: {str(e)}")
+
+
+@router.get("/explanations/{task_id}/{claim_index}")
+async def get_claim_explanation(task_id: str, claim_index: int):
+    """
+    LLM explanation for one claim of a task verified with explanations="deferred".
+    Generated on the first request, then served from the stored result.
+    """
+    results = get_task_result_store().get(task_id)
+    if results is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired task, or explanations were not deferred")
+    if not 0 <= claim_index < len(results):
+        raise HTTPException(status_code=404, detail=f"Claim index {claim_index} out of range")
+
+    result = results[claim_index]
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"Claim {claim_index} has not been verified yet")
+
+    if result.get("explanation_pending"):
+        await _EXPLANATION_FLIGHTS.do_async(
+            (task_id, claim_index),
+            lambda: run_in_stage(CPU_STAGE, explain_deferred, [result])
+        )
+
+    return {
+        "task_id": task_id,
+        "index": claim_index,
+        "claim": result["claim"],
+        "explanation": result.get("explanation", "")
+    }
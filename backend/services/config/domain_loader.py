@@ -6,6 +6,14 @@ DOMAIN_PATH = os.path.join(BASE_PATH, "domains")
 
 _DOMAIN_CACHE = {}
 
+def list_domains() -> list[str]:
+    """Names of all domains with a YAML config."""
+    return sorted(
+        os.path.splitext(name)[0]
+        for name in os.listdir(DOMAIN_PATH)
+        if name.endswith(".yaml")
+    )
+
 def load_domain_config(domain: str):
     """
     Loads and caches domain YAML config
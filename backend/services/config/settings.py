@@ -1,9 +1,92 @@
 import os
+import tempfile
 from dotenv import load_dotenv
 
 load_dotenv()
 
 TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
 
-if not TAVILY_API_KEY:
-    raise RuntimeError("TAVILY_API_KEY not set")
+# Settings the service cannot work without; a missing one fails readiness
+# (GET /ready) instead of crashing the import
+REQUIRED_SETTINGS = ("TAVILY_API_KEY",)
+
+def missing_required_settings() -> list[str]:
+    """Names of required settings that are not configured."""
+    return [name for name in REQUIRED_SETTINGS if not globals().get(name)]
+
+# Persistent cache shared by all workers on a host (SQLite, WAL mode)
+CACHE_DB_ENABLED = os.getenv("CACHE_DB_ENABLED", "true").lower() in ("1", "true", "yes")
+CACHE_DB_PATH = os.getenv("CACHE_DB_PATH", os.path.join(tempfile.gettempdir(), "vibeverifier_cache.sqlite3"))
+CACHE_DB_MAX_BYTES = int(os.getenv("CACHE_DB_MAX_BYTES", str(256 * 1024 * 1024)))
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", str(24 * 60 * 60)))
+VERDICT_CACHE_TTL = int(os.getenv("VERDICT_CACHE_TTL", str(6 * 60 * 60)))
+
+# Embedding micro-batching: flush when a batch reaches this many texts or the window expires
+EMBEDDING_BATCH_MAX_SIZE = int(os.getenv("EMBEDDING_BATCH_MAX_SIZE", "64"))
+EMBEDDING_BATCH_WINDOW_MS = float(os.getenv("EMBEDDING_BATCH_WINDOW_MS", "5"))
+
+# Tavily search backend: token-bucket rate (requests/second), burst size and concurrency cap
+TAVILY_REQUESTS_PER_SECOND = float(os.getenv("TAVILY_REQUESTS_PER_SECOND", "5"))
+TAVILY_BURST = int(os.getenv("TAVILY_BURST", "5"))
+TAVILY_MAX_IN_FLIGHT = int(os.getenv("TAVILY_MAX_IN_FLIGHT", "8"))
+TAVILY_MAX_RETRIES = int(os.getenv("TAVILY_MAX_RETRIES", "3"))
+TAVILY_TIMEOUT = float(os.getenv("TAVILY_TIMEOUT", "30"))
+
+# Progress tracking: finished tasks are evicted after PROGRESS_TTL_SECONDS, and any
+# task without an update for PROGRESS_STALE_SECONDS (abandoned or died mid-run);
+# SSE subscribers get a heartbeat when nothing changed for PROGRESS_HEARTBEAT_SECONDS
+PROGRESS_TTL_SECONDS = float(os.getenv("PROGRESS_TTL_SECONDS", "600"))
+PROGRESS_STALE_SECONDS = float(os.getenv("PROGRESS_STALE_SECONDS", "3600"))
+PROGRESS_HEARTBEAT_SECONDS = float(os.getenv("PROGRESS_HEARTBEAT_SECONDS", "15"))
+
+# Results of tasks run with deferred explanations are kept this long (seconds)
+# so LLM explanations can be requested on demand
+DEFERRED_RESULTS_TTL_SECONDS = float(os.getenv("DEFERRED_RESULTS_TTL_SECONDS", "3600"))
+MAX_DEFERRED_TASKS = int(os.getenv("MAX_DEFERRED_TASKS", "1000"))
+
+# Adaptive (AIMD) claim-verification concurrency
+VERIFY_CONCURRENCY_MIN = int(os.getenv("VERIFY_CONCURRENCY_MIN", "2"))
+VERIFY_CONCURRENCY_MAX = int(os.getenv("VERIFY_CONCURRENCY_MAX", "32"))
+VERIFY_CONCURRENCY_INITIAL = int(os.getenv("VERIFY_CONCURRENCY_INITIAL", "5"))
+# Searches slower than this (seconds) count as congestion
+VERIFY_TARGET_SEARCH_LATENCY = float(os.getenv("VERIFY_TARGET_SEARCH_LATENCY", "6"))
+
+# Near-duplicate claims in a document (cosine similarity of their embeddings at or
+# above the threshold, same numbers and negations) are verified once; 0 disables clustering
+CLAIM_CLUSTER_THRESHOLD = float(os.getenv("CLAIM_CLUSTER_THRESHOLD", "0.95"))
+# Route each claim to the domain of its own keywords (falling back to the
+# document's domain) instead of verifying every claim with the document's domain
+CLAIM_DOMAIN_ROUTING = os.getenv("CLAIM_DOMAIN_ROUTING", "true").lower() in ("1", "true", "yes")
+
+# Per-stage thread pools: blocking I/O (cache lookups, sync searches) vs CPU-bound model inference
+IO_EXECUTOR_WORKERS = int(os.getenv("IO_EXECUTOR_WORKERS", "16"))
+CPU_EXECUTOR_WORKERS = int(os.getenv("CPU_EXECUTOR_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Optional multi-process inference: models load once in the parent, which forks
+# INFERENCE_WORKERS processes sharing weights copy-on-write (0 = in-process inference)
+INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", "0"))
+INFERENCE_WORKER_TORCH_THREADS = int(os.getenv(
+    "INFERENCE_WORKER_TORCH_THREADS",
+    str(max(1, (os.cpu_count() or 1) // max(INFERENCE_WORKERS, 1)))
+))
+INFERENCE_PRELOAD_DOMAINS = [d.strip() for d in os.getenv("INFERENCE_PRELOAD_DOMAINS", "general").split(",") if d.strip()]
+
+# Memory budget (MB of model parameters) for loaded embedding, sentiment and
+# reasoning models; least-recently-used idle models are evicted above it (0 = unlimited)
+MODEL_MEMORY_BUDGET_MB = int(os.getenv("MODEL_MEMORY_BUDGET_MB", "0"))
+# A failed model load is not retried for this many seconds
+MODEL_LOAD_FAILURE_TTL_SECONDS = float(os.getenv("MODEL_LOAD_FAILURE_TTL_SECONDS", "30"))
+
+# Explanation mode of requests that don't pick one: "llm", "deterministic" or "deferred"
+DEFAULT_EXPLANATION_MODE = os.getenv("DEFAULT_EXPLANATION_MODE", "llm")
+if DEFAULT_EXPLANATION_MODE not in ("llm", "deterministic", "deferred"):
+    DEFAULT_EXPLANATION_MODE = "llm"
+
+# Startup warmup: load the domain YAMLs and these models (embedding, sentiment,
+# reasoner) and run a dummy batch through each before /ready reports ready;
+# embedding models are warmed for WARMUP_DOMAINS. The reasoner is warmed by
+# default only when requests default to "llm" explanations
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "true").lower() in ("1", "true", "yes")
+_DEFAULT_WARMUP_MODELS = "embedding,sentiment,reasoner" if DEFAULT_EXPLANATION_MODE == "llm" else "embedding,sentiment"
+WARMUP_MODELS = [m.strip() for m in os.getenv("WARMUP_MODELS", _DEFAULT_WARMUP_MODELS).split(",") if m.strip()]
+WARMUP_DOMAINS = [d.strip() for d in os.getenv("WARMUP_DOMAINS", "general").split(",") if d.strip()]
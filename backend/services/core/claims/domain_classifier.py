@@ -1,4 +1,15 @@
+"""
+Keyword-based domain classification.
+All domain keywords are compiled into one word lookup table and a document
+is split into words once, whatever its length; per-keyword match counts are then turned
+into per-domain scores with matrix products, for the whole document or for
+many spans of it at once.
+"""
 import logging
+from itertools import repeat
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -51,50 +62,170 @@ DOMAIN_KEYWORDS = {
     }
 }
 
+# Everything that separates words: ASCII non-letters and common typographic punctuation
+_SEPARATORS = str.maketrans(
+    {i: " " for i in range(128) if not chr(i).isalpha()}
+    | {ch: " " for ch in "\u2018\u2019\u201c\u201d\u2013\u2014\u2026\u2022\u00b7\u00a0"}
+)
+
+
+def _words(text: str) -> List[str]:
+    """Lowercase words of text, split on anything that isn't a letter."""
+    return text.lower().translate(_SEPARATORS).split()
+
+
+class DomainMatcher:
+    """
+    Single-pass multi-keyword matcher over DOMAIN_KEYWORDS.
+    Text is split into lowercase words once; every word is mapped to an id
+    through one lookup table (keyword words and their plural "s"/"es"), and
+    single- and multi-word keywords are then counted with array operations.
+    The words of a multi-word keyword still count as keywords of their own
+    (e.g. "court" inside "supreme court"), as with substring counting.
+    """
+
+    def __init__(self, domain_keywords: Dict[str, Dict] = DOMAIN_KEYWORDS):
+        self.domains = list(domain_keywords)
+        self.keywords = sorted({keyword.lower() for config in domain_keywords.values() for keyword in config["keywords"]})
+
+        # Word (and plural) -> word id, over every word used in a keyword
+        vocabulary = sorted({word for keyword in self.keywords for word in keyword.split()})
+        self._word_ids = {}
+        for word_id, word in enumerate(vocabulary):
+            for form in (word + "es", word + "s", word):
+                self._word_ids[form] = word_id
+
+        # Keyword id of each single-word keyword's word id; the extra last entry
+        # (-1) is what unknown words (id -1) index
+        self._single = np.full(len(vocabulary) + 1, -1, dtype=np.int64)
+        self._phrases: List[Tuple[np.ndarray, int]] = []
+        for keyword_id, keyword in enumerate(self.keywords):
+            word_ids = [self._word_ids[word] for word in keyword.split()]
+            if len(word_ids) == 1:
+                self._single[word_ids[0]] = keyword_id
+            else:
+                self._phrases.append((np.array(word_ids, dtype=np.int64), keyword_id))
+
+        # weights[k, d]: weight of keyword k for domain d (0 if not one of its keywords)
+        index = {keyword: i for i, keyword in enumerate(self.keywords)}
+        self._weights = np.zeros((len(self.keywords), len(self.domains)), dtype=np.float64)
+        for d, (domain, config) in enumerate(domain_keywords.items()):
+            for keyword in config["keywords"]:
+                self._weights[index[keyword.lower()], d] = config["weight"]
+        self._max_scores = np.array(
+            [len(config["keywords"]) * 1.5 for config in domain_keywords.values()]
+        )
+
+    def span_counts(self, text: str, spans: Sequence[Tuple[int, int]]) -> np.ndarray:
+        """
+        Keyword counts per [start, end) span of text, shape (spans, keywords).
+        Each span is split into words once; all spans are counted together.
+        """
+        words: List[str] = []
+        lengths = []
+        for start, end in spans:
+            span_words = _words(text[start:end])
+            words.extend(span_words)
+            lengths.append(len(span_words))
+
+        ids = np.fromiter(map(self._word_ids.get, words, repeat(-1)), dtype=np.int64, count=len(words))
+        owners = np.repeat(np.arange(len(lengths)), lengths)
+        singles = self._single[ids]
+        single_hits = singles >= 0
+        matched_owners = [owners[single_hits]]
+        matched_keywords = [singles[single_hits]]
+
+        # Multi-word keywords: consecutive word ids within the same span
+        for phrase, keyword_id in self._phrases:
+            starts = np.flatnonzero(ids[:max(len(ids) - len(phrase) + 1, 0)] == phrase[0])
+            for offset in range(1, len(phrase)):
+                starts = starts[(ids[starts + offset] == phrase[offset]) & (owners[starts + offset] == owners[starts])]
+            matched_owners.append(owners[starts])
+            matched_keywords.append(np.full(len(starts), keyword_id, dtype=np.int64))
+
+        cells = np.concatenate(matched_owners) * len(self.keywords) + np.concatenate(matched_keywords)
+        counts = np.bincount(cells, minlength=len(lengths) * len(self.keywords))
+        return counts.reshape(len(lengths), len(self.keywords))
+
+    def keyword_counts(self, text: str) -> np.ndarray:
+        """Matches per keyword over the whole text."""
+        return self.span_counts(text, [(0, len(text))])[0]
+
+    def score_counts(self, counts: np.ndarray) -> np.ndarray:
+        """
+        Per-domain scores for rows of keyword counts, shape (rows, domains).
+        Each keyword found adds weight * (1 + 0.5 * min(count, 3)) to its domains.
+        """
+        contribution = np.minimum(counts, 3) * 0.5 + 1.0
+        contribution[counts == 0] = 0.0
+        return contribution @ self._weights
+
+    def domain_counts(self, text: str) -> Dict[str, int]:
+        """Total keyword matches per domain over the whole text."""
+        totals = self.keyword_counts(text) @ (self._weights > 0)
+        return {domain: int(total) for domain, total in zip(self.domains, totals)}
+
+    def classify(self, text: str) -> Tuple[str, float]:
+        """(domain, confidence) of the whole text."""
+        return self.classify_spans(text, [(0, len(text))])[0]
+
+    def classify_spans(self, text: str, spans: Sequence[Tuple[int, int]]) -> List[Tuple[str, float]]:
+        """(domain, confidence) for each [start, end) span of text, from one scan of text."""
+        if not len(spans):
+            return []
+        scores = self.score_counts(self.span_counts(text, spans))
+
+        best = np.argmax(scores, axis=1)
+        best_scores = scores[np.arange(len(scores)), best]
+
+        # Normalize confidence (0.4 to 1.0 range)
+        # Base confidence on relative score strength
+        confidence = np.minimum(best_scores / self._max_scores[best], 1.0)
+        confidence = np.round(np.maximum(0.4, confidence), 2)  # Minimum 0.4 if domain detected
+
+        return [
+            (self.domains[domain], float(score)) if found else ("general", 0.3)
+            for domain, score, found in zip(best.tolist(), confidence.tolist(), (best_scores > 0).tolist())
+        ]
+
+
+_MATCHER: DomainMatcher | None = None
+
+def get_domain_matcher() -> DomainMatcher:
+    """The shared matcher, compiled on first use."""
+    global _MATCHER
+    if _MATCHER is None:
+        _MATCHER = DomainMatcher()
+    return _MATCHER
+
 def ml_detect_domain(text: str) -> tuple[str, float]:
     """
-    Domain detection using keyword matching with improved heuristics.
+    Domain detection using keyword matching with improved heuristics,
+    over the whole text in one pass.
     Returns: (domain, confidence)
     """
     if not text or not text.strip():
         return "general", 0.0
 
-    # Limit text length for performance
-    text = text[:1000]
-    lowered = text.lower()
-
-    # Score each domain based on keyword matches
-    domain_scores = {}
-    
-    for domain, config in DOMAIN_KEYWORDS.items():
-        score = 0.0
-        keywords = config["keywords"]
-        weight = config["weight"]
-        
-        for keyword in keywords:
-            # Count occurrences (case-insensitive)
-            count = lowered.count(keyword.lower())
-            if count > 0:
-                # Weight by frequency (log scale to prevent over-weighting)
-                score += weight * (1 + 0.5 * min(count, 3))
-        
-        domain_scores[domain] = score
-
-    # Find best domain
-    if not domain_scores or max(domain_scores.values()) == 0:
-        return "general", 0.3
-
-    best_domain = max(domain_scores, key=domain_scores.get)
-    best_score = domain_scores[best_domain]
-
-    # Normalize confidence (0.4 to 1.0 range)
-    # Base confidence on relative score strength
-    max_possible_score = len(DOMAIN_KEYWORDS[best_domain]["keywords"]) * 1.5
-    confidence = min(best_score / max_possible_score, 1.0)
-    confidence = max(0.4, confidence)  # Minimum 0.4 if domain detected
-
-    # If confidence is too low, fallback to general
-    if confidence < 0.4:
-        return "general", 0.3
-
-    return best_domain, round(confidence, 2)
+    return get_domain_matcher().classify(text)
+
+def ml_detect_domain_spans(text: str, spans: Sequence[Tuple[int, int]]) -> List[Tuple[str, float]]:
+    """(domain, confidence) for each [start, end) span of text (e.g. sections), in one pass."""
+    if not text or not text.strip():
+        return [("general", 0.0) for _ in spans]
+
+    return get_domain_matcher().classify_spans(text, spans)
+
+def ml_detect_domains(texts: Sequence[str]) -> List[Tuple[str, float]]:
+    """(domain, confidence) for each of several texts (e.g. claims), in one pass."""
+    spans = []
+    offset = 0
+    for text in texts:
+        spans.append((offset, offset + len(text)))
+        offset += len(text) + 1
+
+    results = ml_detect_domain_spans("\n".join(texts), spans)
+    return [
+        result if text.strip() else ("general", 0.0)
+        for text, result in zip(texts, results)
+    ]
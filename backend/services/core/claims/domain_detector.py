@@ -1,4 +1,5 @@
-from services.core.claims.domain_classifier import ml_detect_domain
+from services.config.domain_loader import list_domains
+from services.core.claims.domain_classifier import ml_detect_domain, ml_detect_domains
 
 def detect_domain(text: str) -> str:
     domain, confidence = ml_detect_domain(text)
@@ -8,3 +9,15 @@ def detect_domain(text: str) -> str:
         return "general"
 
     return domain
+
+def detect_claim_domains(claims: list[str], default: str = "general") -> list[str]:
+    """
+    Domain of each claim, from one keyword pass over all of them.
+    A claim keeps default (usually the document's domain) unless its own
+    keywords point to another domain that has a config.
+    """
+    configured = set(list_domains())
+    return [
+        domain if confidence >= 0.4 and domain != "general" and domain in configured else default
+        for domain, confidence in ml_detect_domains(claims)
+    ]
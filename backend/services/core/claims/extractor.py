@@ -1,79 +1,129 @@
-from services.core.claims.sentence_segmenter import smart_sentence_segment
-from services.core.claims.sentiment_analyzer import is_factual_claim
+from typing import AsyncIterator, Iterator
+from services.core.claims.sentence_segmenter import iter_sentences
+from services.core.claims.sentiment_analyzer import is_factual_claims_batch, SENTIMENT_BATCH_SIZE
+from services.core.utils.executors import run_in_stage, CPU_STAGE
 import logging
 
 logger = logging.getLogger(__name__)
 
-def extract_claims(text: str) -> list[str]:
+OPINION_STARTERS = (
+    "i think",
+    "i believe",
+    "in my opinion",
+    "we think",
+    "you should",
+    "it seems",
+    "probably",
+    "maybe",
+    "perhaps",
+    "i feel",
+    "i guess",
+    "i would say",
+    "in my view",
+    "personally",
+)
+
+# Sentiment reasons that drop a sentence; anything else is allowed through
+# to make the sentiment check less strict
+NON_FACTUAL_REASONS = ("Too emotional", "Highly emotional", "Conversational")
+
+def _passes_lexical_rules(cleaned: str) -> bool:
     """
-    Extract factual claims from text using intelligent sentence segmentation.
-    Filters out opinions, questions, and conversational phrases.
+    Cheap rule-based filters: length, questions, opinions,
+    conversational phrases and short list items.
     """
-    if not text or not text.strip():
-        return []
+    # Filter too short sentences
+    if len(cleaned) < 20:
+        return False
 
-    # Use smart sentence segmentation
-    sentences = smart_sentence_segment(text)
-    
-    claims = []
+    lower = cleaned.lower()
 
-    opinion_starters = (
-        "i think",
-        "i believe",
-        "in my opinion",
-        "we think",
-        "you should",
-        "it seems",
-        "probably",
-        "maybe",
-        "perhaps",
-        "i feel",
-        "i guess",
-        "i would say",
-        "in my view",
-        "personally",
-    )
-
-    for s in sentences:
-        cleaned = s.strip()
-
-        # Filter too short sentences
-        if len(cleaned) < 20:
-            continue
+    # Remove questions
+    if cleaned.endswith("?") or lower.startswith(("what", "who", "where", "when", "why", "how")):
+        return False
 
-        lower = cleaned.lower()
+    # Remove opinions / subjective statements
+    is_opinion = any(lower.startswith(starter) for starter in OPINION_STARTERS)
+    if is_opinion:
+        return False
 
-        # Remove questions
-        if cleaned.endswith("?") or lower.startswith(("what", "who", "where", "when", "why", "how")):
-            continue
+    # Filter out common conversational phrases
+    if lower.startswith(("hello", "hi", "thanks", "thank you", "please", "sorry", "hey")):
+        return False
+
+    # Filter out list items and bullet points
+    if cleaned.startswith(("- ", "* ", "• ", "1. ", "2. ", "3. ")):
+        # Still include if it's a substantial claim
+        if len(cleaned) < 50:
+            return False
+
+    return True
 
-        # Remove opinions / subjective statements
-        is_opinion = any(lower.startswith(starter) for starter in opinion_starters)
-        if is_opinion:
+def _filter_factual(candidates: list[str]) -> list[str]:
+    """Drop the candidates the sentiment model flags as non-factual, in one batched call."""
+    # Check if each candidate is a factual claim worth verifying (sentiment analysis)
+    try:
+        decisions = is_factual_claims_batch(candidates)
+    except Exception as e:
+        logger.warning(f"Sentiment analysis failed for claims, allowing through: {e}")
+        # If sentiment analysis fails, allow the claims through
+        return candidates
+
+    claims = []
+    for cleaned, (is_factual, reason) in zip(candidates, decisions):
+        # Only filter obvious non-factual content
+        if not is_factual and reason in NON_FACTUAL_REASONS:
+            logger.debug(f"Skipping non-factual claim: {reason} - {cleaned[:50]}...")
             continue
+        claims.append(cleaned)
 
-        # Filter out common conversational phrases
-        if lower.startswith(("hello", "hi", "thanks", "thank you", "please", "sorry", "hey")):
+    return claims
+
+def iter_claim_batches(text: str, batch_size: int = SENTIMENT_BATCH_SIZE) -> Iterator[list[str]]:
+    """
+    Lazily extract claims, one sentiment batch at a time. Sentences are
+    segmented and run through the lexical rules until batch_size candidates
+    are collected; those go to the sentiment model together and the
+    surviving claims are yielded before the rest of the text is segmented.
+    """
+    if not text or not text.strip():
+        return
+
+    candidates = []
+    for sentence in iter_sentences(text):
+        cleaned = sentence.text.strip()
+        if not _passes_lexical_rules(cleaned):
             continue
+        candidates.append(cleaned)
+        if len(candidates) >= batch_size:
+            claims = _filter_factual(candidates)
+            if claims:
+                yield claims
+            candidates = []
 
-        # Filter out list items and bullet points
-        if cleaned.startswith(("- ", "* ", "• ", "1. ", "2. ", "3. ")):
-            # Still include if it's a substantial claim
-            if len(cleaned) < 50:
-                continue
-
-        # Check if it's a factual claim worth verifying (sentiment analysis)
-        # Make sentiment check less strict - only filter obvious non-factual content
-        try:
-            is_factual, reason = is_factual_claim(cleaned)
-            if not is_factual and reason in ["Too emotional", "Highly emotional", "Conversational"]:
-                logger.debug(f"Skipping non-factual claim: {reason} - {cleaned[:50]}...")
-                continue
-            # Allow through if sentiment check fails or is uncertain
-        except Exception as e:
-            logger.warning(f"Sentiment analysis failed for claim, allowing through: {e}")
-            # If sentiment analysis fails, allow the claim through
+    if candidates:
+        claims = _filter_factual(candidates)
+        if claims:
+            yield claims
 
-        claims.append(cleaned)
+def extract_claims(text: str) -> list[str]:
+    """
+    Extract factual claims from text using intelligent sentence segmentation.
+    Filters out opinions, questions, and conversational phrases.
+    Lexical rules run over the sentences first; only the survivors are sent
+    to the sentiment model, in batches.
+    """
+    return [claim for claims in iter_claim_batches(text) for claim in claims]
 
-    return claims
\ No newline at end of file
+async def stream_claim_batches(text: str) -> AsyncIterator[list[str]]:
+    """
+    Extraction as a pipeline stage: each batch of claims is produced on the
+    CPU executor, off the event loop, and yielded as soon as it is ready,
+    while the rest of the text is still unprocessed.
+    """
+    batches = iter_claim_batches(text)
+    while True:
+        claims = await run_in_stage(CPU_STAGE, next, batches, None)
+        if claims is None:
+            return
+        yield claims
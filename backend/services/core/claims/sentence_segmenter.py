@@ -1,10 +1,13 @@
 """
 Advanced sentence segmentation using NLP techniques.
 Properly handles abbreviations, decimal numbers, and complex punctuation.
+
+Segmentation is a single pass over the words of the text: sentences are
+yielded lazily together with their character offsets in the source text.
 """
 import re
 import logging
-from typing import List
+from typing import Iterator, List, NamedTuple
 
 logger = logging.getLogger(__name__)
 
@@ -21,110 +24,117 @@ NUMBER_PATTERN = r'\d+\.\d+'
 URL_PATTERN = r'https?://[^\s]+'
 EMAIL_PATTERN = r'\S+@\S+\.\S+'
 
+_WORD_RE = re.compile(r'\S+')
+_NUMBER_RE = re.compile(NUMBER_PATTERN)
+_URL_RE = re.compile(URL_PATTERN)
+_EMAIL_RE = re.compile(EMAIL_PATTERN)
+
+# Sentences shorter than this are merged into the previous one (likely false splits)
+MIN_SENTENCE_LENGTH = 10
+
+_SENTENCE_END_CHARS = '.!?'
+
+
+class Sentence(NamedTuple):
+    """A sentence with whitespace collapsed, and its [start, end) span in the source text."""
+    text: str
+    start: int
+    end: int
+
+
 def is_abbreviation(word: str) -> bool:
     """Check if a word is a common abbreviation."""
     word_clean = word.lower().rstrip('.')
     return word_clean in ABBREVIATIONS or word_clean.endswith(('st', 'nd', 'rd', 'th'))
 
 
-def smart_sentence_segment(text: str) -> List[str]:
+def _protect(word: str) -> str:
     """
-    Intelligently segment text into sentences using NLP-aware rules.
+    The word as the splitting rules see it: URLs and emails are masked so
+    their dots are never taken as sentence ends.
+    """
+    if '://' in word:
+        word = _URL_RE.sub('__URL__', word)
+    if '@' in word:
+        word = _EMAIL_RE.sub('__EMAIL__', word)
+    return word
+
+
+def _ends_sentence(word: str, next_word: str | None) -> bool:
+    """Whether word (already masked) ends a sentence, given the next (masked) word."""
+    if word[-1] not in _SENTENCE_END_CHARS:
+        return False
+
+    # Special cases: don't split on decimal numbers
+    if _NUMBER_RE.match(word):
+        return False
+
+    # Last word, definitely sentence end
+    if next_word is None:
+        return True
+
+    # Next word starts with capital (but not all caps like acronyms): end unless an abbreviation
+    if next_word[0].isupper() and not next_word.isupper():
+        return not is_abbreviation(word)
+
+    # Also end if next word is a number (new sentence often starts with number)
+    return next_word[0].isdigit()
+
+
+def _raw_sentences(text: str) -> Iterator[Sentence]:
+    """Split on sentence-ending words, before short fragments are merged."""
+    words = _WORD_RE.finditer(text)
+    current = next(words, None)
+    if current is None:
+        return
+    current_word = _protect(current.group())
+
+    sentence_words: List[str] = []
+    sentence_start = current.start()
+    while current is not None:
+        following = next(words, None)
+        following_word = _protect(following.group()) if following is not None else None
+
+        sentence_words.append(current.group())
+        if _ends_sentence(current_word, following_word):
+            yield Sentence(' '.join(sentence_words), sentence_start, current.end())
+            sentence_words = []
+            if following is not None:
+                sentence_start = following.start()
+        elif following is None:
+            # Add remaining sentence
+            yield Sentence(' '.join(sentence_words), sentence_start, current.end())
+
+        current, current_word = following, following_word
+
+
+def iter_sentences(text: str) -> Iterator[Sentence]:
+    """
+    Lazily segment text into sentences with their offsets in text.
     Handles abbreviations, decimal numbers, URLs, and complex punctuation.
+    Runs in time linear in the length of the text.
     """
     if not text or not text.strip():
-        return []
-
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
-    
-    # Protect URLs and emails from being split
-    protected_items = []
-    text_with_placeholders = text
-    
-    # Replace URLs with placeholders
-    url_matches = list(re.finditer(URL_PATTERN, text))
-    for i, match in enumerate(url_matches):
-        placeholder = f"__URL_{i}__"
-        protected_items.append(('url', match.group()))
-        text_with_placeholders = text_with_placeholders.replace(match.group(), placeholder)
-    
-    # Replace emails with placeholders
-    email_matches = list(re.finditer(EMAIL_PATTERN, text_with_placeholders))
-    for i, match in enumerate(email_matches):
-        placeholder = f"__EMAIL_{i}__"
-        protected_items.append(('email', match.group()))
-        text_with_placeholders = text_with_placeholders.replace(match.group(), placeholder)
-    
-    # Split by sentence endings, but be smart about it
-    # Pattern: sentence ending followed by space and capital letter
-    # But also handle cases like "Dr. Smith" or "3.14 is pi"
-    sentences = []
-    current_sentence = []
-    words = text_with_placeholders.split()
-    
-    i = 0
-    while i < len(words):
-        word = words[i]
-        current_sentence.append(word)
-        
-        # Check if word ends with sentence punctuation
-        if re.search(r'[.!?]$', word):
-            # Check if it's likely a sentence ending
-            is_sentence_end = False
-            
-            # If next word exists and starts with capital, likely sentence end
-            if i + 1 < len(words):
-                next_word = words[i + 1]
-                # Check if next word starts with capital (but not all caps like acronyms)
-                if next_word and next_word[0].isupper() and not next_word.isupper():
-                    # Additional check: not an abbreviation
-                    if not is_abbreviation(word):
-                        is_sentence_end = True
-                # Also end if next word is a number (new sentence often starts with number)
-                elif next_word and next_word[0].isdigit():
-                    is_sentence_end = True
-            else:
-                # Last word, definitely sentence end
-                is_sentence_end = True
-            
-            # Special cases: don't split on decimal numbers
-            if re.match(NUMBER_PATTERN, word):
-                is_sentence_end = False
-            
-            if is_sentence_end:
-                sentence_text = ' '.join(current_sentence)
-                if sentence_text.strip():
-                    sentences.append(sentence_text.strip())
-                current_sentence = []
-        
-        i += 1
-    
-    # Add remaining sentence
-    if current_sentence:
-        sentence_text = ' '.join(current_sentence)
-        if sentence_text.strip():
-            sentences.append(sentence_text.strip())
-    
-    # Restore protected items
-    restored_sentences = []
-    for sentence in sentences:
-        restored = sentence
-        for item_type, original in protected_items:
-            if item_type == 'url':
-                restored = restored.replace(f"__URL_{sentences.index(sentence) if sentence in sentences else 0}__", original)
-            elif item_type == 'email':
-                restored = restored.replace(f"__EMAIL_{sentences.index(sentence) if sentence in sentences else 0}__", original)
-        restored_sentences.append(restored)
-    
+        return
+
     # Final cleanup: merge sentences that are too short (likely false splits)
-    final_sentences = []
-    for sentence in restored_sentences:
-        if len(sentence) < 10 and final_sentences:
-            # Merge with previous sentence
-            final_sentences[-1] += " " + sentence
-        else:
-            final_sentences.append(sentence)
-    
-    return [s.strip() for s in final_sentences if s.strip() and len(s.strip()) >= 10]
+    # into the previous one; one sentence of lookahead is enough
+    pending = None
+    for sentence in _raw_sentences(text):
+        if pending is not None and len(sentence.text) < MIN_SENTENCE_LENGTH:
+            pending = Sentence(pending.text + ' ' + sentence.text, pending.start, sentence.end)
+            continue
+        if pending is not None and len(pending.text) >= MIN_SENTENCE_LENGTH:
+            yield pending
+        pending = sentence
+
+    if pending is not None and len(pending.text) >= MIN_SENTENCE_LENGTH:
+        yield pending
 
+
+def smart_sentence_segment(text: str) -> List[str]:
+    """
+    Intelligently segment text into sentences using NLP-aware rules.
+    Handles abbreviations, decimal numbers, URLs, and complex punctuation.
+    """
+    return [sentence.text for sentence in iter_sentences(text)]
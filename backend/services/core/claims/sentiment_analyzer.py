@@ -3,29 +3,88 @@ Sentiment and content type analysis for filtering claims.
 Detects emotional, conversational, and factual content.
 """
 import logging
-from typing import Dict, Tuple
-from transformers import pipeline
+from typing import Dict, List, Tuple
+from services.core.inference.worker_pool import get_inference_pool
+from services.core.inference.model_manager import get_model_manager
 
 logger = logging.getLogger(__name__)
 
-# Lazy loading for sentiment pipeline
-_sentiment_pipeline = None
-_emotion_pipeline = None
+# Sentiment pipeline, loaded lazily into the shared model manager
+SENTIMENT_MODEL = "cardiffnlp/twitter-roberta-base-sentiment-latest"
+
+# Number of texts per sentiment forward pass in batched mode
+SENTIMENT_BATCH_SIZE = 32
+
+# Characters of text passed to the sentiment model
+MAX_SENTIMENT_CHARS = 512
+
+_NEUTRAL_SENTIMENT = {"positive": 0.0, "negative": 0.0, "neutral": 1.0}
+
+def _load_sentiment_pipeline():
+    from transformers import pipeline
+
+    return pipeline(
+        "sentiment-analysis",
+        model=SENTIMENT_MODEL,
+        top_k=None  # Use top_k instead of deprecated return_all_scores
+    )
+
+def _acquire_sentiment_pipeline():
+    """
+    Pin the sentiment pipeline (loading it on first use) until
+    get_model_manager().release(SENTIMENT_MODEL). Returns None if it can't load.
+    """
+    try:
+        return get_model_manager().acquire(SENTIMENT_MODEL, _load_sentiment_pipeline)
+    except Exception as e:
+        logger.warning(f"Failed to load sentiment model: {e}")
+        return None
 
 def _get_sentiment_pipeline():
-    """Lazy load sentiment analysis pipeline."""
-    global _sentiment_pipeline
-    if _sentiment_pipeline is None:
-        try:
-            _sentiment_pipeline = pipeline(
-                "sentiment-analysis",
-                model="cardiffnlp/twitter-roberta-base-sentiment-latest",
-                top_k=None  # Use top_k instead of deprecated return_all_scores
-            )
-        except Exception as e:
-            logger.warning(f"Failed to load sentiment model: {e}")
-            return None
-    return _sentiment_pipeline
+    """Lazy load sentiment analysis pipeline (not pinned)."""
+    pipeline = _acquire_sentiment_pipeline()
+    if pipeline is not None:
+        get_model_manager().release(SENTIMENT_MODEL)
+    return pipeline
+
+def _run_sentiment(inputs, **kwargs):
+    """
+    Run the sentiment model on inputs, in an inference worker when the pool
+    is enabled. Returns None if the model is unavailable.
+    """
+    pool = get_inference_pool()
+    if pool is not None:
+        return pool.classify(inputs, **kwargs)
+    
+    pipeline = _acquire_sentiment_pipeline()
+    if pipeline is None:
+        return None
+    try:
+        return pipeline(inputs, **kwargs)
+    finally:
+        get_model_manager().release(SENTIMENT_MODEL)
+
+def warm_up_sentiment_model():
+    """Load the sentiment model and run one dummy batch. Raises if it is unavailable."""
+    if _run_sentiment(["Warming up the sentiment model.", "This is a second sentence."], batch_size=2) is None:
+        raise RuntimeError("Sentiment model not available")
+
+def _map_sentiment_scores(result: list[dict]) -> Dict[str, float]:
+    """Map raw pipeline label scores to our format."""
+    sentiment_scores = {"positive": 0.0, "negative": 0.0, "neutral": 0.0}
+    
+    for item in result:
+        label = item["label"].lower()
+        score = item["score"]
+        
+        if "positive" in label:
+            sentiment_scores["positive"] = score
+        elif "negative" in label:
+            sentiment_scores["negative"] = score
+        elif "neutral" in label:
+            sentiment_scores["neutral"] = score
+    
+    return sentiment_scores
 
 def analyze_sentiment(text: str) -> Dict[str, float]:
     """
@@ -33,93 +92,107 @@ def analyze_sentiment(text: str) -> Dict[str, float]:
     Returns: {"positive": 0.0-1.0, "negative": 0.0-1.0, "neutral": 0.0-1.0}
     """
     if not text or len(text.strip()) < 10:
-        return {"positive": 0.0, "negative": 0.0, "neutral": 1.0}
-    
-    pipeline = _get_sentiment_pipeline()
-    if pipeline is None:
-        return {"positive": 0.0, "negative": 0.0, "neutral": 1.0}
+        return dict(_NEUTRAL_SENTIMENT)
     
     try:
         # Limit text length for performance
-        text_short = text[:512]
-        results = pipeline(text_short)
-        
-        # Map results to our format
-        sentiment_scores = {"positive": 0.0, "negative": 0.0, "neutral": 0.0}
-        
-        for result in results[0]:
-            label = result["label"].lower()
-            score = result["score"]
-            
-            if "positive" in label:
-                sentiment_scores["positive"] = score
-            elif "negative" in label:
-                sentiment_scores["negative"] = score
-            elif "neutral" in label:
-                sentiment_scores["neutral"] = score
-        
-        return sentiment_scores
+        text_short = text[:MAX_SENTIMENT_CHARS]
+        results = _run_sentiment(text_short)
+        if results is None:
+            return dict(_NEUTRAL_SENTIMENT)
+        return _map_sentiment_scores(results[0])
     except Exception as e:
         logger.warning(f"Sentiment analysis failed: {e}")
-        return {"positive": 0.0, "negative": 0.0, "neutral": 1.0}
+        return dict(_NEUTRAL_SENTIMENT)
 
-def is_factual_claim(text: str) -> Tuple[bool, str]:
+def analyze_sentiment_batch(texts: List[str], batch_size: int = SENTIMENT_BATCH_SIZE) -> List[Dict[str, float]]:
     """
-    Determine if text is a factual claim worth verifying.
-    Returns: (is_factual, reason)
+    Analyze sentiment of many texts in one pipeline call.
+    Texts are sorted by length so each batch pads to a similar size;
+    results are returned in input order.
     """
-    if not text or len(text.strip()) < 20:
-        return False, "Too short"
+    results = [dict(_NEUTRAL_SENTIMENT) for _ in texts]
     
-    text_lower = text.lower()
+    # Same short-text rule as analyze_sentiment
+    pending = [i for i, text in enumerate(texts) if text and len(text.strip()) >= 10]
+    if not pending:
+        return results
     
-    # Emotional indicators
-    emotional_words = [
-        "feel", "feeling", "emotion", "love", "hate", "angry", "sad", "happy",
-        "excited", "disappointed", "frustrated", "worried", "anxious", "scared"
-    ]
+    pending.sort(key=lambda i: len(texts[i]))
+    inputs = [texts[i][:MAX_SENTIMENT_CHARS] for i in pending]
     
-    # Conversational indicators
-    conversational_phrases = [
-        "how are you", "what's up", "nice to meet", "talk to you later",
-        "have a good day", "take care", "see you", "thanks for"
-    ]
+    try:
+        outputs = _run_sentiment(inputs, batch_size=batch_size)
+        if outputs is None:
+            return results
+        for i, output in zip(pending, outputs):
+            results[i] = _map_sentiment_scores(output)
+    except Exception as e:
+        logger.warning(f"Batched sentiment analysis failed, falling back to per-text: {e}")
+        for i in pending:
+            results[i] = analyze_sentiment(texts[i])
+    
+    return results
+
+# Emotional indicators
+EMOTIONAL_WORDS = [
+    "feel", "feeling", "emotion", "love", "hate", "angry", "sad", "happy",
+    "excited", "disappointed", "frustrated", "worried", "anxious", "scared"
+]
+
+# Conversational indicators
+CONVERSATIONAL_PHRASES = [
+    "how are you", "what's up", "nice to meet", "talk to you later",
+    "have a good day", "take care", "see you", "thanks for"
+]
+
+# Opinion indicators
+OPINION_INDICATORS = [
+    "i think", "i believe", "in my opinion", "i feel", "i guess",
+    "probably", "maybe", "perhaps", "might be", "could be"
+]
+
+# Factual indicators
+FACTUAL_INDICATORS = [
+    "according to", "research shows", "studies indicate", "data suggests",
+    "evidence", "proven", "established", "fact", "statistics", "percentage",
+    "increased", "decreased", "found that", "discovered", "published"
+]
+
+def _lexical_factual_check(text: str) -> Tuple[bool, str] | None:
+    """
+    Cheap rule-based checks that don't need the sentiment model.
+    Returns (is_factual, reason) if a rule decides, else None.
+    """
+    if not text or len(text.strip()) < 20:
+        return False, "Too short"
     
-    # Opinion indicators
-    opinion_indicators = [
-        "i think", "i believe", "in my opinion", "i feel", "i guess",
-        "probably", "maybe", "perhaps", "might be", "could be"
-    ]
+    text_lower = text.lower()
     
     # Check for emotional content
-    emotional_count = sum(1 for word in emotional_words if word in text_lower)
+    emotional_count = sum(1 for word in EMOTIONAL_WORDS if word in text_lower)
     if emotional_count >= 2:
         return False, "Too emotional"
     
     # Check for conversational content
-    if any(phrase in text_lower for phrase in conversational_phrases):
+    if any(phrase in text_lower for phrase in CONVERSATIONAL_PHRASES):
         return False, "Conversational"
     
     # Check for strong opinion indicators
-    if any(indicator in text_lower for indicator in opinion_indicators):
+    if any(indicator in text_lower for indicator in OPINION_INDICATORS):
         return False, "Opinion-based"
     
-    # Analyze sentiment
-    sentiment = analyze_sentiment(text)
-    
+    return None
+
+def _sentiment_factual_check(text: str, sentiment: Dict[str, float]) -> Tuple[bool, str]:
+    """Decide factuality from sentiment scores and factual indicators."""
     # If very emotional (high positive/negative, low neutral), likely not factual
     # But be less strict - only filter if extremely emotional
     if sentiment["neutral"] < 0.2 and (sentiment["positive"] > 0.8 or sentiment["negative"] > 0.8):
         return False, "Highly emotional"
     
-    # Factual indicators
-    factual_indicators = [
-        "according to", "research shows", "studies indicate", "data suggests",
-        "evidence", "proven", "established", "fact", "statistics", "percentage",
-        "increased", "decreased", "found that", "discovered", "published"
-    ]
-    
-    factual_count = sum(1 for indicator in factual_indicators if indicator in text_lower)
+    text_lower = text.lower()
+    factual_count = sum(1 for indicator in FACTUAL_INDICATORS if indicator in text_lower)
     
     # If has factual indicators and neutral sentiment, likely factual
     if factual_count >= 1 and sentiment["neutral"] > 0.5:
@@ -131,3 +204,30 @@ def is_factual_claim(text: str) -> Tuple[bool, str]:
     
     return False, "Not clearly factual"
 
+def is_factual_claim(text: str) -> Tuple[bool, str]:
+    """
+    Determine if text is a factual claim worth verifying.
+    Returns: (is_factual, reason)
+    """
+    decision = _lexical_factual_check(text)
+    if decision is not None:
+        return decision
+    
+    # Analyze sentiment
+    sentiment = analyze_sentiment(text)
+    return _sentiment_factual_check(text, sentiment)
+
+def is_factual_claims_batch(texts: List[str]) -> List[Tuple[bool, str]]:
+    """
+    Batched is_factual_claim: lexical rules run on every text first and
+    only the survivors go through the sentiment model, in one batched call.
+    Returns one (is_factual, reason) per input, in input order.
+    """
+    decisions = [_lexical_factual_check(text) for text in texts]
+    
+    survivors = [i for i, decision in enumerate(decisions) if decision is None]
+    sentiments = analyze_sentiment_batch([texts[i] for i in survivors])
+    for i, sentiment in zip(survivors, sentiments):
+        decisions[i] = _sentiment_factual_check(texts[i], sentiment)
+    
+    return decisions
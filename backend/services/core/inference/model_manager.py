@@ -0,0 +1,247 @@
+"""
+Memory-budgeted model cache shared by the embedding, sentiment and reasoning models.
+Each loaded model is charged its parameter (and buffer) bytes. When the total
+exceeds the budget, least-recently-used models are dropped, but never one that
+a caller is currently using: callers pin a model with acquire()/release() or use().
+Loads are single-flight per model name, and failed loads are remembered briefly
+so a broken model isn't retried by every thread at once.
+"""
+import gc
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator
+
+from services.config.settings import MODEL_MEMORY_BUDGET_MB, MODEL_LOAD_FAILURE_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+def _rss_bytes() -> int:
+    """Resident set size of this process, or 0 where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def model_nbytes(model: Any) -> int:
+    """
+    Bytes held by a torch model's parameters and buffers, including packed
+    int8 weights. Pipelines are measured through their .model; tied weights
+    are counted once. Returns 0 for models without a torch state dict.
+    """
+    module = getattr(model, "model", model)
+    try:
+        values = list(module.state_dict().values())
+    except Exception:
+        return 0
+
+    total = 0
+    seen = set()
+    while values:
+        value = values.pop()
+        if isinstance(value, (tuple, list)):
+            values.extend(value)
+            continue
+        if not (hasattr(value, "element_size") and hasattr(value, "nelement")):
+            continue
+        try:
+            pointer = value.data_ptr()
+        except Exception:
+            pointer = id(value)
+        if pointer in seen:
+            continue
+        seen.add(pointer)
+        total += value.nelement() * value.element_size()
+    return total
+
+
+class ModelLoadError(RuntimeError):
+    """Raised without retrying while a model's recent load failure is cached."""
+
+
+class _Entry:
+    def __init__(self, model: Any, nbytes: int):
+        self.model = model
+        self.nbytes = nbytes
+        self.in_use = 0
+
+
+class ModelManager:
+    """
+    LRU model cache bounded by budget_bytes (0 = unbounded).
+    A single model larger than the budget is still kept while it is the
+    only one that fits; pinned models are never evicted.
+    """
+
+    def __init__(
+        self,
+        budget_bytes: int = MODEL_MEMORY_BUDGET_MB * 1024 * 1024,
+        failure_ttl: float = MODEL_LOAD_FAILURE_TTL_SECONDS
+    ):
+        self.budget_bytes = budget_bytes
+        self.failure_ttl = failure_ttl
+        self._lock = threading.Lock()
+        self._models: "OrderedDict[str, _Entry]" = OrderedDict()  # least recently used first
+        self._loading: Dict[str, Future] = {}
+        self._failures: Dict[str, tuple[float, Exception]] = {}
+        self.loads = 0
+        self.hits = 0
+        self.evictions = 0
+        self.coalesced_loads = 0
+        self.load_failures = 0
+        self.cached_failures = 0
+        self.load_seconds = 0.0
+
+    def acquire(self, name: str, loader: Callable[[], Any]) -> Any:
+        """
+        Return the model registered as name and pin it until release(name).
+        On a miss, one caller runs loader() while concurrent callers for the
+        same name wait for it. Raises whatever loader raised, or
+        ModelLoadError while that failure is cached.
+        """
+        while True:
+            with self._lock:
+                entry = self._models.get(name)
+                if entry is not None:
+                    entry.in_use += 1
+                    self._models.move_to_end(name)
+                    self.hits += 1
+                    return entry.model
+
+                failure = self._failures.get(name)
+                if failure is not None:
+                    failed_at, error = failure
+                    if time.monotonic() - failed_at < self.failure_ttl:
+                        self.cached_failures += 1
+                        raise ModelLoadError(f"Model {name} failed to load recently: {error}")
+                    del self._failures[name]
+
+                future = self._loading.get(name)
+                leader = future is None
+                if leader:
+                    future = Future()
+                    self._loading[name] = future
+                else:
+                    self.coalesced_loads += 1
+
+            if leader:
+                return self._load(name, loader, future)
+
+            # Wait for the load in progress, then pin the loaded model (raises its error)
+            future.result()
+
+    def _load(self, name: str, loader: Callable[[], Any], future: Future) -> Any:
+        """Run loader() for name, register and pin the model, and wake waiting callers."""
+        try:
+            rss_before = _rss_bytes()
+            started_at = time.perf_counter()
+            model = loader()
+            seconds = time.perf_counter() - started_at
+            if model is None:
+                raise RuntimeError(f"Loader for {name} returned no model")
+
+            # Models without a torch state dict (e.g. ONNX Runtime) are charged their RSS growth
+            nbytes = model_nbytes(model) or max(_rss_bytes() - rss_before, 0)
+        except BaseException as e:
+            with self._lock:
+                self._loading.pop(name, None)
+                if isinstance(e, Exception):
+                    self._failures[name] = (time.monotonic(), e)
+                    self.load_failures += 1
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            entry = _Entry(model, nbytes)
+            entry.in_use += 1
+            self._models[name] = entry
+            self._loading.pop(name, None)
+            self.loads += 1
+            self.load_seconds += seconds
+            evicted = self._evict()
+
+        logger.info(f"Loaded model {name} ({nbytes / 1024 / 1024:.0f} MB) in {seconds:.1f}s")
+        future.set_result(None)
+        self._collect(evicted)
+        return model
+
+    def release(self, name: str):
+        """Unpin a model acquired with acquire()."""
+        with self._lock:
+            entry = self._models.get(name)
+            if entry is None:
+                return
+            entry.in_use = max(entry.in_use - 1, 0)
+            evicted = self._evict()
+        self._collect(evicted)
+
+    @contextmanager
+    def use(self, name: str, loader: Callable[[], Any]) -> Iterator[Any]:
+        """Pin a model for the duration of a with block."""
+        model = self.acquire(name, loader)
+        try:
+            yield model
+        finally:
+            self.release(name)
+
+    def _evict(self) -> list[str]:
+        """Drop unpinned models, LRU first, until within budget (caller holds the lock)."""
+        if self.budget_bytes <= 0:
+            return []
+
+        total = sum(entry.nbytes for entry in self._models.values())
+        evicted = []
+        for name in list(self._models):
+            if total <= self.budget_bytes:
+                break
+            entry = self._models[name]
+            if entry.in_use:
+                continue
+            del self._models[name]
+            total -= entry.nbytes
+            self.evictions += 1
+            evicted.append(name)
+        return evicted
+
+    def _collect(self, evicted: list[str]):
+        if not evicted:
+            return
+        # Pipelines hold reference cycles; collect so their memory is returned now
+        gc.collect()
+        logger.info(f"Evicted models over the {self.budget_bytes / 1024 / 1024:.0f} MB budget: {', '.join(evicted)}")
+
+    def metrics(self) -> Dict:
+        with self._lock:
+            models = {
+                name: {"bytes": entry.nbytes, "in_use": entry.in_use}
+                for name, entry in self._models.items()
+            }
+            return {
+                "budget_bytes": self.budget_bytes,
+                "resident_bytes": sum(model["bytes"] for model in models.values()),
+                "loads": self.loads,
+                "hits": self.hits,
+                "evictions": self.evictions,
+                "coalesced_loads": self.coalesced_loads,
+                "load_failures": self.load_failures,
+                "cached_failures": self.cached_failures,
+                "loading": list(self._loading),
+                "load_seconds": round(self.load_seconds, 2),
+                "models": models,
+            }
+
+
+_MODEL_MANAGER = ModelManager()
+
+def get_model_manager() -> ModelManager:
+    return _MODEL_MANAGER
+
+def get_model_metrics() -> Dict:
+    return _MODEL_MANAGER.metrics()
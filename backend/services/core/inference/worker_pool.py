@@ -0,0 +1,253 @@
+"""
+Optional multi-process inference worker pool.
+Models are loaded once in the parent, which then forks N workers that share
+the weight pages copy-on-write. The API process sends batched encode,
+classify and generate calls to idle workers over pipes, so tokenization and
+Python-side postprocessing run outside the API process's GIL.
+
+Must be started before the process spawns other threads (i.e. at startup),
+since only the forking thread survives in the children.
+"""
+import gc
+import logging
+import multiprocessing
+import queue
+import threading
+from typing import Any, Dict, List
+
+from services.config.settings import (
+    INFERENCE_WORKERS,
+    INFERENCE_WORKER_TORCH_THREADS,
+    INFERENCE_PRELOAD_DOMAINS,
+    WARMUP_MODELS,
+)
+
+logger = logging.getLogger(__name__)
+
+# True inside forked workers, so they run models locally instead of recursing
+_IN_WORKER = False
+
+
+class InferenceWorkerError(RuntimeError):
+    """Raised when a worker fails a call or dies."""
+
+
+def _encode(domain: str, inputs: List[str], kwargs: Dict) -> Any:
+    from services.core.verification.model_registry import use_embedding_model
+    with use_embedding_model(domain) as model:
+        return model.encode(inputs, **kwargs)
+
+def _classify(domain: str, inputs: Any, kwargs: Dict) -> Any:
+    from services.core.claims.sentiment_analyzer import _run_sentiment
+    outputs = _run_sentiment(inputs, **kwargs)
+    if outputs is None:
+        raise InferenceWorkerError("Sentiment model not available")
+    return outputs
+
+def _generate(domain: str, inputs: Any, kwargs: Dict) -> Any:
+    from services.core.llm.reasoner import _run_generation
+    outputs = _run_generation(inputs, **kwargs)
+    if outputs is None:
+        raise InferenceWorkerError("Reasoning model not available")
+    return outputs
+
+_HANDLERS = {
+    "encode": _encode,
+    "classify": _classify,
+    "generate": _generate,
+}
+
+
+def _worker_main(conn, torch_threads: int):
+    """Worker loop: receive (op, domain, inputs, kwargs), reply (ok, value)."""
+    global _IN_WORKER
+    _IN_WORKER = True
+
+    try:
+        import torch
+        torch.set_num_threads(torch_threads)
+    except Exception as e:
+        logger.warning(f"Could not set torch threads in inference worker: {e}")
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+
+        op, domain, inputs, kwargs = message
+        try:
+            conn.send((True, _HANDLERS[op](domain, inputs, kwargs)))
+        except Exception as e:
+            conn.send((False, f"{type(e).__name__}: {e}"))
+
+    conn.close()
+
+
+def _preload_models(domains: List[str]):
+    """
+    Load the models the workers will serve, in the parent. The reasoning
+    model is only preloaded when it is configured for warmup (i.e. "llm"
+    explanations are expected); otherwise a worker loads it on first use.
+    """
+    from services.core.verification.model_registry import get_embedding_model
+    from services.core.claims.sentiment_analyzer import _get_sentiment_pipeline
+
+    for domain in domains:
+        get_embedding_model(domain)
+    _get_sentiment_pipeline()
+    if "reasoner" in WARMUP_MODELS:
+        from services.core.llm.reasoner import _get_reasoning_pipeline
+        _get_reasoning_pipeline()
+
+
+class InferenceWorkerPool:
+    """Forked worker processes fed over pipes; one call per worker at a time."""
+
+    def __init__(self, num_workers: int, torch_threads: int = INFERENCE_WORKER_TORCH_THREADS):
+        self.num_workers = num_workers
+        self.torch_threads = torch_threads
+        self._processes = []
+        self._idle: "queue.Queue" = queue.Queue()
+        self._alive = 0
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.failures = 0
+
+    @property
+    def active(self) -> bool:
+        return self._alive > 0
+
+    def start(self, preload_domains: List[str] = INFERENCE_PRELOAD_DOMAINS):
+        _preload_models(preload_domains)
+
+        # Move everything loaded so far out of the GC's reach so collections
+        # in the children don't write to (and un-share) those pages
+        gc.collect()
+        gc.freeze()
+
+        context = multiprocessing.get_context("fork")
+        for index in range(self.num_workers):
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(
+                target=_worker_main,
+                args=(child_conn, self.torch_threads),
+                name=f"inference-worker-{index}",
+                daemon=True
+            )
+            process.start()
+            child_conn.close()
+            self._processes.append(process)
+            self._idle.put(parent_conn)
+            self._alive += 1
+
+        logger.info(f"Started {self.num_workers} inference workers ({self.torch_threads} torch threads each)")
+
+    def _acquire(self):
+        """An idle worker's pipe, or None once every worker has died."""
+        conn = self._idle.get()
+        if conn is None:
+            # Pass the sentinel on to the next waiting caller
+            self._idle.put(None)
+        return conn
+
+    def _call(self, op: str, domain: str, inputs: Any, kwargs: Dict) -> Any:
+        conn = self._acquire()
+        if conn is None:
+            # No workers left; the handlers run the models in this process
+            return _HANDLERS[op](domain, inputs, kwargs)
+
+        try:
+            conn.send((op, domain, inputs, kwargs))
+            ok, value = conn.recv()
+        except (EOFError, OSError) as e:
+            # Worker died: retire its pipe, and wake queued callers if it was the last
+            with self._lock:
+                self._alive -= 1
+                self.failures += 1
+                last = self._alive == 0
+            logger.error(f"Inference worker died during {op}: {e}")
+            if last:
+                logger.error("All inference workers died, running inference in-process")
+                self._idle.put(None)
+            raise InferenceWorkerError(f"Inference worker died: {e}")
+
+        self._idle.put(conn)
+        with self._lock:
+            self.calls += 1
+            if not ok:
+                self.failures += 1
+        if not ok:
+            raise InferenceWorkerError(value)
+        return value
+
+    def encode(self, domain: str, texts: List[str], **kwargs) -> Any:
+        """SentenceTransformer.encode for the domain's model."""
+        return self._call("encode", domain, texts, kwargs)
+
+    def classify(self, inputs: Any, **kwargs) -> Any:
+        """Sentiment pipeline call."""
+        return self._call("classify", "", inputs, kwargs)
+
+    def generate(self, inputs: Any, **kwargs) -> Any:
+        """Reasoning (text2text) pipeline call."""
+        return self._call("generate", "", inputs, kwargs)
+
+    def stop(self):
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if conn is None:
+                continue
+            try:
+                conn.send(None)
+                conn.close()
+            except OSError:
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+        self._alive = 0
+
+    def metrics(self) -> Dict:
+        return {
+            "workers": self.num_workers,
+            "alive": self._alive,
+            "idle": self._idle.qsize() if self._alive else 0,
+            "calls": self.calls,
+            "failures": self.failures,
+        }
+
+
+_POOL: InferenceWorkerPool | None = None
+
+def start_inference_pool(num_workers: int = INFERENCE_WORKERS) -> InferenceWorkerPool | None:
+    """Start the worker pool if enabled (num_workers > 0)."""
+    global _POOL
+    if num_workers <= 0 or _POOL is not None or _IN_WORKER:
+        return _POOL
+    pool = InferenceWorkerPool(num_workers)
+    pool.start()
+    _POOL = pool
+    return pool
+
+def stop_inference_pool():
+    global _POOL
+    if _POOL is not None:
+        _POOL.stop()
+    _POOL = None
+
+def get_inference_pool() -> InferenceWorkerPool | None:
+    """The running pool, or None for in-process inference (always None inside workers)."""
+    if _IN_WORKER or _POOL is None or not _POOL.active:
+        return None
+    return _POOL
+
+def get_inference_metrics() -> Dict:
+    return _POOL.metrics() if _POOL is not None else {"workers": 0}
@@ -1,4 +1,3 @@
-from docx import Document
 import logging
 from pathlib import Path
 
@@ -11,6 +10,8 @@ def extract_text_from_docx(file_path: str) -> str:
     if not file_path or not Path(file_path).exists():
         raise FileNotFoundError(f"DOCX file not found: {file_path}")
 
+    from docx import Document
+
     try:
         doc = Document(file_path)
         paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
@@ -1,4 +1,3 @@
-import pdfplumber
 import logging
 from pathlib import Path
 
@@ -11,6 +10,8 @@ def extract_text_from_pdf(file_path: str) -> str:
     if not file_path or not Path(file_path).exists():
         raise FileNotFoundError(f"PDF file not found: {file_path}")
 
+    import pdfplumber
+
     text_chunks = []
 
     try:
@@ -1,5 +1,4 @@
 import requests
-from bs4 import BeautifulSoup
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,6 +14,8 @@ def extract_text_from_url(url: str) -> str:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
     }
 
+    from bs4 import BeautifulSoup
+
     try:
         response = requests.get(url, timeout=15, headers=headers, allow_redirects=True)
         response.raise_for_status()
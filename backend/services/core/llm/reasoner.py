@@ -1,71 +1,100 @@
-from transformers import pipeline
+from services.core.inference.worker_pool import get_inference_pool
+from services.core.inference.model_manager import get_model_manager
+from collections import OrderedDict
+import threading
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Load once (VERY IMPORTANT) - lazy loading to avoid startup failures
-_reasoning_pipeline = None
-_reasoning_model = None
-_reasoning_tokenizer = None
+# Lazy loading (into the shared model manager) to avoid startup failures
+REASONING_MODEL = "google/flan-t5-base"
+
+# Prompts per generation batch
+EXPLANATION_BATCH_SIZE = 8
+
+# Memoized explanations keyed by (claim, status, rounded scores)
+MAX_EXPLANATION_MEMO_SIZE = 2000
+_EXPLANATION_MEMO = OrderedDict()
+_EXPLANATION_MEMO_LOCK = threading.Lock()
+
+def _load_reasoning_pipeline():
+    from transformers import pipeline
+
+    # Use CPU-only for stability
+    return pipeline(
+        "text2text-generation",
+        model=REASONING_MODEL,
+        max_length=256,
+        device=-1  # CPU only
+    )
+
+def _acquire_reasoning_pipeline():
+    """
+    Pin the reasoning pipeline (loading it on first use) until
+    get_model_manager().release(REASONING_MODEL). Returns None if it can't load.
+    """
+    try:
+        return get_model_manager().acquire(REASONING_MODEL, _load_reasoning_pipeline)
+    except Exception as e:
+        logger.warning(f"Failed to load reasoning model: {e}")
+        return None
 
 def _get_reasoning_pipeline():
-    """Lazy load the reasoning pipeline with a better model."""
-    global _reasoning_pipeline, _reasoning_model, _reasoning_tokenizer
-    if _reasoning_pipeline is None:
-        try:
-            # Use CPU-only for stability
-            try:
-                _reasoning_pipeline = pipeline(
-                    "text2text-generation",
-                    model="google/flan-t5-base",
-                    max_length=256,
-                    device=-1  # CPU only
-                )
-                logger.info("Loaded reasoning model: google/flan-t5-base")
-            except Exception as e:
-                logger.warning(f"Failed to load reasoning model: {e}")
-                return None
-        except Exception as e:
-            logger.error(f"Failed to load reasoning pipeline: {e}")
-            return None
-    return _reasoning_pipeline
+    """Lazy load the reasoning pipeline (not pinned)."""
+    pipeline = _acquire_reasoning_pipeline()
+    if pipeline is not None:
+        get_model_manager().release(REASONING_MODEL)
+    return pipeline
 
-def generate_explanation(
+def _run_generation(prompts: list[str], **kwargs):
+    """
+    Run the reasoning model on prompts, in an inference worker when the pool
+    is enabled. Returns None if the model is unavailable.
+    """
+    pool = get_inference_pool()
+    if pool is not None:
+        return pool.generate(prompts, **kwargs)
+
+    pipeline = _acquire_reasoning_pipeline()
+    if pipeline is None:
+        return None
+    try:
+        return pipeline(prompts, **kwargs)
+    finally:
+        get_model_manager().release(REASONING_MODEL)
+
+def warm_up_reasoning_model():
+    """Load the reasoning model and run one short generation. Raises if it is unavailable."""
+    if _run_generation(["Explain briefly: the sky is blue."], batch_size=1, max_length=16, do_sample=False) is None:
+        raise RuntimeError("Reasoning model not available")
+
+def _build_prompt(
     claim: str,
     status: str,
     confidence: float,
     citations: list[dict],
-    similarity: float = 0.0,
-    credibility: float = 0.0,
-    contradicted: bool = False
+    similarity: float,
+    credibility: float,
+    contradicted: bool
 ) -> str:
-    """
-    Generate a human-readable, detailed explanation.
-    This NEVER changes verification result.
-    If LLM fails, returns a deterministic explanation.
-    """
-    try:
-        pipeline = _get_reasoning_pipeline()
-        if pipeline is None:
-            return _generate_deterministic_explanation(claim, status, confidence, citations, similarity, credibility, contradicted)
-
-        # Build source list with titles
-        sources_list = []
-        for cite in citations[:3]:
-            title = cite.get("title", "")
-            url = cite.get("url", "")
-            if title and title != "Untitled":
-                sources_list.append(title)
-            elif url:
-                sources_list.append(url.split("/")[-1] if "/" in url else url)
-        
-        sources_text = ", ".join(sources_list) if sources_list else "No reliable sources found"
-
-        # Create a detailed, structured prompt
-        contradicted_note = "- Note: Some sources contradict this claim" if contradicted else ""
-        
-        if status == "verified":
-            prompt = f"""Task: Explain why this claim is verified.
+    """Build the explanation prompt for one claim."""
+    # Build source list with titles
+    sources_list = []
+    for cite in citations[:3]:
+        title = cite.get("title", "")
+        url = cite.get("url", "")
+        if title and title != "Untitled":
+            sources_list.append(title)
+        elif url:
+            sources_list.append(url.split("/")[-1] if "/" in url else url)
+    
+    sources_text = ", ".join(sources_list) if sources_list else "No reliable sources found"
+
+    # Create a detailed, structured prompt
+    contradicted_note = "- Note: Some sources contradict this claim" if contradicted else ""
+    
+    if status == "verified":
+        prompt = f"""Task: Explain why this claim is verified.
 
 Claim: "{claim}"
 
@@ -84,9 +113,9 @@ Generate a clear, concise explanation (2-3 sentences) that:
 4. Avoids repeating the claim verbatim
 
 Explanation:"""
-        else:
-            sources_display = sources_text if sources_text != "No reliable sources found" else "Limited or no reliable sources"
-            prompt = f"""Task: Explain why this claim appears to be hallucinated or unverified.
+    else:
+        sources_display = sources_text if sources_text != "No reliable sources found" else "Limited or no reliable sources"
+        prompt = f"""Task: Explain why this claim appears to be hallucinated or unverified.
 
 Claim: "{claim}"
 
@@ -106,46 +135,172 @@ Generate a clear, concise explanation (2-3 sentences) that:
 
 Explanation:"""
 
-        # Generate with CPU-safe parameters
-        output = pipeline(
-            prompt,
-            max_length=200,
-            min_length=30,
-            do_sample=False,  # Deterministic for stability
-            num_return_sequences=1
-        )
-        
-        # Safely extract text from output
-        if isinstance(output, list) and len(output) > 0:
-            if isinstance(output[0], dict):
-                explanation = output[0].get("generated_text", "").strip()
-            else:
-                explanation = str(output[0]).strip()
-        else:
-            explanation = str(output).strip()
-        
-        # Clean up explanation
-        explanation = explanation.replace("Explanation:", "").strip()
-        explanation = explanation.replace("explanation:", "").strip()
-        
-        # Ensure explanation is meaningful and not just repeating the claim
-        if not explanation or len(explanation) < 20:
-            raise ValueError("Explanation too short or empty")
-        
-        # Check if explanation is just repeating the claim
-        claim_words = set(claim.lower().split()[:5])  # First 5 words
-        explanation_words = set(explanation.lower().split()[:5])
-        overlap = len(claim_words.intersection(explanation_words))
-        
-        if overlap >= 3 and len(explanation.split()) < 15:
-            # Too similar to claim, generate deterministic instead
-            logger.warning("Generated explanation too similar to claim, using deterministic")
-            return _generate_deterministic_explanation(claim, status, confidence, citations, similarity, credibility, contradicted)
-            
+    return prompt
+
+
+def _extract_generated_text(output) -> str:
+    """Safely extract text from one pipeline output."""
+    if isinstance(output, list):
+        output = output[0] if output else ""
+    if isinstance(output, dict):
+        return output.get("generated_text", "").strip()
+    return str(output).strip()
+
+
+def _postprocess_explanation(explanation: str, claim: str) -> str | None:
+    """Clean up generated text. Returns None if it isn't usable."""
+    explanation = explanation.replace("Explanation:", "").strip()
+    explanation = explanation.replace("explanation:", "").strip()
+    
+    # Ensure explanation is meaningful and not just repeating the claim
+    if not explanation or len(explanation) < 20:
+        return None
+    
+    # Check if explanation is just repeating the claim
+    claim_words = set(claim.lower().split()[:5])  # First 5 words
+    explanation_words = set(explanation.lower().split()[:5])
+    overlap = len(claim_words.intersection(explanation_words))
+    
+    if overlap >= 3 and len(explanation.split()) < 15:
+        # Too similar to claim, caller uses deterministic instead
+        logger.warning("Generated explanation too similar to claim, using deterministic")
+        return None
+    
+    return explanation
+
+
+def _memo_key(item: dict) -> tuple:
+    """Memo key: claim, status and scores rounded as displayed."""
+    return (
+        item["claim"],
+        item["status"],
+        round(item.get("confidence", 0.0), 2),
+        round(item.get("similarity", 0.0), 2),
+        round(item.get("credibility", 0.0), 2),
+        bool(item.get("contradicted", False)),
+    )
+
+
+def _explanation_args(item: dict) -> tuple:
+    return (
+        item["claim"],
+        item["status"],
+        item.get("confidence", 0.0),
+        item.get("citations", []),
+        item.get("similarity", 0.0),
+        item.get("credibility", 0.0),
+        item.get("contradicted", False),
+    )
+
+
+def _recall(key: tuple) -> str | None:
+    with _EXPLANATION_MEMO_LOCK:
+        explanation = _EXPLANATION_MEMO.get(key)
+        if explanation is not None:
+            _EXPLANATION_MEMO.move_to_end(key)
         return explanation
-    except Exception as e:
-        logger.warning(f"Explanation generation failed: {e}")
-        return _generate_deterministic_explanation(claim, status, confidence, citations, similarity, credibility, contradicted)
+
+
+def _remember(key: tuple, explanation: str):
+    with _EXPLANATION_MEMO_LOCK:
+        _EXPLANATION_MEMO[key] = explanation
+        _EXPLANATION_MEMO.move_to_end(key)
+        while len(_EXPLANATION_MEMO) > MAX_EXPLANATION_MEMO_SIZE:
+            _EXPLANATION_MEMO.popitem(last=False)
+
+
+def generate_explanations_batch(items: list[dict]) -> list[str]:
+    """
+    Generate explanations for many claims in batched LLM calls.
+    Each item carries generate_explanation's arguments as keys.
+    Results are memoized by (claim, status, rounded scores) and prompts are
+    sorted by length so each batch pads little. Falls back to the
+    deterministic explanation per claim. This NEVER changes verification results.
+    """
+    explanations = [None] * len(items)
+    pending = {}  # memo key -> indexes of items that need it
+
+    for index, item in enumerate(items):
+        key = _memo_key(item)
+        remembered = _recall(key)
+        if remembered is not None:
+            explanations[index] = remembered
+        else:
+            pending.setdefault(key, []).append(index)
+
+    if not pending:
+        return explanations
+
+    generated = {}
+
+    # Group prompts of similar length so padding within a batch stays small
+    jobs = [(key, _build_prompt(*_explanation_args(items[indexes[0]]))) for key, indexes in pending.items()]
+    jobs.sort(key=lambda job: len(job[1]))
+
+    for start in range(0, len(jobs), EXPLANATION_BATCH_SIZE):
+        chunk = jobs[start:start + EXPLANATION_BATCH_SIZE]
+        try:
+            # Generate with CPU-safe parameters
+            outputs = _run_generation(
+                [prompt for _, prompt in chunk],
+                batch_size=len(chunk),
+                max_length=200,
+                min_length=30,
+                do_sample=False,  # Deterministic for stability
+                num_return_sequences=1
+            )
+        except Exception as e:
+            logger.warning(f"Explanation generation failed: {e}")
+            continue
+        if outputs is None:
+            # Model unavailable: deterministic explanations for the rest
+            break
+        for (key, _), output in zip(chunk, outputs):
+            generated[key] = _postprocess_explanation(_extract_generated_text(output), key[0])
+
+    for key, indexes in pending.items():
+        explanation = generated.get(key)
+        if explanation:
+            _remember(key, explanation)
+        else:
+            explanation = _generate_deterministic_explanation(*_explanation_args(items[indexes[0]]))
+        for index in indexes:
+            explanations[index] = explanation
+
+    return explanations
+
+
+def generate_explanation(
+    claim: str,
+    status: str,
+    confidence: float,
+    citations: list[dict],
+    similarity: float = 0.0,
+    credibility: float = 0.0,
+    contradicted: bool = False
+) -> str:
+    """
+    Generate a human-readable, detailed explanation.
+    This NEVER changes verification result.
+    If LLM fails, returns a deterministic explanation.
+    """
+    return generate_explanations_batch([{
+        "claim": claim,
+        "status": status,
+        "confidence": confidence,
+        "citations": citations,
+        "similarity": similarity,
+        "credibility": credibility,
+        "contradicted": contradicted
+    }])[0]
+
+
+def generate_deterministic_explanations(items: list[dict]) -> list[str]:
+    """
+    Deterministic explanations for many claims (same item keys as
+    generate_explanations_batch). Never loads the reasoning model.
+    """
+    return [_generate_deterministic_explanation(*_explanation_args(item)) for item in items]
 
 
 def _generate_deterministic_explanation(
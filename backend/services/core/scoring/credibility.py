@@ -1,28 +1,14 @@
-from services.core.scoring.domain import get_domain_weight
-from services.config.domain_loader import load_domain_config
+from services.core.scoring.domain import get_domain_weights
 
 def calculate_credibility(citations: list[dict], domain: str = "general") -> float:
     """
     Calculate credibility score using domain-specific weights from YAML config.
+    All citations are weighted in one call against the domain's compiled weights.
     """
     if not citations:
         return 0.0
 
-    try:
-        domain_cfg = load_domain_config(domain)
-        credibility_weights = domain_cfg.get("credibility_weights", {})
-        default_weight = credibility_weights.get("default", 0.4)
-    except Exception:
-        credibility_weights = {}
-        default_weight = 0.4
-
-    scores = []
-
-    for cite in citations:
-        url = cite.get("url", "")
-        # Use domain-specific weight if available, otherwise fallback to get_domain_weight
-        weight = get_domain_weight(url, credibility_weights, default_weight)
-        scores.append(weight)
+    scores = get_domain_weights(domain).weights([cite.get("url", "") for cite in citations])
 
     if not scores:
         return 0.0
@@ -1,53 +1,171 @@
-from urllib.parse import urlparse
+"""
+Credibility weights for citation hostnames.
+Each domain's YAML credibility_weights (and the built-in fallback lists) are
+compiled once into a trie over reversed hostname labels, so a lookup walks
+"gov" -> "nih" -> "ncbi" ... and the most specific matching entry wins. An
+entry matches the hostname itself and its subdomains only: "nih.gov" covers
+"pubmed.ncbi.nlm.nih.gov" but not "notnih.gov" or "nih.gov.example".
+Weights are memoized per hostname in a bounded LRU.
+"""
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+
+from services.config.domain_loader import load_domain_config
+
+# Hostnames memoized per compiled weight table
+HOSTNAME_CACHE_SIZE = 4096
+
+# Fallback weights (for backward compatibility) for hosts the YAML doesn't list;
+# "gov" and "edu" cover every hostname in those top-level domains
+FALLBACK_WEIGHTS = {
+    "wikipedia.org": 1.0,
+    "britannica.com": 0.95,
+    "gov": 0.95,
+    "edu": 0.95,
+    "bbc.com": 0.85,
+    "reuters.com": 0.85,
+    "nytimes.com": 0.85,
+    "theguardian.com": 0.85,
+    "aljazeera.com": 0.85,
+    "medium.com": 0.6,
+}
+
+# Any hostname label containing this (e.g. "myblog.net", "blogspot.com")
+BLOG_WEIGHT = 0.6
+
+# Scheme and authority of an absolute URL; anything else goes through urlsplit
+_AUTHORITY = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*://([^/?#@:\[]*)(?::\d*)?(?=[/?#]|$)")
+
+
+class HostnameIndex:
+    """Suffix trie over reversed hostname labels, mapping domains to weights."""
+
+    _WEIGHT = ""  # Key of a node's weight; never a valid label
+
+    def __init__(self, weights: Dict[str, float]):
+        self._root: Dict = {}
+        for suffix, weight in weights.items():
+            node = self._root
+            for label in reversed(suffix.lower().strip(".").split(".")):
+                node = node.setdefault(label, {})
+            node[self._WEIGHT] = float(weight)
+
+    def lookup(self, hostname: str) -> float | None:
+        """Weight of the longest entry that is hostname or a parent domain of it."""
+        node = self._root
+        weight = None
+        for label in reversed(hostname.split(".")):
+            node = node.get(label)
+            if node is None:
+                break
+            weight = node.get(self._WEIGHT, weight)
+        return weight
+
+
+_FALLBACK_INDEX = HostnameIndex(FALLBACK_WEIGHTS)
+
+
+def url_hostname(url: str) -> str:
+    """Lowercase hostname of a URL without a leading "www.", or "" if there is none."""
+    match = _AUTHORITY.match(url)
+    if match:
+        hostname = match.group(1)
+    else:
+        try:
+            hostname = urlsplit(url).hostname or ""
+        except ValueError:
+            return ""
+
+    hostname = hostname.lower().rstrip(".")
+    # Remove www. prefix for matching
+    if hostname.startswith("www."):
+        hostname = hostname[4:]
+    return hostname
+
+
+class CredibilityWeights:
+    """
+    One domain's compiled credibility weights: the YAML entries first, then
+    the fallback lists, then the default weight.
+    """
+
+    def __init__(self, credibility_weights: Dict[str, float] | None = None, default_weight: float = 0.4):
+        credibility_weights = dict(credibility_weights or {})
+        credibility_weights.pop("default", None)
+        self.default_weight = default_weight
+        self._index = HostnameIndex(credibility_weights)
+        self.hostname_weight = lru_cache(maxsize=HOSTNAME_CACHE_SIZE)(self._hostname_weight)
+
+    def _hostname_weight(self, hostname: str) -> float:
+        if not hostname:
+            return self.default_weight
+
+        weight = self._index.lookup(hostname)
+        if weight is None:
+            weight = _FALLBACK_INDEX.lookup(hostname)
+        if weight is None and "blog" in hostname:
+            weight = BLOG_WEIGHT
+        return self.default_weight if weight is None else weight
+
+    def weight(self, url: str) -> float:
+        """Credibility weight of one URL."""
+        if not url:
+            return self.default_weight
+        return self.hostname_weight(url_hostname(url))
+
+    def weights(self, urls: List[str]) -> List[float]:
+        """Credibility weights of many URLs (e.g. a claim's citations) in one call."""
+        hostname_weight = self.hostname_weight
+        return [hostname_weight(url_hostname(url)) if url else self.default_weight for url in urls]
+
+    def cache_info(self):
+        return self.hostname_weight.cache_info()
+
+
+_COMPILED: Dict[Tuple, CredibilityWeights] = {}
+_COMPILED_LOCK = threading.Lock()
+
+
+def compile_weights(credibility_weights: Dict[str, float] | None, default_weight: float = 0.4) -> CredibilityWeights:
+    """The compiled table for a credibility_weights mapping, compiled once per distinct mapping."""
+    key = (tuple(sorted((credibility_weights or {}).items())), default_weight)
+    compiled = _COMPILED.get(key)
+    if compiled is None:
+        with _COMPILED_LOCK:
+            compiled = _COMPILED.get(key)
+            if compiled is None:
+                compiled = CredibilityWeights(credibility_weights, default_weight)
+                _COMPILED[key] = compiled
+    return compiled
+
+
+_DOMAIN_WEIGHTS: Dict[str, CredibilityWeights] = {}
+
+
+def get_domain_weights(domain: str = "general") -> CredibilityWeights:
+    """The compiled credibility weights of a domain's YAML config."""
+    compiled = _DOMAIN_WEIGHTS.get(domain)
+    if compiled is not None:
+        return compiled
+
+    try:
+        domain_cfg = load_domain_config(domain)
+        credibility_weights = domain_cfg.get("credibility_weights", {}) or {}
+        default_weight = credibility_weights.get("default", 0.4)
+    except Exception:
+        # Not remembered, so the config is retried next time
+        return compile_weights({}, 0.4)
+    compiled = compile_weights(credibility_weights, default_weight)
+    _DOMAIN_WEIGHTS[domain] = compiled
+    return compiled
+
 
 def get_domain_weight(url: str, credibility_weights: dict = None, default_weight: float = 0.4) -> float:
     """
     Get credibility weight for a URL.
     First checks domain-specific YAML config, then falls back to hardcoded defaults.
     """
-    if not url:
-        return default_weight
-
-    domain = urlparse(url).netloc.lower()
-    
-    # Remove www. prefix for matching
-    if domain.startswith("www."):
-        domain = domain[4:]
-
-    # Check domain-specific weights from YAML first
-    if credibility_weights:
-        # Check exact domain match
-        if domain in credibility_weights:
-            return credibility_weights[domain]
-        
-        # Check partial matches (e.g., "wikipedia.org" matches "en.wikipedia.org")
-        for trusted_domain, weight in credibility_weights.items():
-            if trusted_domain != "default" and trusted_domain in domain:
-                return weight
-
-    # Fallback to hardcoded defaults (for backward compatibility)
-    if "wikipedia.org" in domain:
-        return 1.0
-
-    if "britannica.com" in domain:
-        return 0.95
-
-    if domain.endswith(".gov") or domain.endswith(".edu"):
-        return 0.95
-
-    trusted_news = [
-        "bbc.com",
-        "reuters.com",
-        "nytimes.com",
-        "theguardian.com",
-        "aljazeera.com"
-    ]
-
-    for site in trusted_news:
-        if site in domain:
-            return 0.85
-
-    if "medium.com" in domain or "blog" in domain:
-        return 0.6
-
-    return default_weight
+    return compile_weights(credibility_weights, default_weight).weight(url)
@@ -0,0 +1,35 @@
+def compute_verdict(
+    similarity_score: float,
+    credibility_score: float,
+    citation_count: int,
+    has_contradiction: bool,
+    domain_cfg: dict
+) -> tuple[float, str]:
+    """
+    Combine the evidence signals into the final score and status.
+    Returns: (final_score, status)
+    """
+    # Compute final score with improved formula
+    # Weight similarity more heavily, but still consider credibility
+    # If we have citations, boost the score slightly
+    base_score = similarity_score * 0.7 + (similarity_score * credibility_score) * 0.3
+    
+    # Boost if we have multiple credible sources
+    if citation_count > 0:
+        citation_boost = min(citation_count * 0.05, 0.15)  # Max 15% boost
+        base_score = min(base_score + citation_boost, 1.0)
+    
+    final_score = round(base_score, 2)
+    
+    if has_contradiction:
+        final_score = round(final_score * domain_cfg["contradiction_penalty"], 2)
+
+    # Determine verification status with adjusted threshold
+    # Lower the threshold slightly if we have good citations
+    adjusted_threshold = domain_cfg["similarity_threshold"]
+    if citation_count >= 3 and credibility_score > 0.7:
+        adjusted_threshold = domain_cfg["similarity_threshold"] * 0.9  # 10% lower threshold
+    
+    status = "verified" if final_score >= adjusted_threshold else "hallucinated"
+    
+    return final_score, status
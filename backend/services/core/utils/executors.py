@@ -0,0 +1,118 @@
+"""
+Dedicated, bounded thread pools per pipeline stage.
+Blocking I/O and CPU-bound model inference get separate executors so slow
+searches can't starve inference and inference threads don't oversubscribe
+torch's own thread pool.
+"""
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from services.config.settings import IO_EXECUTOR_WORKERS, CPU_EXECUTOR_WORKERS
+
+logger = logging.getLogger(__name__)
+
+IO_STAGE = "io"
+CPU_STAGE = "cpu"
+
+
+class InstrumentedExecutor:
+    """ThreadPoolExecutor that tracks queue depth, active workers and busy time."""
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max(max_workers, 1)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"{name}-stage")
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self.queued = 0
+        self.active = 0
+        self.completed = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+
+    def _run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        with self._lock:
+            self.queued -= 1
+            self.active += 1
+        started = time.monotonic()
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            elapsed = time.monotonic() - started
+            with self._lock:
+                self.active -= 1
+                self.completed += 1
+                self.busy_seconds += elapsed
+
+    def submit(self, func: Callable[..., Any], *args, **kwargs) -> Future:
+        with self._lock:
+            self.queued += 1
+        future = self._executor.submit(self._run, func, *args, **kwargs)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: Future):
+        # A future cancelled while queued never reaches _run
+        if future.cancelled():
+            with self._lock:
+                self.queued -= 1
+
+    def metrics(self) -> Dict:
+        with self._lock:
+            uptime = max(time.monotonic() - self._started, 1e-9)
+            return {
+                "workers": self.max_workers,
+                "queue_depth": self.queued,
+                "active": self.active,
+                "completed": self.completed,
+                "failed": self.failed,
+                "utilization": round(self.active / self.max_workers, 2),
+                "avg_utilization": round(self.busy_seconds / (uptime * self.max_workers), 3),
+            }
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
+
+
+_EXECUTORS: Dict[str, InstrumentedExecutor] = {}
+_EXECUTORS_LOCK = threading.Lock()
+_EXECUTOR_SIZES = {
+    IO_STAGE: IO_EXECUTOR_WORKERS,
+    CPU_STAGE: CPU_EXECUTOR_WORKERS,
+}
+
+def get_executor(stage: str) -> InstrumentedExecutor:
+    """Return the executor for a stage ("io" or "cpu")."""
+    executor = _EXECUTORS.get(stage)
+    if executor is None:
+        if stage not in _EXECUTOR_SIZES:
+            raise ValueError(f"Unknown executor stage: {stage}")
+        with _EXECUTORS_LOCK:
+            executor = _EXECUTORS.get(stage)
+            if executor is None:
+                executor = InstrumentedExecutor(stage, _EXECUTOR_SIZES[stage])
+                _EXECUTORS[stage] = executor
+    return executor
+
+async def run_in_stage(stage: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking function on the stage's executor and await the result."""
+    future = get_executor(stage).submit(func, *args, **kwargs)
+    return await asyncio.wrap_future(future)
+
+def get_executor_metrics() -> Dict[str, Dict]:
+    return {stage: executor.metrics() for stage, executor in list(_EXECUTORS.items())}
+
+def shutdown_executors(wait: bool = False):
+    with _EXECUTORS_LOCK:
+        executors = list(_EXECUTORS.values())
+        _EXECUTORS.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait)
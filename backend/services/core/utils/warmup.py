@@ -0,0 +1,160 @@
+"""
+Startup warmup and readiness tracking.
+After startup, warmup loads the domain YAMLs and the configured models in
+the background and runs a dummy batch through each, so the first real
+request doesn't pay for downloading and loading them. GET /ready reports
+the load state of every component.
+"""
+import asyncio
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+
+from services.config.settings import WARMUP_ENABLED, WARMUP_MODELS, WARMUP_DOMAINS, missing_required_settings
+from services.config.domain_loader import list_domains, load_domain_config
+from services.core.utils.executors import run_in_stage, CPU_STAGE
+
+logger = logging.getLogger(__name__)
+
+# Component states
+PENDING = "pending"
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+
+# Texts pushed through each embedding model
+WARMUP_TEXTS = [
+    "Warming up the embedding model.",
+    "The quick brown fox jumps over the lazy dog.",
+]
+
+
+def _is_required(component: str) -> bool:
+    """
+    Whether a failed component leaves the service unable to verify claims.
+    The sentiment and reasoning models have deterministic fallbacks, so
+    their failure only degrades results.
+    """
+    return component == "domains" or component.startswith("embedding:")
+
+
+class Readiness:
+    """Thread-safe per-component load state."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._components: Dict[str, Dict] = {}
+        self._finished = False
+
+    def set(self, component: str, state: str, error: str | None = None, seconds: float | None = None):
+        entry = {"state": state}
+        if error is not None:
+            entry["error"] = error
+        if seconds is not None:
+            entry["seconds"] = round(seconds, 2)
+        with self._lock:
+            self._components[component] = entry
+
+    def finish(self):
+        with self._lock:
+            self._finished = True
+
+    def report(self) -> Tuple[bool, Dict]:
+        """
+        Return (ready, details). Ready once required settings are present
+        and warmup finished without a required component failing.
+        """
+        missing = missing_required_settings()
+        with self._lock:
+            components = {name: dict(entry) for name, entry in self._components.items()}
+            finished = self._finished
+
+        failed = [name for name, entry in components.items() if entry["state"] == FAILED]
+        ready = not missing and finished and not any(_is_required(name) for name in failed)
+
+        if not ready:
+            status = "not_ready"
+        elif failed:
+            status = "degraded"
+        else:
+            status = "ready"
+
+        return ready, {
+            "status": status,
+            "warmup": "finished" if finished else "running",
+            "missing_settings": missing,
+            "components": components,
+        }
+
+
+def _load_domain_configs():
+    for domain in list_domains():
+        load_domain_config(domain)
+
+
+def _warm_up_embedding(domain: str) -> Callable[[], None]:
+    def warm_up():
+        from services.core.verification.embedding_service import encode_texts
+        encode_texts(WARMUP_TEXTS, domain)
+    return warm_up
+
+
+def _warm_up_sentiment():
+    from services.core.claims.sentiment_analyzer import warm_up_sentiment_model
+    warm_up_sentiment_model()
+
+
+def _warm_up_reasoner():
+    from services.core.llm.reasoner import warm_up_reasoning_model
+    warm_up_reasoning_model()
+
+
+def _warmup_steps() -> List[Tuple[str, Callable[[], None]]]:
+    """(component, loader) pairs, in the order they are warmed up."""
+    steps = [("domains", _load_domain_configs)]
+    if "embedding" in WARMUP_MODELS:
+        steps += [(f"embedding:{domain}", _warm_up_embedding(domain)) for domain in WARMUP_DOMAINS]
+    if "sentiment" in WARMUP_MODELS:
+        steps.append(("sentiment", _warm_up_sentiment))
+    if "reasoner" in WARMUP_MODELS:
+        steps.append(("reasoner", _warm_up_reasoner))
+    return steps
+
+
+async def _run_warmup(readiness: Readiness, steps: List[Tuple[str, Callable[[], None]]]):
+    started_at = time.perf_counter()
+    for component, load in steps:
+        readiness.set(component, LOADING)
+        step_started_at = time.perf_counter()
+        try:
+            # One at a time on the CPU stage, so warmup never blocks the event loop
+            await run_in_stage(CPU_STAGE, load)
+        except Exception as e:
+            logger.error(f"Warmup of {component} failed: {e}")
+            readiness.set(component, FAILED, error=str(e), seconds=time.perf_counter() - step_started_at)
+        else:
+            readiness.set(component, READY, seconds=time.perf_counter() - step_started_at)
+
+    readiness.finish()
+    logger.info(f"Warmup finished in {time.perf_counter() - started_at:.1f}s")
+
+
+_READINESS = Readiness()
+
+def get_readiness() -> Readiness:
+    return _READINESS
+
+def start_warmup() -> asyncio.Task | None:
+    """
+    Register the warmup components as pending and start warming them up in
+    the background. Returns the task, or None if warmup is disabled.
+    """
+    if not WARMUP_ENABLED:
+        _READINESS.finish()
+        return None
+
+    steps = _warmup_steps()
+    for component, _ in steps:
+        _READINESS.set(component, PENDING)
+    return asyncio.create_task(_run_warmup(_READINESS, steps))
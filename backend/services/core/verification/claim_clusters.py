@@ -0,0 +1,103 @@
+"""
+Near-duplicate claim clustering before verification.
+Documents often repeat the same fact in slightly different words. Claims are
+embedded a batch at a time, with one encode per embedding model, and each one
+joins the cluster of the earlier representative of its domain it is most
+similar to, if that cosine similarity reaches the threshold; otherwise it
+starts a new cluster. Claims only share a cluster if they state the same
+numbers and negations: embeddings barely separate "boils at 100 °C" from
+"boils at 90 °C", or a claim from its negation. Only representatives are
+verified, and the other members get a copy of their representative's verdict.
+"""
+import logging
+import re
+from collections import defaultdict
+from typing import Dict, List
+
+from services.config.settings import CLAIM_CLUSTER_THRESHOLD
+from services.core.verification.embedding_index import EmbeddingIndex
+from services.core.verification.embedding_service import encode_texts
+from services.core.verification.model_registry import group_by_model
+from services.core.verification.single_flight import share_result
+
+logger = logging.getLogger(__name__)
+
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)*")
+_WORD = re.compile(r"[a-z]+(?:'[a-z]+)?")
+_NEGATIONS = {"not", "no", "never", "none", "nor", "neither", "nobody", "nothing", "nowhere", "cannot", "without"}
+
+
+def claim_signature(claim: str) -> tuple:
+    """The numbers and negation words a claim states; near-duplicates must agree on both."""
+    lowered = claim.lower().replace("\u2019", "'")
+    numbers = sorted(number.replace(",", "") for number in _NUMBER.findall(lowered))
+    negations = sorted(
+        "not" if word.endswith("n't") else word
+        for word in _WORD.findall(lowered)
+        if word in _NEGATIONS or word.endswith("n't")
+    )
+    return tuple(numbers), tuple(negations)
+
+
+class ClaimClusterer:
+    """
+    Incremental (leader) clustering of one document's claims, per domain and
+    signature: claims routed to different domains, or stating different
+    numbers or negations, never share a verdict.
+    Claims are numbered in the order they are assigned, across calls.
+    """
+
+    def __init__(self, threshold: float = CLAIM_CLUSTER_THRESHOLD):
+        self.threshold = threshold
+        self._representatives: Dict[tuple, EmbeddingIndex] = defaultdict(EmbeddingIndex)
+        self.count = 0
+
+    def assign(self, claims: List[str], domains: List[str]) -> List[int | None]:
+        """
+        Cluster a batch of claims, given each claim's domain. Returns, per
+        claim, the number of the representative it duplicates, or None if it
+        is a representative itself and has to be verified.
+        """
+        start = self.count
+        self.count += len(claims)
+        assignments: List[int | None] = [None] * len(claims)
+
+        for positions in group_by_model(domains).values():
+            try:
+                embeddings = encode_texts([claims[i] for i in positions], domains[positions[0]])
+            except Exception as e:
+                logger.warning(f"Claim clustering failed, verifying these claims separately: {e}")
+                continue
+
+            for i, vector in zip(positions, embeddings):
+                index = self._representatives[domains[i], claim_signature(claims[i])]
+                representative, similarity = index.search(vector)
+                if representative is not None and similarity >= self.threshold:
+                    assignments[i] = representative
+                else:
+                    index.add(start + i, vector)
+        return assignments
+
+
+def get_claim_clusterer() -> ClaimClusterer | None:
+    """A clusterer for one document, or None when clustering is disabled."""
+    if CLAIM_CLUSTER_THRESHOLD <= 0:
+        return None
+    return ClaimClusterer()
+
+
+def copy_verdict(result: Dict, claim: str, representative: int) -> Dict:
+    """A member's result: its representative's verdict, with the member's own claim text."""
+    result = share_result(result, claim)
+    result["duplicate_of"] = representative
+    return result
+
+
+def clustering_summary(results: List[Dict]) -> Dict:
+    """Per-document clustering report: claims, clusters verified and searches saved."""
+    duplicates = sum(1 for result in results if result and result.get("duplicate_of") is not None)
+    return {
+        "claims": len(results),
+        "clusters": len(results) - duplicates,
+        "searches_saved": duplicates,
+    }
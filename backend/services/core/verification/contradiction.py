@@ -1,32 +1,26 @@
-from services.core.verification.semantic import compute_similarity
+from services.core.verification.evidence import ClaimEvidence
 
 def detect_contradiction(
     snippets: list[str],
     domain: str,
-    contradiction_threshold: float
+    contradiction_threshold: float,
+    evidence: ClaimEvidence | None = None
 ) -> bool:
     """
     Detect contradictions by comparing semantic similarity between snippets.
     Low similarity between sources suggests contradiction.
+    Reuses the claim's evidence embeddings when provided.
     """
     if len(snippets) < 2:
         return False
 
-    base = snippets[0]
-    others = snippets[1:]
+    if evidence is None:
+        evidence = ClaimEvidence.build("", snippets, domain)
 
-    # Compute similarity between base and each other snippet
+    # Average similarity between the first snippet and each other snippet
     # If average similarity is below threshold, there's a contradiction
-    similarities = []
-    for other in others:
-        try:
-            sim = compute_similarity(base, [other], domain)
-            similarities.append(sim)
-        except Exception:
-            continue
-
-    if not similarities:
+    avg_similarity = evidence.base_agreement()
+    if avg_similarity is None:
         return False
 
-    avg_similarity = sum(similarities) / len(similarities)
     return avg_similarity < contradiction_threshold
@@ -0,0 +1,144 @@
+"""
+Contiguous in-memory embedding index for cosine-similarity lookups.
+Stores L2-normalized vectors in a single NumPy matrix so a lookup is one
+matrix-vector product plus argmax, regardless of how many entries are stored.
+"""
+import logging
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Initial number of rows allocated per index (grows by doubling)
+INITIAL_CAPACITY = 64
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows so dot products are cosine similarities."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class EmbeddingIndex:
+    """
+    Slot-based embedding matrix keyed by arbitrary hashable keys.
+
+    Removed entries free their row, which is reused by the next insert,
+    so the matrix never grows past the peak number of live entries.
+    """
+
+    def __init__(self, dim: int | None = None, capacity: int = INITIAL_CAPACITY):
+        self._dim = dim
+        self._capacity = capacity
+        self._matrix = None if dim is None else np.zeros((capacity, dim), dtype=np.float32)
+        self._active = np.zeros(capacity, dtype=bool)
+        self._keys: List[Hashable | None] = [None] * capacity
+        self._slots: Dict[Hashable, int] = {}
+        self._free: List[int] = []
+        self._size = 0  # High-water mark of used rows
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._slots
+
+    def keys(self) -> Iterable[Hashable]:
+        return self._slots.keys()
+
+    def _grow(self, min_capacity: int):
+        """Double the matrix until it holds at least min_capacity rows."""
+        new_capacity = max(self._capacity, 1)
+        while new_capacity < min_capacity:
+            new_capacity *= 2
+        if new_capacity == self._capacity and self._matrix is not None:
+            return
+
+        matrix = np.zeros((new_capacity, self._dim), dtype=np.float32)
+        active = np.zeros(new_capacity, dtype=bool)
+        if self._matrix is not None:
+            matrix[:self._size] = self._matrix[:self._size]
+            active[:self._size] = self._active[:self._size]
+        self._keys.extend([None] * (new_capacity - self._capacity))
+        self._matrix = matrix
+        self._active = active
+        self._capacity = new_capacity
+
+    def _next_slot(self) -> int:
+        if self._free:
+            return self._free.pop()
+        if self._size >= self._capacity:
+            self._grow(self._size + 1)
+        slot = self._size
+        self._size += 1
+        return slot
+
+    def add(self, key: Hashable, vector: np.ndarray):
+        """Insert or overwrite the embedding stored for key."""
+        self.add_many([key], np.asarray(vector)[None, :])
+
+    def add_many(self, keys: List[Hashable], vectors: np.ndarray):
+        """Insert several embeddings at once (rows of vectors align with keys)."""
+        if not keys:
+            return
+
+        vectors = _normalize(vectors)
+        if self._dim is None:
+            self._dim = vectors.shape[1]
+            self._grow(self._capacity)
+        elif vectors.shape[1] != self._dim:
+            raise ValueError(f"Embedding dimension {vectors.shape[1]} does not match index dimension {self._dim}")
+
+        for key, vector in zip(keys, vectors):
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._next_slot()
+                self._slots[key] = slot
+                self._keys[slot] = key
+                self._active[slot] = True
+            self._matrix[slot] = vector
+
+    def remove(self, key: Hashable) -> bool:
+        """Remove key from the index, freeing its row for reuse."""
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return False
+
+        self._active[slot] = False
+        self._keys[slot] = None
+        self._free.append(slot)
+
+        # Everything removed: reset so the matrix prefix stays compact
+        if not self._slots:
+            self.clear()
+        return True
+
+    def clear(self):
+        """Drop all entries but keep the allocated matrix."""
+        self._slots.clear()
+        self._free.clear()
+        self._keys = [None] * self._capacity
+        self._active[:] = False
+        self._size = 0
+
+    def search(self, vector: np.ndarray) -> Tuple[Hashable | None, float]:
+        """
+        Return (key, cosine_similarity) of the closest stored embedding.
+        Returns (None, 0.0) when the index is empty.
+        """
+        if not self._slots:
+            return None, 0.0
+
+        query = _normalize(vector).reshape(-1)
+        if query.shape[0] != self._dim:
+            raise ValueError(f"Query dimension {query.shape[0]} does not match index dimension {self._dim}")
+
+        scores = self._matrix[:self._size] @ query
+        if len(self._slots) < self._size:
+            scores[~self._active[:self._size]] = -np.inf
+
+        best = int(np.argmax(scores))
+        return self._keys[best], float(scores[best])
@@ -0,0 +1,201 @@
+"""
+Central micro-batching service in front of the embedding models.
+Encode requests from all in-flight claims and requests are queued per
+model and flushed as one batch when the batch is full or a short window
+expires, so the model sees large batches and only one thread drives it.
+"""
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List
+
+import numpy as np
+
+from services.config.settings import EMBEDDING_BATCH_MAX_SIZE, EMBEDDING_BATCH_WINDOW_MS
+from services.core.verification.model_registry import use_embedding_model, resolve_model_key
+from services.core.inference.worker_pool import get_inference_pool
+
+logger = logging.getLogger(__name__)
+
+
+class _EncodeRequest:
+    def __init__(self, texts: List[str], domain: str):
+        self.texts = texts
+        self.domain = domain
+        self.future: Future = Future()
+
+
+class _ModelBatcher:
+    """Queue and worker thread for a single embedding model."""
+
+    def __init__(self, model_name: str, max_batch_size: int, window_seconds: float):
+        self.model_name = model_name
+        self.max_batch_size = max_batch_size
+        self.window_seconds = window_seconds
+        self._queue: "queue.Queue[_EncodeRequest]" = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self.batches = 0
+        self.texts = 0
+        self.requests = 0
+        self.max_batch = 0
+        self.last_batch = 0
+        self.errors = 0
+        self._dispatcher: ThreadPoolExecutor | None = None
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"embedding-batcher-{model_name}",
+            daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, texts: List[str], domain: str) -> Future:
+        request = _EncodeRequest(texts, domain)
+        self._queue.put(request)
+        return request.future
+
+    def _collect(self) -> List[_EncodeRequest]:
+        """Block for one request, then gather more until full or the window expires."""
+        batch = [self._queue.get()]
+        size = len(batch[0].texts)
+        deadline = time.monotonic() + self.window_seconds
+
+        while size < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(request)
+            size += len(request.texts)
+
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            pool = get_inference_pool()
+            if pool is not None:
+                # Keep collecting while worker processes encode; one batch per worker
+                self._get_dispatcher(pool.num_workers).submit(self._flush, batch, pool)
+            else:
+                self._flush(batch, None)
+
+    def _get_dispatcher(self, workers: int) -> ThreadPoolExecutor:
+        if self._dispatcher is None:
+            self._dispatcher = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix=f"embedding-dispatch-{self.model_name}"
+            )
+        return self._dispatcher
+
+    def _flush(self, batch: List[_EncodeRequest], pool):
+        """Encode one collected batch and hand each caller its rows."""
+        texts = [text for request in batch for text in request.texts]
+        encode_kwargs = {
+            "convert_to_numpy": True,
+            "normalize_embeddings": True,
+            "show_progress_bar": False,
+            # One forward pass per batch, but an oversized request is split
+            "batch_size": max(min(len(texts), self.max_batch_size), 1),
+        }
+
+        try:
+            if pool is not None:
+                embeddings = pool.encode(batch[0].domain, texts, **encode_kwargs)
+            else:
+                with use_embedding_model(batch[0].domain) as model:
+                    embeddings = model.encode(texts, **encode_kwargs)
+            embeddings = np.asarray(embeddings, dtype=np.float32)
+        except Exception as e:
+            logger.error(f"Batched encode failed for {self.model_name}: {e}")
+            with self._stats_lock:
+                self.errors += 1
+            for request in batch:
+                request.future.set_exception(e)
+            return
+
+        offset = 0
+        for request in batch:
+            count = len(request.texts)
+            request.future.set_result(embeddings[offset:offset + count])
+            offset += count
+
+        with self._stats_lock:
+            self.batches += 1
+            self.requests += len(batch)
+            self.texts += len(texts)
+            self.last_batch = len(texts)
+            self.max_batch = max(self.max_batch, len(texts))
+
+    def metrics(self) -> Dict:
+        with self._stats_lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "batches": self.batches,
+                "requests": self.requests,
+                "texts": self.texts,
+                "avg_batch_size": round(self.texts / self.batches, 2) if self.batches else 0.0,
+                "max_batch_size": self.max_batch,
+                "last_batch_size": self.last_batch,
+                "errors": self.errors,
+            }
+
+
+class EmbeddingService:
+    """Routes encode calls to one batcher per resolved model (name and backend)."""
+
+    def __init__(self, max_batch_size: int = EMBEDDING_BATCH_MAX_SIZE, window_ms: float = EMBEDDING_BATCH_WINDOW_MS):
+        self.max_batch_size = max_batch_size
+        self.window_seconds = window_ms / 1000.0
+        self._batchers: Dict[str, _ModelBatcher] = {}
+        self._lock = threading.Lock()
+
+    def _get_batcher(self, model_name: str) -> _ModelBatcher:
+        batcher = self._batchers.get(model_name)
+        if batcher is None:
+            with self._lock:
+                batcher = self._batchers.get(model_name)
+                if batcher is None:
+                    batcher = _ModelBatcher(model_name, self.max_batch_size, self.window_seconds)
+                    self._batchers[model_name] = batcher
+        return batcher
+
+    def encode(self, texts: List[str], domain: str = "general") -> np.ndarray:
+        """
+        Encode texts with the domain's embedding model.
+        Returns L2-normalized float32 embeddings, one row per text.
+        """
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        batcher = self._get_batcher(resolve_model_key(domain))
+        return batcher.submit(list(texts), domain).result()
+
+    def metrics(self) -> Dict[str, Dict]:
+        """Per-model queue depth and batch-size metrics."""
+        with self._lock:
+            batchers = dict(self._batchers)
+        return {model_name: batcher.metrics() for model_name, batcher in batchers.items()}
+
+
+_SERVICE = None
+_SERVICE_LOCK = threading.Lock()
+
+def get_embedding_service() -> EmbeddingService:
+    global _SERVICE
+    if _SERVICE is None:
+        with _SERVICE_LOCK:
+            if _SERVICE is None:
+                _SERVICE = EmbeddingService()
+    return _SERVICE
+
+def encode_texts(texts: List[str], domain: str = "general") -> np.ndarray:
+    """Encode texts through the shared micro-batching service."""
+    return get_embedding_service().encode(texts, domain)
+
+def get_embedding_metrics() -> Dict[str, Dict]:
+    return get_embedding_service().metrics()
@@ -0,0 +1,54 @@
+"""
+Per-claim evidence bundle.
+Encodes a claim and its search snippets exactly once so similarity and
+contradiction checks share a single embedding matrix.
+"""
+import numpy as np
+from services.core.verification.embedding_service import encode_texts
+
+
+class ClaimEvidence:
+    """
+    Claim + snippet embeddings for one verification.
+
+    Row 0 of the embedding matrix is the claim, rows 1..N are the snippets.
+    Embeddings are L2-normalized, so dot products are cosine similarities.
+    """
+
+    def __init__(self, claim: str, snippets: list[str], embeddings: np.ndarray):
+        self.claim = claim
+        self.snippets = snippets
+        self.embeddings = embeddings
+
+    @classmethod
+    def build(cls, claim: str, snippets: list[str], domain: str) -> "ClaimEvidence":
+        """Encode claim and snippets in a single batched request."""
+        if not snippets:
+            return cls(claim, [], np.zeros((0, 0), dtype=np.float32))
+
+        embeddings = encode_texts([claim] + list(snippets), domain)
+        return cls(claim, snippets, embeddings)
+
+    @property
+    def claim_embedding(self) -> np.ndarray:
+        return self.embeddings[0]
+
+    @property
+    def snippet_embeddings(self) -> np.ndarray:
+        return self.embeddings[1:]
+
+    def similarity(self) -> float:
+        """Max cosine similarity between the claim and any snippet."""
+        if not self.snippets:
+            return 0.0
+        return float((self.snippet_embeddings @ self.claim_embedding).max())
+
+    def base_agreement(self) -> float | None:
+        """
+        Average similarity between the first snippet and every other one.
+        Returns None with fewer than two snippets.
+        """
+        if len(self.snippets) < 2:
+            return None
+        snippets = self.snippet_embeddings
+        return float((snippets[1:] @ snippets[0]).mean())
@@ -1,7 +1,12 @@
-from sentence_transformers import SentenceTransformer
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, List
 from services.config.domain_loader import load_domain_config
+from services.core.inference.model_manager import get_model_manager
 import logging
 
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
 logger = logging.getLogger(__name__)
 
 # Fallback registry (used if YAML doesn't specify embedding_model)
@@ -14,12 +19,15 @@ FALLBACK_MODEL_REGISTRY = {
     "science": "sentence-transformers/all-MiniLM-L6-v2",
 }
 
-_MODEL_CACHE = {}
+# Inference backends selectable per domain YAML (embedding_backend):
+# "torch" (fp32), "int8" (dynamic-quantized torch Linear layers) or "onnx" (ONNX Runtime)
+EMBEDDING_BACKENDS = ("torch", "int8", "onnx")
+DEFAULT_EMBEDDING_BACKEND = "torch"
 
-def get_embedding_model(domain: str) -> SentenceTransformer:
+def resolve_model_name(domain: str) -> str:
     """
-    Load and cache pretrained embedding models per domain.
-    First tries to load from domain YAML config, falls back to registry.
+    Resolve the embedding model name for a domain.
+    First tries the domain YAML config, falls back to registry.
     """
     try:
         domain_cfg = load_domain_config(domain)
@@ -32,18 +40,111 @@ def get_embedding_model(domain: str) -> SentenceTransformer:
         logger.warning(f"Failed to load domain config for {domain}, using fallback: {e}")
         model_name = FALLBACK_MODEL_REGISTRY.get(domain, FALLBACK_MODEL_REGISTRY["general"])
 
-    if model_name not in _MODEL_CACHE:
+    return model_name
+
+
+def resolve_embedding_backend(domain: str) -> tuple[str, str | None]:
+    """
+    Resolve the inference backend for a domain from its YAML config.
+    Returns: (backend, onnx_file_name); onnx_file_name is only set for
+    "onnx" when the YAML picks a specific (e.g. pre-quantized) export.
+    """
+    try:
+        domain_cfg = load_domain_config(domain)
+    except Exception:
+        return DEFAULT_EMBEDDING_BACKEND, None
+
+    backend = str(domain_cfg.get("embedding_backend", DEFAULT_EMBEDDING_BACKEND)).lower()
+    if backend not in EMBEDDING_BACKENDS:
+        logger.warning(f"Unknown embedding backend '{backend}' for domain {domain}, using {DEFAULT_EMBEDDING_BACKEND}")
+        return DEFAULT_EMBEDDING_BACKEND, None
+
+    return backend, domain_cfg.get("onnx_file_name") if backend == "onnx" else None
+
+
+def model_key(model_name: str, backend: str = DEFAULT_EMBEDDING_BACKEND, onnx_file_name: str | None = None) -> str:
+    """Identify a loaded model: the same weights on another backend are a different model."""
+    if backend == DEFAULT_EMBEDDING_BACKEND:
+        return model_name
+    if onnx_file_name:
+        return f"{model_name}#{backend}:{onnx_file_name}"
+    return f"{model_name}#{backend}"
+
+
+def resolve_model_key(domain: str) -> str:
+    """Model key (name and backend) used to encode texts for a domain."""
+    return model_key(resolve_model_name(domain), *resolve_embedding_backend(domain))
+
+
+def group_by_model(domains: List[str]) -> Dict[str, List[int]]:
+    """Positions of domains (e.g. one per claim) grouped by model key, in order."""
+    groups: Dict[str, List[int]] = {}
+    for i, domain in enumerate(domains):
+        groups.setdefault(resolve_model_key(domain), []).append(i)
+    return groups
+
+
+def load_embedding_model(model_name: str, backend: str = DEFAULT_EMBEDDING_BACKEND, onnx_file_name: str | None = None) -> "SentenceTransformer":
+    """Load (without caching) a CPU embedding model on the given backend."""
+    # Imported on first load: pulls in torch and transformers
+    from sentence_transformers import SentenceTransformer
+
+    if backend == "onnx":
+        # Exports to ONNX on first use unless the repo ships one; needs optimum[onnxruntime]
+        model_kwargs = {"file_name": onnx_file_name} if onnx_file_name else None
+        return SentenceTransformer(model_name, device='cpu', backend="onnx", model_kwargs=model_kwargs)
+
+    # CPU-only for stability
+    model = SentenceTransformer(model_name, device='cpu')
+    if backend == "int8":
+        import torch
+        # Weights of Linear layers stored as int8, activations quantized on the fly
+        torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+    return model
+
+
+def _acquire_embedding_model(domain: str) -> tuple[str, "SentenceTransformer"]:
+    """
+    Pin the domain's embedding model in the model manager, loading it if needed.
+    The backend comes from the YAML's embedding_backend; if it fails to load,
+    the fp32 torch model is used, then the general model.
+    Returns: (manager name, model)
+    """
+    model_name = resolve_model_name(domain)
+    backend, onnx_file_name = resolve_embedding_backend(domain)
+    key = model_key(model_name, backend, onnx_file_name)
+
+    candidates = [(key, lambda: load_embedding_model(model_name, backend, onnx_file_name))]
+    for fallback_model in (model_name, FALLBACK_MODEL_REGISTRY["general"]):
+        if fallback_model not in [name for name, _ in candidates]:
+            candidates.append((fallback_model, lambda name=fallback_model: load_embedding_model(name)))
+
+    manager = get_model_manager()
+    for index, (name, loader) in enumerate(candidates):
         try:
-            # CPU-only for stability
-            model = SentenceTransformer(model_name, device='cpu')
-            _MODEL_CACHE[model_name] = model
-            logger.info(f"Loaded embedding model: {model_name} for domain: {domain}")
+            return name, manager.acquire(name, loader)
         except Exception as e:
-            logger.error(f"Failed to load model {model_name}: {e}")
-            # Fallback to general model
-            fallback_model = FALLBACK_MODEL_REGISTRY["general"]
-            if fallback_model not in _MODEL_CACHE:
-                _MODEL_CACHE[fallback_model] = SentenceTransformer(fallback_model, device='cpu')
-            return _MODEL_CACHE[fallback_model]
-
-    return _MODEL_CACHE[model_name]
+            if index == len(candidates) - 1:
+                raise
+            logger.error(f"Failed to load model {name} for domain {domain}, falling back: {e}")
+
+
+@contextmanager
+def use_embedding_model(domain: str) -> Iterator["SentenceTransformer"]:
+    """Pin the domain's embedding model for the duration of a with block."""
+    name, model = _acquire_embedding_model(domain)
+    try:
+        yield model
+    finally:
+        get_model_manager().release(name)
+
+
+def get_embedding_model(domain: str) -> "SentenceTransformer":
+    """
+    Load pretrained embedding models per domain (cached in the model manager).
+    First tries to load from domain YAML config, falls back to registry.
+    Not pinned: prefer use_embedding_model while encoding, so the model
+    can't be evicted mid-call.
+    """
+    with use_embedding_model(domain) as model:
+        return model
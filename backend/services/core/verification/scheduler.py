@@ -0,0 +1,152 @@
+"""
+Adaptive concurrency control for claim verification.
+A sliding window of in-flight claims whose size follows AIMD: it grows
+by about one slot per window of healthy searches and is cut
+multiplicatively on Tavily 429s, errors or search latency above target.
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Dict
+
+from services.config.settings import (
+    VERIFY_CONCURRENCY_MIN,
+    VERIFY_CONCURRENCY_MAX,
+    VERIFY_CONCURRENCY_INITIAL,
+    VERIFY_TARGET_SEARCH_LATENCY,
+)
+
+logger = logging.getLogger(__name__)
+
+# Multiplicative decrease factor on congestion
+DECREASE_FACTOR = 0.5
+
+# Minimum seconds between decreases, so one burst of 429s counts once
+DECREASE_COOLDOWN = 2.0
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limiter for asyncio.
+    acquire()/release() gate work; record_*() feed back search outcomes.
+    """
+
+    def __init__(
+        self,
+        min_limit: int = VERIFY_CONCURRENCY_MIN,
+        max_limit: int = VERIFY_CONCURRENCY_MAX,
+        initial_limit: int = VERIFY_CONCURRENCY_INITIAL,
+        target_latency: float = VERIFY_TARGET_SEARCH_LATENCY,
+    ):
+        self.min_limit = max(min_limit, 1)
+        self.max_limit = max(max_limit, self.min_limit)
+        self.limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.target_latency = target_latency
+        self.in_flight = 0
+        self._waiters: deque = deque()
+        self._last_decrease = 0.0
+        self.successes = 0
+        self.rate_limited = 0
+        self.errors = 0
+        self.slow = 0
+        self.decreases = 0
+
+    async def acquire(self):
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed to us just as we got cancelled
+                self.release()
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+
+    def release(self):
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self):
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+
+    def _decrease(self, reason: str):
+        now = time.monotonic()
+        if now - self._last_decrease < DECREASE_COOLDOWN:
+            return
+        self._last_decrease = now
+        old_limit = self.limit
+        self.limit = max(self.min_limit, self.limit * DECREASE_FACTOR)
+        self.decreases += 1
+        logger.info(f"Verification concurrency {old_limit:.1f} -> {self.limit:.1f} ({reason})")
+
+    def record_success(self, latency: float):
+        """A search completed; grow the window unless it was too slow."""
+        self.successes += 1
+        if latency > self.target_latency:
+            self.slow += 1
+            self._decrease(f"search latency {latency:.1f}s")
+            return
+        # Additive increase: about +1 slot per full window of successes
+        self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+        self._wake()
+
+    def record_rate_limited(self):
+        self.rate_limited += 1
+        self._decrease("rate limited")
+
+    def record_error(self):
+        self.errors += 1
+        self._decrease("search error")
+
+    def metrics(self) -> Dict:
+        return {
+            "limit": round(self.limit, 2),
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "successes": self.successes,
+            "rate_limited": self.rate_limited,
+            "errors": self.errors,
+            "slow": self.slow,
+            "decreases": self.decreases,
+        }
+
+
+# One limiter per event loop (futures are loop-bound); shared by all requests
+# because the Tavily rate limit is shared too
+_limiter: AdaptiveLimiter | None = None
+_limiter_loop = None
+
+def get_claim_limiter() -> AdaptiveLimiter:
+    """Return the shared limiter for the running event loop."""
+    global _limiter, _limiter_loop
+    loop = asyncio.get_running_loop()
+    if _limiter is None or _limiter_loop is not loop:
+        _limiter = AdaptiveLimiter()
+        _limiter_loop = loop
+    return _limiter
+
+def get_scheduler_metrics() -> Dict:
+    return _limiter.metrics() if _limiter is not None else {}
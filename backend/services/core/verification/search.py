@@ -1,10 +1,18 @@
-from tavily import TavilyClient
 from services.config.settings import TAVILY_API_KEY
-from services.core.verification.search_cache import get_cached_or_search
+from services.core.verification.search_cache import get_cached_or_search, get_cached_or_search_async
+from services.core.verification.tavily_async import get_async_tavily_client
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Search parameters shared by the sync and async backends
+SEARCH_PARAMS = {
+    "search_depth": "advanced",  # Changed to advanced for better results
+    "max_results": 10,  # Increased for better coverage
+    "include_answer": True,  # Get direct answers if available
+    "include_raw_content": True  # Get more content
+}
+
 # Initialize Tavily client (lazy loading to handle import errors)
 _tavily_client = None
 
@@ -12,7 +20,12 @@ def _get_tavily_client():
     """Lazy load Tavily client."""
     global _tavily_client
     if _tavily_client is None:
+        if not TAVILY_API_KEY:
+            logger.error("TAVILY_API_KEY not set, web search is disabled")
+            return None
         try:
+            from tavily import TavilyClient
+
             _tavily_client = TavilyClient(api_key=TAVILY_API_KEY)
         except Exception as e:
             logger.error(f"Failed to initialize Tavily client: {e}")
@@ -20,9 +33,36 @@ def _get_tavily_client():
     return _tavily_client
 
 
+def _parse_search_response(response: dict) -> tuple[list[dict], list[str]]:
+    """Split a Tavily response into (citations, snippets)."""
+    citations = []
+    snippets = []
+
+    try:
+        results = response.get("results", [])
+        for result in results:
+            title = result.get("title", "")
+            url = result.get("url", "")
+            content = result.get("content", "")
+
+            if url:  # Only add if URL exists
+                citations.append({
+                    "title": title or "Untitled",
+                    "url": url
+                })
+
+            if content:
+                snippets.append(content)
+    except Exception as e:
+        logger.error(f"Error processing search results: {e}")
+        return citations, snippets
+
+    return citations, snippets
+
+
 def _perform_tavily_search(claim: str) -> tuple[list[dict], list[str]]:
     """
-    Internal function to perform actual Tavily search.
+    Internal function to perform actual Tavily search (blocking).
     
     Returns:
         tuple: (citations, snippets) where citations is a list of dicts with title/url,
@@ -37,47 +77,45 @@ def _perform_tavily_search(claim: str) -> tuple[list[dict], list[str]]:
         return [], []
 
     try:
-        # Use advanced search for better results
-        response = tavily.search(
-            query=claim,
-            search_depth="advanced",  # Changed to advanced for better results
-            max_results=10,  # Increased for better coverage
-            include_answer=True,  # Get direct answers if available
-            include_raw_content=True  # Get more content
-        )
+        response = tavily.search(query=claim, **SEARCH_PARAMS)
     except Exception as e:
         logger.error(f"Tavily search failed for claim '{claim[:50]}...': {e}")
         return [], []
 
-    citations = []
-    snippets = []
+    return _parse_search_response(response)
 
-    try:
-        results = response.get("results", [])
-        for result in results:
-            title = result.get("title", "")
-            url = result.get("url", "")
-            content = result.get("content", "")
 
-            if url:  # Only add if URL exists
-                citations.append({
-                    "title": title or "Untitled",
-                    "url": url
-                })
+async def _perform_tavily_search_async(claim: str) -> tuple[list[dict], list[str]]:
+    """
+    Internal function to perform actual Tavily search on the event loop,
+    over the shared rate-limited connection pool.
+    """
+    if not claim or not claim.strip():
+        return [], []
 
-            if content:
-                snippets.append(content)
+    if not TAVILY_API_KEY:
+        logger.error("TAVILY_API_KEY not set, web search is disabled")
+        return [], []
+
+    try:
+        response = await get_async_tavily_client().search(claim, **SEARCH_PARAMS)
     except Exception as e:
-        logger.error(f"Error processing search results: {e}")
-        return citations, snippets
+        logger.error(f"Tavily search failed for claim '{claim[:50]}...': {e}")
+        return [], []
 
-    return citations, snippets
+    return _parse_search_response(response)
 
 
-def search_web_for_claim(claim: str, domain: str = "general") -> tuple[list[dict], list[str]]:
+async def search_web_for_claim(claim: str, domain: str = "general") -> tuple[list[dict], list[str]]:
     """
     Search the web for a claim with intelligent caching.
     Uses semantic similarity to reuse similar searches.
     """
-    return get_cached_or_search(claim, domain, _perform_tavily_search)
+    return await get_cached_or_search_async(claim, domain, _perform_tavily_search_async)
+
 
+def search_web_for_claim_sync(claim: str, domain: str = "general") -> tuple[list[dict], list[str]]:
+    """
+    Blocking variant of search_web_for_claim for callers without an event loop.
+    """
+    return get_cached_or_search(claim, domain, _perform_tavily_search)
@@ -3,73 +3,172 @@ Enhanced caching for web searches to reduce redundant Tavily API calls.
 Uses semantic similarity to find similar cached searches.
 """
 import logging
+import threading
 from typing import List, Dict, Tuple
+import numpy as np
 from services.storage.cache import get_cached, set_cache
-from services.core.verification.model_registry import get_embedding_model
-from sentence_transformers import util
+from services.storage.disk_cache import get_disk_cache
+from services.config.settings import SEARCH_CACHE_TTL
+from services.core.verification.model_registry import resolve_model_key
+from services.core.verification.embedding_service import encode_texts
+from services.core.verification.embedding_index import EmbeddingIndex
+from services.core.utils.executors import run_in_stage, IO_STAGE
 
 logger = logging.getLogger(__name__)
 
 # Separate cache for search results (keyed by claim text)
+# Hot tier in front of the persistent disk cache
 _SEARCH_CACHE = {}
 
+# Disk cache namespace for search results
+SEARCH_NAMESPACE = "search"
+
+# Maximum number of cached searches (oldest evicted first)
+MAX_SEARCH_CACHE_SIZE = 500
+
+# Claim embeddings of cached searches, one contiguous index per embedding model and backend
+_EMBEDDING_INDEXES: Dict[str, EmbeddingIndex] = {}
+_INDEX_LOCK = threading.Lock()
+
 # Similarity threshold for reusing cached searches
 SIMILARITY_THRESHOLD = 0.85
 
-def _get_cached_search_similar(claim: str, domain: str = "general") -> Tuple[List[Dict], List[str]] | None:
+def _get_index(model_key: str) -> EmbeddingIndex:
+    index = _EMBEDDING_INDEXES.get(model_key)
+    if index is None:
+        index = _EMBEDDING_INDEXES.setdefault(model_key, EmbeddingIndex())
+    return index
+
+def _sync_index(index: EmbeddingIndex, domain: str):
+    """
+    Embed cached claims that are missing from this model's index
+    (e.g. cached under another domain's model) in one batched call.
+    """
+    if len(index) == len(_SEARCH_CACHE):
+        return
+    missing = [cached_claim for cached_claim in _SEARCH_CACHE if cached_claim not in index]
+    if missing:
+        index.add_many(missing, encode_texts(missing, domain))
+
+def _get_cached_search_similar(claim: str, domain: str = "general") -> Tuple[Tuple[List[Dict], List[str]] | None, np.ndarray | None]:
     """
     Find a similar cached search result using semantic similarity.
-    Returns cached (citations, snippets) if similar claim found, else None.
+    Returns (cached (citations, snippets) or None, the claim's embedding or
+    None); on a miss the embedding is reused when the new result is cached.
     """
     if not _SEARCH_CACHE:
-        return None
+        return None, None
     
+    claim_embedding = None
     try:
-        model = get_embedding_model(domain)
-        
-        claim_embedding = model.encode(claim, convert_to_tensor=True, show_progress_bar=False)
+        index = _get_index(resolve_model_key(domain))
         
-        best_match = None
-        best_similarity = 0.0
+        claim_embedding = encode_texts([claim], domain)[0]
         
-        # Check all cached searches
-        for cached_claim, cached_data in _SEARCH_CACHE.items():
-            try:
-                cached_embedding = model.encode(cached_claim, convert_to_tensor=True, show_progress_bar=False)
-                similarity = float(util.cos_sim(claim_embedding, cached_embedding)[0][0].item())
-                
-                if similarity > best_similarity and similarity >= SIMILARITY_THRESHOLD:
-                    best_similarity = similarity
-                    best_match = cached_data
-            except Exception as e:
-                logger.warning(f"Error comparing with cached search: {e}")
-                continue
+        with _INDEX_LOCK:
+            _sync_index(index, domain)
+            best_claim, best_similarity = index.search(claim_embedding)
+            best_match = _SEARCH_CACHE.get(best_claim) if best_similarity >= SIMILARITY_THRESHOLD else None
         
         if best_match:
             logger.info(f"Reusing cached search (similarity: {best_similarity:.2f})")
-            return best_match["citations"], best_match["snippets"]
+            return (best_match["citations"], best_match["snippets"]), claim_embedding
         
-        return None
+        return None, claim_embedding
     except Exception as e:
         logger.warning(f"Semantic search cache lookup failed: {e}")
-        return None
+        return None, claim_embedding
 
-def _cache_search_result(claim: str, citations: List[Dict], snippets: List[str]):
-    """Cache search results for future use."""
+def _cache_search_result(
+    claim: str,
+    citations: List[Dict],
+    snippets: List[str],
+    domain: str = "general",
+    claim_embedding: np.ndarray | None = None
+):
+    """
+    Cache search results (and the claim's embedding) for future use.
+    The claim is only encoded if the caller has no embedding for it yet.
+    """
     try:
-        _SEARCH_CACHE[claim] = {
-            "citations": citations,
-            "snippets": snippets
-        }
-        
-        # Limit cache size (keep most recent 500)
-        if len(_SEARCH_CACHE) > 500:
-            # Remove oldest entry (simple FIFO)
-            oldest_key = next(iter(_SEARCH_CACHE))
-            del _SEARCH_CACHE[oldest_key]
+        if claim_embedding is None:
+            try:
+                claim_embedding = encode_texts([claim], domain)[0]
+            except Exception as e:
+                logger.warning(f"Failed to embed claim for search cache: {e}")
+
+        with _INDEX_LOCK:
+            _SEARCH_CACHE[claim] = {
+                "citations": citations,
+                "snippets": snippets
+            }
+            if claim_embedding is not None:
+                _get_index(resolve_model_key(domain)).add(claim, claim_embedding)
+            
+            # Limit cache size (keep most recent entries)
+            while len(_SEARCH_CACHE) > MAX_SEARCH_CACHE_SIZE:
+                # Remove oldest entry (simple FIFO) and free its embedding slots
+                oldest_key = next(iter(_SEARCH_CACHE))
+                del _SEARCH_CACHE[oldest_key]
+                for index in _EMBEDDING_INDEXES.values():
+                    index.remove(oldest_key)
     except Exception as e:
         logger.warning(f"Failed to cache search result: {e}")
 
+def clear_search_cache():
+    """Clear cached searches (memory and disk) and their embeddings."""
+    with _INDEX_LOCK:
+        _SEARCH_CACHE.clear()
+        for index in _EMBEDDING_INDEXES.values():
+            index.clear()
+
+    disk_cache = get_disk_cache()
+    if disk_cache is not None:
+        disk_cache.clear(SEARCH_NAMESPACE)
+
+def _lookup_cached_search(claim: str, domain: str = "general") -> Tuple[Tuple[List[Dict], List[str]] | None, np.ndarray | None]:
+    """
+    Check the memory, disk and semantic caches, in that order.
+    Returns (cached result or None, the claim's embedding if one was computed).
+    """
+    # First check exact match
+    if claim in _SEARCH_CACHE:
+        logger.info("Exact cache hit for search")
+        cached = _SEARCH_CACHE[claim]
+        return (cached["citations"], cached["snippets"]), None
+    
+    # Check the persistent cache shared with other workers
+    disk_cache = get_disk_cache()
+    if disk_cache is not None:
+        cached = disk_cache.get(SEARCH_NAMESPACE, claim)
+        if cached:
+            logger.info("Disk cache hit for search")
+            _cache_search_result(claim, cached["citations"], cached["snippets"], domain)
+            return (cached["citations"], cached["snippets"]), None
+    
+    # Check for similar claims
+    return _get_cached_search_similar(claim, domain)
+
+def _store_search_result(
+    claim: str,
+    citations: List[Dict],
+    snippets: List[str],
+    domain: str = "general",
+    claim_embedding: np.ndarray | None = None
+):
+    """Write a fresh search result to the memory and disk caches."""
+    _cache_search_result(claim, citations, snippets, domain, claim_embedding)
+    
+    # Don't persist empty results (usually a failed search)
+    disk_cache = get_disk_cache()
+    if disk_cache is not None and (citations or snippets):
+        disk_cache.set(
+            SEARCH_NAMESPACE,
+            claim,
+            {"citations": citations, "snippets": snippets},
+            SEARCH_CACHE_TTL
+        )
+
 def get_cached_or_search(claim: str, domain: str = "general", search_func=None) -> Tuple[List[Dict], List[str]]:
     """
     Get search results from cache if similar claim exists, otherwise perform new search.
@@ -82,22 +181,15 @@ def get_cached_or_search(claim: str, domain: str = "general", search_func=None)
     Returns:
         (citations, snippets)
     """
-    # First check exact match
-    if claim in _SEARCH_CACHE:
-        logger.info("Exact cache hit for search")
-        cached = _SEARCH_CACHE[claim]
-        return cached["citations"], cached["snippets"]
-    
-    # Check for similar claims
-    similar_result = _get_cached_search_similar(claim, domain)
-    if similar_result:
-        return similar_result
+    cached, claim_embedding = _lookup_cached_search(claim, domain)
+    if cached:
+        return cached
     
     # Cache miss - perform new search
     if search_func:
         try:
             citations, snippets = search_func(claim)
-            _cache_search_result(claim, citations, snippets)
+            _store_search_result(claim, citations, snippets, domain, claim_embedding)
             return citations, snippets
         except Exception as e:
             logger.error(f"Search function failed: {e}")
@@ -105,3 +197,23 @@ def get_cached_or_search(claim: str, domain: str = "general", search_func=None)
     
     return [], []
 
+async def get_cached_or_search_async(claim: str, domain: str = "general", search_func=None) -> Tuple[List[Dict], List[str]]:
+    """
+    Async get_cached_or_search: search_func is a coroutine function and is
+    awaited on the event loop. Cache lookups (embedding, SQLite) run on the I/O executor.
+    """
+    cached, claim_embedding = await run_in_stage(IO_STAGE, _lookup_cached_search, claim, domain)
+    if cached:
+        return cached
+    
+    # Cache miss - perform new search
+    if search_func:
+        try:
+            citations, snippets = await search_func(claim)
+            await run_in_stage(IO_STAGE, _store_search_result, claim, citations, snippets, domain, claim_embedding)
+            return citations, snippets
+        except Exception as e:
+            logger.error(f"Search function failed: {e}")
+            return [], []
+    
+    return [], []
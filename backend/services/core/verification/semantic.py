@@ -1,5 +1,4 @@
-from sentence_transformers import util
-from services.core.verification.model_registry import get_embedding_model
+from services.core.verification.evidence import ClaimEvidence
 
 def compute_similarity(
     claim: str,
@@ -13,20 +12,5 @@ def compute_similarity(
     if not sources:
         return 0.0
 
-    model = get_embedding_model(domain)
-    
-    try:
-        # CPU-only encoding for stability
-        claim_embedding = model.encode(claim, convert_to_tensor=True, show_progress_bar=False)
-        source_embeddings = model.encode(sources, convert_to_tensor=True, show_progress_bar=False, batch_size=16)
-        
-        similarities = util.cos_sim(claim_embedding, source_embeddings)
-        max_similarity = float(similarities.max().item())
-        
-        return max_similarity
-    except Exception:
-        # Fallback with CPU
-        claim_embedding = model.encode(claim, convert_to_tensor=True, show_progress_bar=False)
-        source_embeddings = model.encode(sources, convert_to_tensor=True, show_progress_bar=False)
-        similarities = util.cos_sim(claim_embedding, source_embeddings)
-        return float(similarities.max().item())
+    # Claim and sources are encoded together in one batched call
+    return ClaimEvidence.build(claim, sources, domain).similarity()
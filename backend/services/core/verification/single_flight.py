@@ -0,0 +1,119 @@
+"""
+Single-flight deduplication of identical in-flight claim verifications.
+The first caller for a key computes the result; concurrent duplicates
+(sync or async) wait on the same future instead of repeating the work.
+"""
+import asyncio
+import logging
+import re
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def claim_key(claim: str, domain: str) -> tuple[str, str]:
+    """Normalize a claim (case, whitespace) into a coalescing key."""
+    return _WHITESPACE.sub(" ", claim.strip().lower()), domain
+
+
+class _LeaderCancelled(Exception):
+    """The caller computing a flight was cancelled; its waiters should retry."""
+
+
+class SingleFlight:
+    """
+    Tracks in-flight calls by key. Uses concurrent.futures.Future so that
+    threads and coroutines can wait on the same computation.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, Future] = {}
+        self.coalesced = 0
+
+    def _join_or_lead(self, key: Hashable) -> tuple[Future, bool]:
+        with self._lock:
+            future = self._flights.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = Future()
+            self._flights[key] = future
+            return future, True
+
+    def _settle(self, key: Hashable, future: Future, result: Any = None, error: BaseException | None = None):
+        """End a flight: forget it first, so waiters that retry start a new one, then publish."""
+        with self._lock:
+            if self._flights.get(key) is future:
+                del self._flights[key]
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args) -> Any:
+        """Run func(*args) once per key among concurrent callers."""
+        while True:
+            future, leader = self._join_or_lead(key)
+            if leader:
+                break
+            try:
+                return future.result()
+            except _LeaderCancelled:
+                continue
+
+        try:
+            result = func(*args)
+        except BaseException as e:
+            self._settle(key, future, error=e)
+            raise
+        self._settle(key, future, result)
+        return result
+
+    async def do_async(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await func() once per key among concurrent callers. Cancelling a
+        waiting caller only cancels that caller; if the caller doing the work
+        is cancelled, the waiters retry and one of them takes over.
+        """
+        while True:
+            future, leader = self._join_or_lead(key)
+            if leader:
+                break
+            try:
+                return await asyncio.shield(asyncio.wrap_future(future))
+            except _LeaderCancelled:
+                continue
+
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            self._settle(key, future, error=_LeaderCancelled())
+            raise
+        except BaseException as e:
+            self._settle(key, future, error=e)
+            raise
+        self._settle(key, future, result)
+        return result
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+
+_VERIFICATION_FLIGHTS = SingleFlight()
+
+def get_verification_flights() -> SingleFlight:
+    return _VERIFICATION_FLIGHTS
+
+def share_result(result: dict, claim: str) -> dict:
+    """Give a duplicate caller its own copy of a shared result, with its claim text."""
+    result = dict(result)
+    result["claim"] = claim
+    return result
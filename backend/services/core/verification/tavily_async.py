@@ -0,0 +1,215 @@
+"""
+Asyncio-native Tavily search client.
+Uses one keep-alive aiohttp session per event loop, a token-bucket rate
+limiter plus an in-flight cap, and honors Retry-After on 429 responses.
+"""
+import asyncio
+import email.utils
+import logging
+import time
+from typing import Dict
+
+import aiohttp
+
+from services.config.settings import (
+    TAVILY_API_KEY,
+    TAVILY_REQUESTS_PER_SECOND,
+    TAVILY_BURST,
+    TAVILY_MAX_IN_FLIGHT,
+    TAVILY_MAX_RETRIES,
+    TAVILY_TIMEOUT,
+)
+from services.core.verification.scheduler import get_claim_limiter
+
+logger = logging.getLogger(__name__)
+
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+
+# Backoff (seconds) when a 429/5xx response carries no usable Retry-After
+DEFAULT_RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 60.0
+
+
+class TavilyRateLimitError(Exception):
+    """Raised when Tavily keeps answering 429 after all retries."""
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket for asyncio: `rate` tokens per second, at most `capacity` stored.
+    pause() blocks all acquirers until a deadline (used for Retry-After).
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def pause(self, seconds: float):
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                if self.rate <= 0:
+                    raise ValueError("Token bucket rate must be positive")
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def _parse_retry_after(value: str | None, attempt: int) -> float:
+    """Parse a Retry-After header (seconds or HTTP date), else exponential backoff."""
+    delay = None
+    if value:
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                retry_at = email.utils.parsedate_to_datetime(value)
+                delay = retry_at.timestamp() - time.time()
+            except (TypeError, ValueError):
+                delay = None
+
+    if delay is None or delay < 0:
+        delay = DEFAULT_RETRY_DELAY * (2 ** attempt)
+    return min(delay, MAX_RETRY_DELAY)
+
+
+class AsyncTavilyClient:
+    """Tavily search over a shared keep-alive connection pool."""
+
+    def __init__(
+        self,
+        api_key: str = TAVILY_API_KEY,
+        requests_per_second: float = TAVILY_REQUESTS_PER_SECOND,
+        burst: int = TAVILY_BURST,
+        max_in_flight: int = TAVILY_MAX_IN_FLIGHT,
+        max_retries: int = TAVILY_MAX_RETRIES,
+        timeout: float = TAVILY_TIMEOUT,
+    ):
+        self.api_key = api_key
+        self.max_retries = max_retries
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.limiter = AsyncTokenBucket(requests_per_second, burst)
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._max_in_flight = max_in_flight
+        self._session: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self._max_in_flight, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                headers={"Authorization": f"Bearer {self.api_key}"}
+            )
+        return self._session
+
+    async def search(self, query: str, **params) -> Dict:
+        """POST a search and return the decoded JSON response."""
+        payload = {"query": query, **params}
+        session = self._get_session()
+
+        feedback = get_claim_limiter()
+
+        for attempt in range(self.max_retries + 1):
+            await self.limiter.acquire()
+            async with self._in_flight:
+                started = time.monotonic()
+                try:
+                    async with session.post(TAVILY_SEARCH_URL, json=payload) as response:
+                        if response.status == 429:
+                            feedback.record_rate_limited()
+                        elif response.status >= 500:
+                            feedback.record_error()
+
+                        retryable = response.status == 429 or response.status >= 500
+                        if not retryable or attempt == self.max_retries:
+                            if response.status == 429:
+                                raise TavilyRateLimitError("Tavily rate limit exceeded")
+                            response.raise_for_status()
+                            result = await response.json()
+                            feedback.record_success(time.monotonic() - started)
+                            return result
+
+                        delay = _parse_retry_after(response.headers.get("Retry-After"), attempt)
+                        if response.status == 429:
+                            # Hold back every caller, not just this one
+                            self.limiter.pause(delay)
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    feedback.record_error()
+                    raise
+
+            logger.warning(
+                f"Tavily returned HTTP {response.status}, retrying in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{self.max_retries + 1})"
+            )
+            # Wait outside the in-flight slot so other searches can proceed
+            await asyncio.sleep(delay)
+
+        raise TavilyRateLimitError("Tavily search retries exhausted")
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+# One client per event loop (aiohttp sessions and asyncio primitives are loop-bound)
+_async_client: AsyncTavilyClient | None = None
+_async_client_loop = None
+
+def get_async_tavily_client() -> AsyncTavilyClient:
+    """Return the shared client for the running event loop."""
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        if _async_client is not None:
+            _close_stale_client(_async_client, _async_client_loop)
+        _async_client = AsyncTavilyClient()
+        _async_client_loop = loop
+    return _async_client
+
+# Close tasks for replaced clients, referenced until they finish
+_closing: set = set()
+
+def _close_stale_client(client: AsyncTavilyClient, loop: asyncio.AbstractEventLoop):
+    """Close a client left behind by another event loop, on that loop if it still runs."""
+    if loop.is_running() and not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(client.close(), loop)
+        return
+
+    async def close():
+        # The old loop is gone; closing still releases the session and connector
+        try:
+            await client.close()
+        except Exception as e:
+            logger.debug(f"Closing stale Tavily client failed: {e}")
+
+    task = asyncio.get_running_loop().create_task(close())
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+async def close_async_tavily_client():
+    """Close the shared client's connection pool (call on shutdown)."""
+    global _async_client, _async_client_loop
+    if _async_client is not None:
+        await _async_client.close()
+    _async_client = None
+    _async_client_loop = None
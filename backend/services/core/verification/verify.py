@@ -1,61 +1,111 @@
 import logging
-from services.core.verification.search import search_web_for_claim
-from services.core.verification.semantic import compute_similarity
+from typing import Literal
+from services.core.verification.search import search_web_for_claim_sync
+from services.core.verification.evidence import ClaimEvidence
 from services.core.verification.contradiction import detect_contradiction
 from services.core.scoring.credibility import calculate_credibility
+from services.core.scoring.verdict import compute_verdict
 from services.storage.cache import get_cached, set_cache
 from services.config.domain_loader import load_domain_config
-from services.core.llm.reasoner import generate_explanation
+from services.core.llm.reasoner import generate_explanations_batch, generate_deterministic_explanations
+from services.core.verification.single_flight import claim_key, get_verification_flights, share_result
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# How a request's explanations are produced:
+# "llm" generates them with the reasoning model before returning,
+# "deterministic" uses the template text and never loads the model,
+# "deferred" returns the template text now and the LLM text on request
+ExplanationMode = Literal["llm", "deterministic", "deferred"]
 
-def verify_claim(claim: str, domain: str = "general") -> dict:
+
+def resolve_domain_config(domain: str) -> tuple[str, dict]:
     """
-    Verify a single claim by searching the web, computing similarity,
-    checking credibility, and detecting contradictions.
-    
-    Returns:
-        dict: Verification result with status, confidence, citations, etc.
-        Must include: claim, status, confidence, similarity, credibility,
-        contradicted, citations, explanation
+    Load the domain config, falling back to "general" if it can't be loaded.
+    Returns: (domain, domain_cfg)
     """
     try:
         domain_cfg = load_domain_config(domain)
-        similarity_threshold = domain_cfg["similarity_threshold"]
-        contradiction_penalty = domain_cfg["contradiction_penalty"]
-        contradiction_threshold = domain_cfg.get("contradiction_threshold", 0.35)
+        missing = [key for key in ("similarity_threshold", "contradiction_penalty") if key not in domain_cfg]
+        if missing:
+            raise KeyError(f"missing {', '.join(missing)}")
     except Exception as e:
         logger.error(f"Failed to load domain config for {domain}: {e}")
         domain_cfg = load_domain_config("general")
-        similarity_threshold = domain_cfg["similarity_threshold"]
-        contradiction_penalty = domain_cfg["contradiction_penalty"]
-        contradiction_threshold = domain_cfg.get("contradiction_threshold", 0.35)
         domain = "general"
+    return domain, domain_cfg
 
-    # Check cache first
-    cached_result = get_cached(claim)
+
+def verdict_key(claim: str, domain: str) -> str:
+    """Verdict cache key; the domain picks the model, thresholds and credibility weights."""
+    return f"{domain}:{claim}"
+
+
+def get_cached_result(claim: str, domain: str = "general") -> dict | None:
+    """Return a cached verification result for the claim in this domain, if any."""
+    cached_result = get_cached(verdict_key(claim, domain))
     if cached_result:
         # Ensure cached result has all required fields
         if "claim" not in cached_result:
             cached_result["claim"] = claim
         return cached_result
+    return None
+
+
+def verify_claim(claim: str, domain: str = "general") -> dict:
+    """
+    Verify a single claim by searching the web, computing similarity,
+    checking credibility, and detecting contradictions.
+    
+    Returns:
+        dict: Verification result with status, confidence, citations, etc.
+        Must include: claim, status, confidence, similarity, credibility,
+        contradicted, citations, explanation
+    """
+    domain, _ = resolve_domain_config(domain)
+
+    # Concurrent duplicates of this claim wait for the first caller's result
+    result = get_verification_flights().do(claim_key(claim, domain), _verify_claim, claim, domain)
+    result = share_result(result, claim)
+
+    # A shared result from a caller that deferred explanations may lack one
+    if not result.get("explanation"):
+        add_explanations([result])
+    return result
+
+
+def _verify_claim(claim: str, domain: str) -> dict:
+    # Check cache first
+    cached_result = get_cached_result(claim, domain)
+    if cached_result:
+        return cached_result
 
     # Search web for claim (with intelligent caching)
     try:
-        citations, snippets = search_web_for_claim(claim, domain)
+        citations, snippets = search_web_for_claim_sync(claim, domain)
     except Exception as e:
         logger.error(f"Web search failed for claim: {claim[:50]}... Error: {e}")
         citations, snippets = [], []
 
-    # Compute similarity
+    return score_claim(claim, domain, citations, snippets)
+
+
+def score_claim(claim: str, domain: str, citations: list[dict], snippets: list[str], explain: bool = True) -> dict:
+    """
+    Score a claim against its search results: similarity, credibility,
+    contradictions and explanation. CPU-bound.
+    With explain=False the explanation is left empty and the result is not
+    cached; call add_explanations once the caller has all its results.
+    """
+    domain, domain_cfg = resolve_domain_config(domain)
+    contradiction_threshold = domain_cfg.get("contradiction_threshold", 0.35)
+
+    # Encode claim and snippets once; similarity and contradiction share the embeddings
+    evidence = None
     try:
-        similarity_score = compute_similarity(
-            claim,
-            snippets,
-            domain
-        )
+        evidence = ClaimEvidence.build(claim, snippets, domain)
+        similarity_score = evidence.similarity()
     except Exception as e:
         logger.error(f"Similarity computation failed: {e}")
         similarity_score = 0.0
@@ -67,18 +117,6 @@ def verify_claim(claim: str, domain: str = "general") -> dict:
         logger.error(f"Credibility calculation failed: {e}")
         credibility_score = 0.0
 
-    # Compute final score with improved formula
-    # Weight similarity more heavily, but still consider credibility
-    # If we have citations, boost the score slightly
-    base_score = similarity_score * 0.7 + (similarity_score * credibility_score) * 0.3
-    
-    # Boost if we have multiple credible sources
-    if len(citations) > 0:
-        citation_boost = min(len(citations) * 0.05, 0.15)  # Max 15% boost
-        base_score = min(base_score + citation_boost, 1.0)
-    
-    final_score = round(base_score, 2)
-    
     # Detect contradictions
     has_contradiction = False
     try:
@@ -86,55 +124,127 @@ def verify_claim(claim: str, domain: str = "general") -> dict:
             has_contradiction = detect_contradiction(
                 snippets,
                 domain,
-                contradiction_threshold
+                contradiction_threshold,
+                evidence=evidence
             )
             if has_contradiction:
                 logger.warning(f"Contradiction detected for claim: {claim[:50]}...")
-                final_score = round(final_score * contradiction_penalty, 2)
     except Exception as e:
         logger.error(f"Contradiction detection failed: {e}")
 
-    # Determine verification status with adjusted threshold
-    # Lower the threshold slightly if we have good citations
-    adjusted_threshold = similarity_threshold
-    if len(citations) >= 3 and credibility_score > 0.7:
-        adjusted_threshold = similarity_threshold * 0.9  # 10% lower threshold
+    final_score, status = compute_verdict(
+        similarity_score,
+        credibility_score,
+        len(citations),
+        has_contradiction,
+        domain_cfg
+    )
     
-    status = "verified" if final_score >= adjusted_threshold else "hallucinated"
-    
-    # Generate explanation (for both verified and hallucinated)
-    explanation = ""
-    try:
-        explanation = generate_explanation(
-            claim=claim,
-            status=status,
-            confidence=final_score,
-            citations=citations,
-            similarity=similarity_score,
-            credibility=credibility_score,
-            contradicted=has_contradiction
-        )
-    except Exception as e:
-        logger.warning(f"Explanation generation failed: {e}")
-        explanation = f"Claim {status} with confidence {final_score:.2f} based on {len(citations)} sources."
-
     # Build result with all required fields
     result = {
         "claim": claim,
+        "domain": domain,
         "status": status,
         "confidence": final_score,
         "similarity": round(similarity_score, 2),
         "credibility": credibility_score,
         "contradicted": has_contradiction,
         "citations": citations,
-        "explanation": explanation
+        "explanation": ""
     }
+
+    # Explanations are added (and the result cached) in one batched step
+    # for all claims when the caller defers them
+    if explain:
+        add_explanations([result])
     
-    # Cache result
+    return result
+
+
+def add_explanations(results: list[dict]) -> list[dict]:
+    """
+    Generate explanations for results that don't have one yet, in one
+    batched step, then cache the completed results.
+    """
+    missing = [
+        result for result in results
+        if result and not result.get("explanation") and result.get("status") != "error"
+    ]
+    if not missing:
+        return results
+
     try:
-        set_cache(claim, result)
+        explanations = generate_explanations_batch(missing)
     except Exception as e:
-        logger.warning(f"Cache write failed: {e}")
-    
-    return result
+        logger.warning(f"Explanation generation failed: {e}")
+        explanations = [
+            f"Claim {result['status']} with confidence {result['confidence']:.2f} based on {len(result['citations'])} sources."
+            for result in missing
+        ]
+
+    for result, explanation in zip(missing, explanations):
+        result["explanation"] = explanation
+        
+        # Cache result (near-duplicate copies only mirror their representative's)
+        if result.get("duplicate_of") is not None:
+            continue
+        try:
+            set_cache(verdict_key(result["claim"], result.get("domain", "general")), result)
+        except Exception as e:
+            logger.warning(f"Cache write failed: {e}")
+
+    return results
+
+
+def add_deterministic_explanations(results: list[dict], pending: bool = False) -> list[dict]:
+    """
+    Fill in the template explanation for results that don't have one,
+    without loading the reasoning model. Verdicts are cached without it,
+    so a later "llm" request still gets a generated explanation.
+    With pending=True the results are flagged explanation_pending until
+    explain_deferred replaces the template text.
+    """
+    missing = [
+        result for result in results
+        if result and not result.get("explanation") and result.get("status") != "error"
+    ]
+    if not missing:
+        return results
+
+    for result in missing:
+        if result.get("duplicate_of") is not None:
+            continue
+        try:
+            set_cache(verdict_key(result["claim"], result.get("domain", "general")), result)
+        except Exception as e:
+            logger.warning(f"Cache write failed: {e}")
+
+    for result, explanation in zip(missing, generate_deterministic_explanations(missing)):
+        result["explanation"] = explanation
+        if pending:
+            result["explanation_pending"] = True
+
+    return results
+
+
+def explain_deferred(results: list[dict]) -> list[dict]:
+    """
+    Replace the template explanation of pending results with a generated
+    one, in one batched step. Returns the results that were updated.
+    """
+    pending = [result for result in results if result and result.get("explanation_pending")]
+    if not pending:
+        return []
+
+    verdicts = []
+    for result in pending:
+        verdict = {key: value for key, value in result.items() if key != "explanation_pending"}
+        verdict["explanation"] = ""
+        verdicts.append(verdict)
+    add_explanations(verdicts)
+
+    for result, verdict in zip(pending, verdicts):
+        result["explanation"] = verdict["explanation"]
+        result.pop("explanation_pending", None)
 
+    return pending
@@ -1,101 +1,221 @@
 """
 Async version of claim verification for better performance.
-Supports batching and parallel processing.
+Supports adaptive-concurrency parallel processing, fed either by a list of
+claims or by an async source of claim batches such as the streaming
+extractor. Each claim is routed to its own domain, and near-duplicate
+claims are verified once per cluster.
 """
 import asyncio
 import logging
-from typing import List, Dict, Callable
-from services.core.verification.verify import verify_claim
+from typing import AsyncIterable, AsyncIterator, Iterable, List, Dict, Callable, Tuple
+from services.core.verification.verify import resolve_domain_config, get_cached_result, score_claim, add_explanations
+from services.core.verification.search import search_web_for_claim
+from services.core.verification.single_flight import claim_key, get_verification_flights, share_result
+from services.core.verification.scheduler import get_claim_limiter
+from services.core.verification.claim_clusters import get_claim_clusterer, copy_verdict
+from services.core.claims.domain_detector import detect_claim_domains
+from services.config.settings import CLAIM_DOMAIN_ROUTING
+from services.core.utils.executors import run_in_stage, IO_STAGE, CPU_STAGE
 
 logger = logging.getLogger(__name__)
 
-async def verify_claim_async(claim: str, domain: str = "general") -> Dict:
+async def verify_claim_async(claim: str, domain: str = "general", explain: bool = True) -> Dict:
     """
-    Async wrapper for verify_claim.
-    Runs verification in thread pool to avoid blocking.
+    Async version of verify_claim.
+    The web search is awaited on the event loop; cache lookups run on the
+    I/O executor and scoring on the CPU executor to avoid blocking.
+    With explain=False the explanation is left for a later batched
+    add_explanations call.
     """
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, verify_claim, claim, domain)
+    domain, _ = resolve_domain_config(domain)
+
+    # Concurrent duplicates (sync or async) wait for the first caller's result
+    result = await get_verification_flights().do_async(
+        claim_key(claim, domain),
+        lambda: _verify_claim_async(claim, domain, explain)
+    )
+    result = share_result(result, claim)
+    result["domain"] = domain
+
+    # A shared result from a caller that deferred explanations may lack one
+    if explain and not result.get("explanation"):
+        await run_in_stage(CPU_STAGE, add_explanations, [result])
+    return result
+
+
+async def _verify_claim_async(claim: str, domain: str, explain: bool) -> Dict:
+    cached_result = await run_in_stage(IO_STAGE, get_cached_result, claim, domain)
+    if cached_result:
+        return cached_result
+
+    try:
+        citations, snippets = await search_web_for_claim(claim, domain)
+    except Exception as e:
+        logger.error(f"Web search failed for claim: {claim[:50]}... Error: {e}")
+        citations, snippets = [], []
+
+    # Embedding, scoring and explanation generation are CPU-bound model work
+    return await run_in_stage(CPU_STAGE, score_claim, claim, domain, citations, snippets, explain)
+
+
+def _error_result(claim: str, domain: str, error: Exception) -> Dict:
+    """Result placeholder for a claim whose verification raised."""
+    return {
+        "claim": claim,
+        "domain": domain,
+        "status": "error",
+        "confidence": 0.0,
+        "similarity": 0.0,
+        "credibility": 0.0,
+        "contradicted": False,
+        "citations": [],
+        "explanation": f"Verification failed: {str(error)}"
+    }
+
+
+async def verify_claim_safe(claim: str, domain: str = "general", explain: bool = True) -> Dict:
+    """Verify a single claim, turning failures into an error result."""
+    try:
+        return await verify_claim_async(claim, domain, explain)
+    except Exception as e:
+        logger.error(f"Verification failed for claim: {e}")
+        return _error_result(claim, domain, e)
+
+
+class ClaimFeed:
+    """
+    Claims for verification: a list, or an async source of claim batches
+    that is still producing. Counts the claims handed out so far and records
+    when the source is exhausted, so callers can report totals as they
+    become known.
+    """
+
+    def __init__(self, claims: Iterable[str] | AsyncIterable[List[str]]):
+        self._claims = claims
+        self.count = 0
+        self.exhausted = False
+
+    async def batches(self) -> AsyncIterator[List[str]]:
+        if isinstance(self._claims, AsyncIterable):
+            async for batch in self._claims:
+                self.count += len(batch)
+                yield batch
+        else:
+            batch = list(self._claims)
+            self.count += len(batch)
+            yield batch
+        self.exhausted = True
+
+
+async def verify_claims_stream(
+    claims: Iterable[str] | AsyncIterable[List[str]] | ClaimFeed,
+    domain: str = "general",
+    explain: bool = True
+) -> AsyncIterator[Tuple[int, Dict]]:
+    """
+    Verify claims over a sliding window and yield (index, result) as each
+    one completes, in completion order rather than input order.
+    The window size is the shared adaptive limiter's current limit, so a new
+    claim starts as soon as any claim finishes (no batch barrier).
+    Batches from an async source are scheduled as they arrive, so the first
+    searches overlap producing the rest; an error in the source is raised here.
+    Each claim is verified with its own domain (domain is the default for
+    claims without domain keywords, and with routing disabled); the
+    embedding micro-batcher groups their scoring encodes per model.
+    Near-duplicates of an earlier claim of the same domain are not verified
+    but get a copy of its result, marked with duplicate_of.
+    """
+    feed = claims if isinstance(claims, ClaimFeed) else ClaimFeed(claims)
+    clusterer = get_claim_clusterer()
+    limiter = get_claim_limiter()
+    finished: asyncio.Queue = asyncio.Queue()
+    tasks: Dict[int, asyncio.Task] = {}
+
+    async def run(index: int, claim: str, claim_domain: str) -> Tuple[int, Dict]:
+        async with limiter:
+            return index, await verify_claim_safe(claim, claim_domain, explain)
+
+    async def copy(index: int, claim: str, representative: int) -> Tuple[int, Dict]:
+        # Shielded: cancelling a member must not cancel its representative
+        _, result = await asyncio.shield(tasks[representative])
+        return index, copy_verdict(result, claim, representative)
+
+    def route(batch: List[str]) -> Tuple[List[str], List[int | None]]:
+        """Each claim's domain and representative; CPU-bound (keyword pass, clustering encodes)."""
+        domains = detect_claim_domains(batch, domain) if CLAIM_DOMAIN_ROUTING else [domain] * len(batch)
+        duplicates_of = clusterer.assign(batch, domains) if clusterer is not None else [None] * len(batch)
+        return domains, duplicates_of
+
+    async def schedule():
+        async for batch in feed.batches():
+            start = len(tasks)
+            domains, duplicates_of = await run_in_stage(CPU_STAGE, route, batch)
+            for i, claim in enumerate(batch):
+                if duplicates_of[i] is None:
+                    task = asyncio.create_task(run(start + i, claim, domains[i]))
+                else:
+                    task = asyncio.create_task(copy(start + i, claim, duplicates_of[i]))
+                task.add_done_callback(finished.put_nowait)
+                tasks[start + i] = task
+
+    scheduler = asyncio.create_task(schedule())
+    scheduler.add_done_callback(finished.put_nowait)
+    try:
+        scheduling = True
+        yielded = 0
+        while scheduling or yielded < len(tasks):
+            task = await finished.get()
+            if task is scheduler:
+                scheduling = False
+                task.result()
+                continue
+            yielded += 1
+            yield task.result()
+    finally:
+        # Consumer went away (e.g. client disconnected) or the source failed: stop remaining work
+        for task in [scheduler, *tasks.values()]:
+            if not task.done():
+                task.cancel()
 
 
 async def verify_claims_batch(
-    claims: List[str],
+    claims: Iterable[str] | AsyncIterable[List[str]] | ClaimFeed,
     domain: str = "general",
-    batch_size: int = 5,
-    progress_callback: Callable[[int, int, str], None] = None
+    progress_callback: Callable[[int, int, str], None] = None,
+    explain: bool = True
 ) -> List[Dict]:
     """
-    Verify multiple claims in parallel batches with batch-level progress tracking.
+    Verify multiple claims concurrently with claim-level progress tracking.
+    Concurrency adapts to observed search latency and rate limiting.
     
     Args:
-        claims: List of claim strings
-        domain: Domain for verification
-        batch_size: Number of claims to process in parallel
-        progress_callback: Callback function(completed_batches, total_batches, message)
+        claims: List of claim strings, or an async source of claim batches
+        domain: Default domain, for claims without domain keywords of their own
+        progress_callback: Callback function(completed_claims, total_claims, message);
+            while an async source is still producing, total is the claims seen so far
+        explain: Generate LLM explanations; if False they are left empty
     
     Returns:
-        List of verification results
+        List of verification results, in input order
     """
-    results = []
-    total = len(claims)
-    total_batches = (total + batch_size - 1) // batch_size
+    feed = claims if isinstance(claims, ClaimFeed) else ClaimFeed(claims)
+    results: Dict[int, Dict] = {}
     
-    # Process in batches to avoid overwhelming the system
-    for i in range(0, total, batch_size):
-        batch = claims[i:i + batch_size]
-        batch_num = (i // batch_size) + 1
-        
-        logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} claims)")
-        
-        # Update progress at batch start
+    # Explanations are generated afterwards, for all claims in one batched step
+    async for index, result in verify_claims_stream(feed, domain, explain=False):
+        results[index] = result
         if progress_callback:
-            progress_callback(
-                batch_num - 1,  # completed batches (0-indexed for start)
-                total_batches,
-                f"Processing batch {batch_num}/{total_batches} ({len(batch)} claims)..."
-            )
-        
-        # Process batch in parallel without individual claim progress tracking
-        async def verify_claim_simple(claim: str):
-            """Verify a single claim without progress tracking."""
-            try:
-                result = await verify_claim_async(claim, domain)
-                return result
-            except Exception as e:
-                logger.error(f"Verification failed for claim: {e}")
-                return {
-                    "claim": claim,
-                    "status": "error",
-                    "confidence": 0.0,
-                    "similarity": 0.0,
-                    "credibility": 0.0,
-                    "contradicted": False,
-                    "citations": [],
-                    "explanation": f"Verification failed: {str(e)}"
-                }
-        
-        # Create tasks for batch processing
-        batch_tasks = [verify_claim_simple(claim) for claim in batch]
-        batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-        
-        # Handle results
-        for result in batch_results:
-            if isinstance(result, Exception):
-                logger.error(f"Unexpected error in batch: {result}")
-                continue
-            results.append(result)
-        
-        # Update progress after batch completion
+            progress_callback(len(results), feed.count, f"Verified claim {len(results)}/{feed.count}")
+    
+    results = [results[index] for index in range(len(results))]
+    if explain and results:
         if progress_callback:
-            progress_callback(
-                batch_num,  # completed batches (1-indexed for completion)
-                total_batches,
-                f"Completed batch {batch_num}/{total_batches} ({len(batch)} claims verified)"
-            )
-        
-        # Small delay between batches to prevent rate limiting
-        if i + batch_size < total:
-            await asyncio.sleep(0.1)
+            progress_callback(len(results), len(results), "Generating explanations...")
+        # One explanation per cluster, copied to the near-duplicates
+        representatives = [result for result in results if result.get("duplicate_of") is None]
+        await run_in_stage(CPU_STAGE, add_explanations, representatives)
+        for result in results:
+            if result.get("duplicate_of") is not None:
+                result["explanation"] = results[result["duplicate_of"]].get("explanation", "")
     
     return results
-
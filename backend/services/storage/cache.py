@@ -1,26 +1,47 @@
 from collections import OrderedDict
 import logging
+from services.config.settings import VERDICT_CACHE_TTL
+from services.storage.disk_cache import get_disk_cache
 
 logger = logging.getLogger(__name__)
 
 # LRU Cache with size limit (max 1000 entries)
+# Hot tier in front of the persistent disk cache
 MAX_CACHE_SIZE = 1000
 CACHE = OrderedDict()
 
+# Disk cache namespace for claim verdicts
+VERDICT_NAMESPACE = "verdict"
+
 def get_cached(key: str):
     """
     Get cached result. Moves item to end (most recently used).
+    Falls back to the persistent disk cache on a memory miss.
     """
     if key in CACHE:
         # Move to end (most recently used)
         CACHE.move_to_end(key)
         return CACHE[key].copy()  # Return copy to prevent mutation
+
+    disk_cache = get_disk_cache()
+    if disk_cache is not None:
+        value = disk_cache.get(VERDICT_NAMESPACE, key)
+        if isinstance(value, dict):
+            _set_memory(key, value)
+            return value.copy()
     return None
 
 def set_cache(key: str, value: dict):
     """
-    Set cache entry. Evicts oldest if cache is full.
+    Set cache entry in memory and on disk. Evicts oldest if cache is full.
     """
+    _set_memory(key, value)
+
+    disk_cache = get_disk_cache()
+    if disk_cache is not None:
+        disk_cache.set(VERDICT_NAMESPACE, key, value, VERDICT_CACHE_TTL)
+
+def _set_memory(key: str, value: dict):
     try:
         if key in CACHE:
             # Update existing entry
@@ -36,5 +57,9 @@ def set_cache(key: str, value: dict):
         logger.warning(f"Cache write failed: {e}")
 
 def clear_cache():
-    """Clear all cache entries."""
+    """Clear all cache entries (memory and disk)."""
     CACHE.clear()
+
+    disk_cache = get_disk_cache()
+    if disk_cache is not None:
+        disk_cache.clear(VERDICT_NAMESPACE)
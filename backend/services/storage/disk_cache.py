@@ -0,0 +1,208 @@
+"""
+Persistent, cross-process cache backed by SQLite in WAL mode.
+Shared by all workers on a host; entries carry a TTL, values are stored
+as zlib-compressed JSON and entries are evicted to stay within a payload
+byte budget. Eviction returns freed pages to the filesystem (incremental
+auto-vacuum) and the WAL is checkpointed and size-limited, so the files on
+disk track the payload instead of growing without bound.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any
+
+from services.config.settings import CACHE_DB_ENABLED, CACHE_DB_PATH, CACHE_DB_MAX_BYTES
+
+logger = logging.getLogger(__name__)
+
+# Only refresh an entry's access time if it is older than this (seconds),
+# so hot reads don't turn into a write per lookup
+ACCESS_TOUCH_INTERVAL = 60
+
+# Check the byte budget every N writes
+EVICTION_CHECK_INTERVAL = 64
+
+# The WAL is truncated to at most this many bytes after a checkpoint
+WAL_SIZE_LIMIT = 64 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at);
+CREATE INDEX IF NOT EXISTS idx_entries_expires ON entries (expires_at);
+"""
+
+
+class DiskCache:
+    """
+    Namespaced key/value store on a single SQLite file.
+    Every method is fail-soft: errors are logged and treated as a miss.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._writes = 0
+        self._writes_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, reopening after a fork."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+        # Must precede the first table in a new file; older files are converted below
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute(f"PRAGMA journal_size_limit={WAL_SIZE_LIMIT}")
+        conn.executescript(_SCHEMA)
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            # A file created without incremental auto-vacuum needs one full VACUUM to switch
+            try:
+                conn.execute("VACUUM")
+            except sqlite3.Error as e:
+                logger.warning(f"Disk cache could not enable incremental vacuum: {e}")
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def get(self, namespace: str, key: str) -> Any | None:
+        """Return the cached value, or None if missing or expired."""
+        try:
+            conn = self._connect()
+            now = time.time()
+            row = conn.execute(
+                "SELECT value, expires_at, accessed_at FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, expires_at, accessed_at = row
+            if expires_at <= now:
+                conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+                return None
+
+            if now - accessed_at > ACCESS_TOUCH_INTERVAL:
+                conn.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                    (now, namespace, key)
+                )
+
+            return json.loads(zlib.decompress(value))
+        except Exception as e:
+            logger.warning(f"Disk cache read failed: {e}")
+            return None
+
+    def set(self, namespace: str, key: str, value: Any, ttl: float):
+        """Store a JSON-serializable value for ttl seconds."""
+        try:
+            payload = zlib.compress(json.dumps(value).encode("utf-8"))
+            if len(payload) > self.max_bytes:
+                return
+
+            conn = self._connect()
+            now = time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, value, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, key, payload, len(payload), now + ttl, now)
+            )
+
+            with self._writes_lock:
+                self._writes += 1
+                check = self._writes % EVICTION_CHECK_INTERVAL == 0
+            if check:
+                self.evict()
+        except Exception as e:
+            logger.warning(f"Disk cache write failed: {e}")
+
+    def delete(self, namespace: str, key: str):
+        try:
+            self._connect().execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+        except Exception as e:
+            logger.warning(f"Disk cache delete failed: {e}")
+
+    def evict(self):
+        """
+        Drop expired entries, then least-recently-used ones until under
+        max_bytes, and give the freed pages back to the filesystem.
+        """
+        try:
+            conn = self._connect()
+            expired = conn.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),)).rowcount
+
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total <= self.max_bytes:
+                if expired:
+                    conn.execute("PRAGMA incremental_vacuum")
+                return
+
+            # Free down to 90% of the budget so we don't evict on every write
+            to_free = total - int(self.max_bytes * 0.9)
+            freed = 0
+            rows = conn.execute("SELECT namespace, key, size FROM entries ORDER BY accessed_at").fetchall()
+            victims = []
+            for namespace, key, size in rows:
+                if freed >= to_free:
+                    break
+                victims.append((namespace, key))
+                freed += size
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany("DELETE FROM entries WHERE namespace = ? AND key = ?", victims)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            logger.info(f"Disk cache evicted {len(victims)} entries ({freed} bytes)")
+
+            conn.execute("PRAGMA incremental_vacuum")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except Exception as e:
+            logger.warning(f"Disk cache eviction failed: {e}")
+
+    def clear(self, namespace: str | None = None):
+        try:
+            conn = self._connect()
+            if namespace is None:
+                conn.execute("DELETE FROM entries")
+            else:
+                conn.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+        except Exception as e:
+            logger.warning(f"Disk cache clear failed: {e}")
+
+
+_DISK_CACHE = None
+_DISK_CACHE_LOCK = threading.Lock()
+
+def get_disk_cache() -> DiskCache | None:
+    """Return the shared disk cache, or None if disabled."""
+    global _DISK_CACHE
+    if not CACHE_DB_ENABLED:
+        return None
+    if _DISK_CACHE is None:
+        with _DISK_CACHE_LOCK:
+            if _DISK_CACHE is None:
+                _DISK_CACHE = DiskCache(CACHE_DB_PATH, CACHE_DB_MAX_BYTES)
+    return _DISK_CACHE
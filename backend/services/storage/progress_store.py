@@ -0,0 +1,161 @@
+"""
+Progress store for verification tasks.
+Subscribers are notified through asyncio queues only when a task's
+progress actually changes. Finished tasks are evicted after a TTL, and
+tasks that stopped updating (abandoned or died mid-run) after a longer one.
+ProgressStore is the interface a shared backend (e.g. Redis) would implement.
+"""
+import asyncio
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Dict, List, Tuple
+
+from services.config.settings import PROGRESS_TTL_SECONDS, PROGRESS_STALE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = ("completed", "error")
+
+# How often (seconds) updates trigger a sweep for expired tasks
+SWEEP_INTERVAL = 30.0
+
+
+def pending_progress() -> Dict:
+    """Progress reported for a task that has no updates yet."""
+    return {
+        "completed": 0,
+        "total": 0,
+        "current": "",
+        "status": "pending",
+        "percentage": 0
+    }
+
+
+class ProgressStore(ABC):
+    """Interface for task progress storage with change notifications."""
+
+    @abstractmethod
+    def update(self, task_id: str, progress: Dict):
+        """Replace a task's progress and notify subscribers if it changed."""
+
+    @abstractmethod
+    def get(self, task_id: str) -> Dict:
+        """Return a task's current progress (pending if unknown)."""
+
+    @abstractmethod
+    def subscribe(self, task_id: str, heartbeat_interval: float) -> AsyncIterator[Dict | None]:
+        """
+        Yield the current progress, then each change.
+        Yields None when nothing changed for heartbeat_interval seconds.
+        """
+
+    @abstractmethod
+    def delete(self, task_id: str):
+        """Forget a task."""
+
+
+class InMemoryProgressStore(ProgressStore):
+    """Process-local store; safe to update from any thread."""
+
+    def __init__(self, ttl_seconds: float = PROGRESS_TTL_SECONDS, stale_seconds: float = PROGRESS_STALE_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self._lock = threading.Lock()
+        self._tasks: Dict[str, Dict] = {}
+        self._finished_at: Dict[str, float] = {}
+        self._updated_at: Dict[str, float] = {}
+        self._subscribers: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._last_sweep = time.monotonic()
+
+    def update(self, task_id: str, progress: Dict):
+        now = time.monotonic()
+        with self._lock:
+            self._updated_at[task_id] = now
+            if self._tasks.get(task_id) == progress:
+                return
+            self._tasks[task_id] = progress
+            if progress.get("status") in FINISHED_STATUSES:
+                self._finished_at[task_id] = now
+            else:
+                self._finished_at.pop(task_id, None)
+            subscribers = list(self._subscribers.get(task_id, ()))
+
+            if now - self._last_sweep >= SWEEP_INTERVAL:
+                self._sweep(now)
+
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, dict(progress))
+            except RuntimeError:
+                # Subscriber's loop already closed
+                continue
+
+    def _expired(self, task_id: str, now: float) -> bool:
+        finished_at = self._finished_at.get(task_id)
+        if finished_at is not None:
+            return now - finished_at >= self.ttl_seconds
+        return now - self._updated_at.get(task_id, now) >= self.stale_seconds
+
+    def _evict(self, task_id: str):
+        self._tasks.pop(task_id, None)
+        self._finished_at.pop(task_id, None)
+        self._updated_at.pop(task_id, None)
+
+    def _sweep(self, now: float):
+        """Evict finished tasks older than the TTL and stale unfinished ones (caller holds the lock)."""
+        self._last_sweep = now
+        expired = [task_id for task_id in self._tasks if self._expired(task_id, now)]
+        for task_id in expired:
+            self._evict(task_id)
+        if expired:
+            logger.debug(f"Evicted {len(expired)} expired progress entries")
+
+    def get(self, task_id: str) -> Dict:
+        with self._lock:
+            if task_id in self._tasks and self._expired(task_id, time.monotonic()):
+                self._evict(task_id)
+            progress = self._tasks.get(task_id)
+        return dict(progress) if progress is not None else pending_progress()
+
+    async def subscribe(self, task_id: str, heartbeat_interval: float) -> AsyncIterator[Dict | None]:
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        entry = (loop, queue)
+        with self._lock:
+            self._subscribers.setdefault(task_id, []).append(entry)
+
+        try:
+            yield self.get(task_id)
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), timeout=heartbeat_interval)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(task_id, [])
+                if entry in subscribers:
+                    subscribers.remove(entry)
+                if not subscribers:
+                    self._subscribers.pop(task_id, None)
+
+    def delete(self, task_id: str):
+        with self._lock:
+            self._evict(task_id)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._tasks)
+
+
+_PROGRESS_STORE: ProgressStore = InMemoryProgressStore()
+
+def get_progress_store() -> ProgressStore:
+    return _PROGRESS_STORE
+
+def set_progress_store(store: ProgressStore):
+    """Swap in another backend (e.g. a shared store for multi-worker deployments)."""
+    global _PROGRESS_STORE
+    _PROGRESS_STORE = store
@@ -0,0 +1,55 @@
+"""
+Store for the claim results of tasks run with deferred explanations.
+LLM explanations are generated later, on request, from the stored results.
+Entries expire after a TTL and the oldest tasks are evicted past a size limit.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List
+
+from services.config.settings import DEFERRED_RESULTS_TTL_SECONDS, MAX_DEFERRED_TASKS
+
+
+class TaskResultStore:
+    """Process-local, thread-safe task_id -> claim results mapping."""
+
+    def __init__(self, ttl_seconds: float = DEFERRED_RESULTS_TTL_SECONDS, max_tasks: int = MAX_DEFERRED_TASKS):
+        self.ttl_seconds = ttl_seconds
+        self.max_tasks = max_tasks
+        self._lock = threading.Lock()
+        self._tasks: OrderedDict[str, tuple[float, List[Dict]]] = OrderedDict()
+
+    def put(self, task_id: str, results: List[Dict]):
+        """Store a task's results (the list is kept by reference)."""
+        with self._lock:
+            self._tasks[task_id] = (time.monotonic(), results)
+            self._tasks.move_to_end(task_id)
+            while len(self._tasks) > self.max_tasks:
+                self._tasks.popitem(last=False)
+
+    def get(self, task_id: str) -> List[Dict] | None:
+        """Return a task's results, or None if unknown or expired."""
+        with self._lock:
+            entry = self._tasks.get(task_id)
+            if entry is None:
+                return None
+            stored_at, results = entry
+            if time.monotonic() - stored_at >= self.ttl_seconds:
+                del self._tasks[task_id]
+                return None
+            return results
+
+    def delete(self, task_id: str):
+        with self._lock:
+            self._tasks.pop(task_id, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._tasks)
+
+
+_TASK_RESULT_STORE = TaskResultStore()
+
+def get_task_result_store() -> TaskResultStore:
+    return _TASK_RESULT_STORE